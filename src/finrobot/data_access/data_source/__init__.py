@@ -17,6 +17,8 @@ Legacy aliases are maintained for backward compatibility.
 
 import importlib.util
 
+from .cassette import install_cassette_from_env
+
 # Domain exports (preferred)
 from .domains import (
     CompanyInfo,
@@ -74,6 +76,9 @@ __all__ = [
     "RedditUtils",
 ]
 
+# Offline benchmarking: FINROBOT_CASSETTE routes all HTTP through a record/replay cassette.
+install_cassette_from_env()
+
 if importlib.util.find_spec("finnlp") is not None:
     from .finnlp_utils import FinNLPUtils
 
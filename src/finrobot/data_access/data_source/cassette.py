@@ -0,0 +1,346 @@
+"""Data Source Cassette - Record/replay of HTTP traffic for offline, reproducible runs.
+
+While a cassette is installed, every HTTP request made through ``requests`` (FMP, SEC,
+Finnhub, Reddit, the earnings-call API) or ``curl_cffi`` (yfinance) is intercepted:
+
+* ``record``: the request goes to the network and the response is stored;
+* ``replay``: the stored response is returned without touching the network, optionally
+  after an injected delay, and an unknown request raises ``CassetteMiss``.
+
+Requests are keyed by method, normalized URL (sorted query, credentials such as
+``apikey``/``token``/``crumb`` removed) and a hash of the body, so cassettes contain no
+API keys. ``Set-Cookie``/``Cookie``/``Authorization`` headers are not stored, and
+session cookies are kept by name only, with their values redacted. The cassette file is gzip-compressed JSON::
+
+    with use_cassette("benchmarks/aapl.json.gz", mode="record"):
+        get_data("AAPL", "2023")
+
+    with use_cassette("benchmarks/aapl.json.gz", mode="replay", latency="recorded"):
+        get_data("AAPL", "2023")  # same results, no network
+
+A process-wide cassette can also be installed from the environment (see
+``install_cassette_from_env``): ``FINROBOT_CASSETTE=<path>``,
+``FINROBOT_CASSETTE_MODE=record|replay`` and ``FINROBOT_CASSETTE_LATENCY=<seconds>|recorded``.
+"""
+
+import atexit
+import base64
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+import typing as T
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import timedelta
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from finrobot.infrastructure.io.files import atomic_write
+from requests.structures import CaseInsensitiveDict
+
+try:
+    from curl_cffi import requests as curl_requests
+except ImportError:  # pragma: no cover - yfinance falls back to requests without curl_cffi
+    curl_requests = None  # type: ignore[assignment]
+
+CASSETTE_ENV = "FINROBOT_CASSETTE"
+CASSETTE_MODE_ENV = "FINROBOT_CASSETTE_MODE"
+CASSETTE_LATENCY_ENV = "FINROBOT_CASSETTE_LATENCY"
+RECORD = "record"
+REPLAY = "replay"
+
+# Query parameters that carry credentials or per-session tokens.
+REDACTED_PARAMS = frozenset({"apikey", "api_key", "token", "access_token", "key", "crumb", "password"})
+# Response headers that carry session credentials.
+REDACTED_HEADERS = frozenset({"set-cookie", "cookie", "authorization"})
+REDACTED_VALUE = "REDACTED"
+
+Interaction = T.Dict[str, T.Any]
+
+
+class CassetteMiss(LookupError):
+    """Raised in replay mode for a request that was never recorded."""
+
+
+@dataclass
+class CassetteStats:
+    """Counters of one cassette session."""
+
+    hits: int = 0
+    misses: int = 0
+    recorded: int = 0
+
+    def to_dict(self) -> T.Dict[str, int]:
+        return asdict(self)
+
+
+class Cassette:
+    """Recorded HTTP interactions, keyed by normalized request.
+
+    Parameters:
+        path (str | PathLike): gzip-compressed JSON file.
+        mode (str): ``"record"`` or ``"replay"``.
+        latency (float | str): replay delay in seconds, or ``"recorded"`` to sleep for the
+            originally measured response time.
+        redact (Iterable[str]): query parameters dropped from keys and stored URLs.
+    """
+
+    def __init__(
+        self,
+        path: T.Union[str, "os.PathLike[str]"],
+        mode: str = REPLAY,
+        latency: T.Union[float, str] = 0.0,
+        redact: T.Iterable[str] = REDACTED_PARAMS,
+    ) -> None:
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"Unknown cassette mode: {mode!r}")
+        self.path = os.fspath(path)
+        self.mode = mode
+        self.latency = latency
+        self.redact = frozenset(param.lower() for param in redact)
+        self.stats = CassetteStats()
+        self.interactions: T.Dict[str, T.List[Interaction]] = {}
+        self._played: T.Dict[str, int] = {}
+        self._rerecorded: T.Set[str] = set()
+        self._lock = threading.Lock()
+        if os.path.exists(self.path):
+            self.load()
+        elif mode == REPLAY:
+            raise FileNotFoundError(self.path)
+
+    def request_key(
+        self,
+        method: str,
+        url: str,
+        params: T.Any = None,
+        body: T.Any = None,
+    ) -> str:
+        """Normalized ``METHOD url [sha256 of body]`` used to look up a response."""
+        key = f"{method.upper()} {self.redact_url(url, params)}"
+        if body:
+            if isinstance(body, str):
+                body = body.encode()
+            elif not isinstance(body, bytes):
+                body = json.dumps(body, sort_keys=True, default=str).encode()
+            key += f" {hashlib.sha256(body).hexdigest()[:16]}"
+        return key
+
+    def redact_url(self, url: str, params: T.Any = None) -> str:
+        """``url`` (merged with ``params``) with sorted query and credentials removed."""
+        parts = urlsplit(url)
+        query = parse_qsl(parts.query, keep_blank_values=True)
+        if params:
+            query += list(params.items()) if isinstance(params, dict) else list(params)
+        kept = sorted((str(name), str(value)) for name, value in query if str(name).lower() not in self.redact)
+        return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, urlencode(kept), ""))
+
+    def play(self, key: str) -> Interaction:
+        """Next recorded response for ``key`` (the last one repeats once all were served)."""
+        with self._lock:
+            responses = self.interactions.get(key)
+            if not responses:
+                self.stats.misses += 1
+                raise CassetteMiss(f"No recorded response for {key} in {self.path}")
+            position = self._played.get(key, 0)
+            self._played[key] = position + 1
+            self.stats.hits += 1
+            interaction = responses[min(position, len(responses) - 1)]
+        delay = interaction.get("elapsed", 0.0) if self.latency == "recorded" else float(self.latency)
+        if delay > 0:
+            time.sleep(delay)
+        return interaction
+
+    def record(self, key: str, interaction: Interaction) -> None:
+        """Store a response; the first recording of a key in a session replaces older ones."""
+        with self._lock:
+            if key not in self._rerecorded:
+                self._rerecorded.add(key)
+                self.interactions[key] = []
+            self.interactions[key].append(interaction)
+            self.stats.recorded += 1
+
+    def load(self) -> None:
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            payload = json.load(f)
+        with self._lock:
+            self.interactions = payload.get("interactions", {})
+
+    def save(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            payload = {"version": 1, "interactions": self.interactions}
+
+        def write(tmp: str) -> None:
+            with gzip.open(tmp, "wt", encoding="utf-8") as f:
+                json.dump(payload, f, sort_keys=True)
+
+        atomic_write(self.path, write)
+
+
+_active: T.Optional[Cassette] = None
+_install_lock = threading.Lock()
+_original_send: T.Callable[..., requests.Response] = requests.Session.send
+_original_curl_request: T.Any = curl_requests.Session.request if curl_requests is not None else None
+
+
+def get_cassette() -> T.Optional[Cassette]:
+    """Return the installed cassette, if any."""
+    return _active
+
+
+def install_cassette(
+    path: T.Union[str, "os.PathLike[str]"],
+    mode: str = REPLAY,
+    latency: T.Union[float, str] = 0.0,
+) -> Cassette:
+    """Route all HTTP traffic of the process through a cassette (record mode saves at exit)."""
+    global _active, _original_send, _original_curl_request
+    cassette = Cassette(path, mode=mode, latency=latency)
+    with _install_lock:
+        if _active is not None:
+            raise RuntimeError(f"A cassette is already installed: {_active.path}")
+        _active = cassette
+        _original_send = requests.Session.send
+        if curl_requests is not None:
+            _original_curl_request = curl_requests.Session.request
+        setattr(requests.Session, "send", _send)
+        if curl_requests is not None:
+            setattr(curl_requests.Session, "request", _curl_request)
+    if mode == RECORD:
+        atexit.register(_save_at_exit, cassette)
+    return cassette
+
+
+def uninstall_cassette() -> T.Optional[Cassette]:
+    """Restore direct network access; a recording cassette is saved first."""
+    global _active
+    with _install_lock:
+        cassette, _active = _active, None
+        setattr(requests.Session, "send", _original_send)
+        if curl_requests is not None:
+            setattr(curl_requests.Session, "request", _original_curl_request)
+    if cassette is not None and cassette.mode == RECORD:
+        cassette.save()
+        atexit.unregister(_save_at_exit)
+    return cassette
+
+
+@contextmanager
+def use_cassette(
+    path: T.Union[str, "os.PathLike[str]"],
+    mode: str = REPLAY,
+    latency: T.Union[float, str] = 0.0,
+) -> T.Iterator[Cassette]:
+    """Install a cassette for the duration of the block."""
+    cassette = install_cassette(path, mode=mode, latency=latency)
+    try:
+        yield cassette
+    finally:
+        uninstall_cassette()
+
+
+def install_cassette_from_env() -> T.Optional[Cassette]:
+    """Install the cassette named by ``FINROBOT_CASSETTE`` (no-op when unset or already installed)."""
+    path = os.environ.get(CASSETTE_ENV)
+    if not path or _active is not None:
+        return _active
+    latency: T.Union[float, str] = os.environ.get(CASSETTE_LATENCY_ENV) or 0.0
+    if latency != "recorded":
+        latency = float(latency)
+    return install_cassette(path, mode=os.environ.get(CASSETTE_MODE_ENV) or REPLAY, latency=latency)
+
+
+def _save_at_exit(cassette: Cassette) -> None:
+    cassette.save()
+
+
+def _send(session: requests.Session, request: requests.PreparedRequest, **kwargs: T.Any) -> requests.Response:
+    cassette = _active
+    if cassette is None:
+        return _original_send(session, request, **kwargs)
+    key = cassette.request_key(request.method or "GET", request.url or "", body=request.body)
+    if cassette.mode == REPLAY:
+        return _to_requests_response(cassette.play(key), request)
+
+    response = _original_send(session, request, **kwargs)
+    cassette.record(
+        key,
+        {
+            "status": response.status_code,
+            "reason": response.reason,
+            "url": cassette.redact_url(response.url or request.url or ""),
+            "headers": _stored_headers(response.headers),
+            "encoding": response.encoding,
+            "body": base64.b64encode(response.content).decode("ascii"),
+            "elapsed": response.elapsed.total_seconds(),
+        },
+    )
+    return response
+
+
+def _curl_request(session: T.Any, method: str, url: str, *args: T.Any, **kwargs: T.Any) -> T.Any:
+    cassette = _active
+    if cassette is None:
+        return _original_curl_request(session, method, url, *args, **kwargs)
+    params = kwargs.get("params", args[0] if args else None)
+    body = kwargs.get("json") or kwargs.get("data") or kwargs.get("content")
+    key = cassette.request_key(method, url, params=params, body=body)
+    if cassette.mode == REPLAY:
+        interaction = cassette.play(key)
+        for name, value, domain in interaction.get("cookies", []):
+            session.cookies.set(name, value, domain=domain)
+        return _to_curl_response(interaction)
+
+    response = _original_curl_request(session, method, url, *args, **kwargs)
+    cassette.record(
+        key,
+        {
+            "status": response.status_code,
+            "reason": response.reason,
+            "url": cassette.redact_url(str(response.url)),
+            "headers": _stored_headers(response.headers),
+            "encoding": response.encoding,
+            "body": base64.b64encode(response.content).decode("ascii"),
+            "elapsed": response.elapsed.total_seconds(),
+            # yfinance only checks that its session cookie is set; the value is never stored
+            "cookies": [[cookie.name, REDACTED_VALUE, cookie.domain] for cookie in response.cookies.jar],
+        },
+    )
+    return response
+
+
+def _stored_headers(headers: T.Mapping[str, str]) -> T.Dict[str, str]:
+    return {name: value for name, value in headers.items() if name.lower() not in REDACTED_HEADERS}
+
+
+def _to_requests_response(interaction: Interaction, request: requests.PreparedRequest) -> requests.Response:
+    response = requests.Response()
+    response.status_code = interaction["status"]
+    response.reason = interaction.get("reason") or ""
+    response.url = request.url or interaction.get("url", "")
+    response.headers = CaseInsensitiveDict(interaction.get("headers") or {})
+    response.encoding = interaction.get("encoding")
+    response._content = base64.b64decode(interaction["body"])
+    response._content_consumed = True  # stream=True callers iterate over the stored body
+    response.elapsed = timedelta(seconds=interaction.get("elapsed", 0.0))
+    response.request = request
+    return response
+
+
+def _to_curl_response(interaction: Interaction) -> T.Any:
+    response = curl_requests.Response()
+    response.status_code = interaction["status"]
+    response.reason = interaction.get("reason") or ""
+    response.ok = interaction["status"] < 400
+    response.url = interaction.get("url", "")
+    response.headers = curl_requests.Headers(interaction.get("headers") or {})
+    response.content = base64.b64decode(interaction["body"])
+    response.elapsed = timedelta(seconds=interaction.get("elapsed", 0.0))
+    if interaction.get("encoding"):
+        response.default_encoding = interaction["encoding"]
+    return response
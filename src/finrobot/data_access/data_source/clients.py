@@ -0,0 +1,205 @@
+"""Data Source Clients - Lifecycle management for provider API clients.
+
+Provider clients (Finnhub, sec-api, Reddit, FMP) are built lazily, once per process
+(or once per thread for clients that are not thread-safe), and share one pooled
+``requests`` transport so HTTP keep-alive survives across tool calls.
+
+Modules keep their historical globals (``finnhub_client``, ``query_api``, ...) but bind
+them to a ``ClientHandle`` instead of rebinding a new client on every call::
+
+    finnhub_client = ClientHandle("finnhub", _build_client, credentials=("FINNHUB_API_KEY",))
+    finnhub_client.company_profile2(symbol="AAPL")  # resolved through the registry
+"""
+
+import os
+import threading
+import typing as T
+from dataclasses import asdict, dataclass
+
+import finnhub
+import praw
+import requests
+from finrobot.data_access.data_source.rate_limits import rate_limited
+from requests.adapters import HTTPAdapter
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 32
+
+
+@dataclass
+class ClientMetrics:
+    """Build/reuse counters for one named client."""
+
+    builds: int = 0
+    reuses: int = 0
+
+    def to_dict(self) -> T.Dict[str, int]:
+        return asdict(self)
+
+
+class ClientRegistry:
+    """Lazily builds and caches provider clients on top of a shared connection pool."""
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    ) -> None:
+        self.adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.metrics: T.Dict[str, ClientMetrics] = {}
+        self._session: T.Optional[requests.Session] = None
+        self._clients: T.Dict[T.Tuple[str, T.Tuple[T.Any, ...]], T.Any] = {}
+        self._building: T.Dict[T.Tuple[str, T.Tuple[T.Any, ...]], threading.Lock] = {}
+        self._local = threading.local()
+        self._lock = threading.RLock()
+
+    def session(self) -> requests.Session:
+        """Return the process-wide pooled session used for plain HTTP calls."""
+        with self._lock:
+            if self._session is None:
+                self._session = self.new_session()
+            return self._session
+
+    def new_session(self) -> requests.Session:
+        """Create a session with private headers/cookies that reuses the shared pool."""
+        return self.attach(requests.Session())
+
+    def attach(self, session: requests.Session) -> requests.Session:
+        """Route an existing session (e.g. one owned by a client library) through the shared pool."""
+        session.mount("https://", self.adapter)
+        session.mount("http://", self.adapter)
+        return session
+
+    def get(
+        self,
+        name: str,
+        factory: T.Callable[[], T.Any],
+        key: T.Tuple[T.Any, ...] = (),
+        thread_local: bool = False,
+    ) -> T.Any:
+        """Return the client ``name`` for ``key`` (usually its credentials), building it on first use.
+
+        ``factory`` runs outside the registry lock, so slow client construction only holds
+        up callers of the same client.
+        """
+        clients = self._thread_clients() if thread_local else self._clients
+        with self._lock:
+            client = self._reuse(name, key, clients)
+            if client is not None:
+                return client
+            # thread-local clients are only ever built by their own thread
+            building = threading.Lock() if thread_local else self._building.setdefault((name, key), threading.Lock())
+        with building:
+            with self._lock:
+                client = self._reuse(name, key, clients)
+                if client is not None:
+                    return client
+            client = factory()
+            with self._lock:
+                clients[(name, key)] = client
+                self.metrics.setdefault(name, ClientMetrics()).builds += 1
+            return client
+
+    def stats(self) -> T.Dict[str, T.Any]:
+        """Client reuse counters plus connection counters of the shared pool."""
+        container = self.adapter.poolmanager.pools
+        pools = [container[pool_key] for pool_key in container.keys()]
+        return {
+            "clients": {name: metrics.to_dict() for name, metrics in self.metrics.items()},
+            "connections": {
+                "pools": len(pools),
+                "opened": sum(pool.num_connections for pool in pools),
+                "requests": sum(pool.num_requests for pool in pools),
+            },
+        }
+
+    def clear(self) -> None:
+        """Drop every cached client and close the shared pool."""
+        with self._lock:
+            self._clients.clear()
+            self._building.clear()
+            self._local = threading.local()
+            self.metrics.clear()
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+            self.adapter.close()
+
+    def _reuse(
+        self, name: str, key: T.Tuple[T.Any, ...], clients: T.Dict[T.Tuple[str, T.Tuple[T.Any, ...]], T.Any]
+    ) -> T.Any:
+        """Return the cached client or ``None``; caller must hold the lock."""
+        metrics = self.metrics.setdefault(name, ClientMetrics())
+        client = clients.get((name, key))
+        if client is not None:
+            metrics.reuses += 1
+        return client
+
+    def _thread_clients(self) -> T.Dict[T.Tuple[str, T.Tuple[T.Any, ...]], T.Any]:
+        if not hasattr(self._local, "clients"):
+            self._local.clients = {}
+        return T.cast(T.Dict[T.Tuple[str, T.Tuple[T.Any, ...]], T.Any], self._local.clients)
+
+
+class ClientHandle:
+    """Module-level stand-in for a provider client, resolved through the registry on access."""
+
+    def __init__(
+        self,
+        name: str,
+        factory: T.Callable[[], T.Any],
+        credentials: T.Sequence[str] = (),
+        thread_local: bool = False,
+        rate_limit: T.Optional[str] = None,
+    ) -> None:
+        self.name = name
+        self.factory = factory
+        self.credentials = tuple(credentials)
+        self.thread_local = thread_local
+        self.rate_limit = rate_limit  # provider quota charged for every client method call
+
+    def resolve(self) -> T.Any:
+        key = tuple(os.environ.get(var) for var in self.credentials)
+        return get_client_registry().get(self.name, self.factory, key=key, thread_local=self.thread_local)
+
+    def __getattr__(self, attr: str) -> T.Any:
+        value = getattr(self.resolve(), attr)
+        if self.rate_limit is None or not callable(value):
+            return value
+        return rate_limited(self.rate_limit)(value)
+
+    def __repr__(self) -> str:
+        return f"ClientHandle({self.name!r})"
+
+
+_registry = ClientRegistry()
+
+
+def get_client_registry() -> ClientRegistry:
+    """Return the process-wide client registry."""
+    return _registry
+
+
+def http_session() -> requests.Session:
+    """Shortcut for the registry's pooled session."""
+    return _registry.session()
+
+
+def build_finnhub_client() -> T.Any:
+    """Finnhub client whose HTTP session goes through the shared pool."""
+    client = finnhub.Client(api_key=os.environ["FINNHUB_API_KEY"])
+    get_client_registry().attach(client._session)
+    print("Finnhub client initialized")
+    return client
+
+
+def build_reddit_client() -> T.Any:
+    """praw client on a private session that reuses the shared pool."""
+    client = praw.Reddit(
+        client_id=os.environ["REDDIT_CLIENT_ID"],
+        client_secret=os.environ["REDDIT_CLIENT_SECRET"],
+        user_agent="python:finrobot:v0.1 (by /u/finrobot)",
+        requestor_kwargs={"session": get_client_registry().new_session()},
+    )
+    print("Reddit client initialized")
+    return client
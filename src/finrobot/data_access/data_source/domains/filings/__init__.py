@@ -1,13 +1,34 @@
 """Filings Domain - SEC filings, annual reports."""
 
+from .cik_index import CikIndex, configure_cik_index, get_cik_index
 from .entities import SECFiling
+from .filing_store import FilingStore, FilingStoreStats, configure_filing_store, get_filing_store
 from .fmp_adapter import FMPFilingsAdapter
 from .repositories import FilingsRepository
 from .sec_adapter import SECAdapter
+from .submissions import (
+    SubmissionsCache,
+    SubmissionsCacheStats,
+    SubmissionsResponse,
+    configure_submissions_cache,
+    get_submissions_cache,
+)
 
 __all__ = [
     "SECFiling",
     "FilingsRepository",
     "SECAdapter",
     "FMPFilingsAdapter",
+    "CikIndex",
+    "configure_cik_index",
+    "get_cik_index",
+    "FilingStore",
+    "FilingStoreStats",
+    "configure_filing_store",
+    "get_filing_store",
+    "SubmissionsCache",
+    "SubmissionsCacheStats",
+    "SubmissionsResponse",
+    "configure_submissions_cache",
+    "get_submissions_cache",
 ]
@@ -0,0 +1,197 @@
+"""Filings CIK Index - In-memory ticker -> CIK map built from the SEC bulk ticker file.
+
+``get_cik_by_ticker`` used to scrape the EDGAR company search page once per lookup. The
+SEC publishes the whole mapping as one file (``company_tickers.json``, or the columnar
+``company_tickers_exchange.json``); the index loads it once, answers lookups from a dict
+and reloads it once it is older than ``max_age``.
+
+The source is a URL or a local file (tests use a fixture). Downloaded files are kept under
+``FINROBOT_SEC_CACHE_DIR`` when it is set, so a fresh process does not download it again.
+The SEC asks automated clients to identify themselves with a ``User-Agent`` naming the
+company and a contact email; pass ``user_agent`` or set ``FINROBOT_SEC_USER_AGENT``.
+"""
+
+import json
+import os
+import threading
+import time
+import typing as T
+
+import requests
+from finrobot.data_access.data_source.clients import http_session
+from finrobot.data_access.data_source.rate_limits import get_rate_scheduler
+from finrobot.infrastructure.io.files import atomic_write, dump_json
+
+from .submissions import SEC_CACHE_ENV
+
+SEC_TICKERS_URL = "https://www.sec.gov/files/company_tickers.json"
+SEC_TICKERS_ENV = "FINROBOT_SEC_TICKERS"
+SEC_USER_AGENT_ENV = "FINROBOT_SEC_USER_AGENT"
+DEFAULT_MAX_AGE = 24 * 60 * 60.0
+# Seconds before a failed download is attempted again.
+RETRY_AFTER = 5 * 60.0
+
+
+class CikIndex:
+    """Ticker -> zero-padded CIK lookups backed by the SEC bulk ticker file.
+
+    Parameters:
+        source (str | PathLike): URL or local path of the ticker file.
+        cache_dir (str | PathLike | None): where a downloaded file is kept between processes.
+        max_age (float): seconds after which the file is reloaded.
+        user_agent (str | None): ``User-Agent`` of the download, e.g. ``"Company admin@company.com"``;
+            without one the SEC may refuse it and lookups fall back to the EDGAR search page.
+    """
+
+    def __init__(
+        self,
+        source: T.Union[str, "os.PathLike[str]"] = SEC_TICKERS_URL,
+        cache_dir: T.Optional[T.Union[str, "os.PathLike[str]"]] = None,
+        max_age: float = DEFAULT_MAX_AGE,
+        user_agent: T.Optional[str] = None,
+    ) -> None:
+        self.source = os.fspath(source)
+        self.cache_dir = os.fspath(cache_dir) if cache_dir else None
+        self.max_age = max_age
+        self.user_agent = user_agent
+        self.downloads = 0
+        self._ciks: T.Dict[str, str] = {}
+        self._titles: T.Dict[str, str] = {}
+        self._loaded_at: T.Optional[float] = None
+        self._failed_at: T.Optional[float] = None
+        self._lock = threading.Lock()
+
+    def cik(self, ticker: str) -> T.Optional[str]:
+        """Zero-padded CIK of ``ticker``, or ``None`` if the SEC file does not list it."""
+        self._ensure_loaded()
+        return self._ciks.get(_normalize(ticker))
+
+    def resolve(self, tickers: T.Iterable[str]) -> T.Dict[str, T.Optional[str]]:
+        """``{ticker: cik}`` for a whole watchlist (``None`` for unknown tickers)."""
+        self._ensure_loaded()
+        ciks = self._ciks
+        return {ticker: ciks.get(_normalize(ticker)) for ticker in tickers}
+
+    def title(self, ticker: str) -> T.Optional[str]:
+        """Registrant name of ``ticker`` as listed by the SEC."""
+        self._ensure_loaded()
+        return self._titles.get(_normalize(ticker))
+
+    def refresh(self) -> int:
+        """Reload the ticker file now; return the number of tickers indexed."""
+        with self._lock:
+            self._load(force=True)
+        return len(self._ciks)
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return len(self._ciks)
+
+    def __contains__(self, ticker: object) -> bool:
+        return isinstance(ticker, str) and self.cik(ticker) is not None
+
+    # ---------------------------------------------------------------- internals
+
+    def _ensure_loaded(self) -> None:
+        now = time.time()
+        if self._loaded_at is not None and now - self._loaded_at < self.max_age:
+            return
+        if self._failed_at is not None and now - self._failed_at < RETRY_AFTER:
+            return
+        with self._lock:
+            if self._loaded_at is None or time.time() - self._loaded_at >= self.max_age:
+                self._load(force=False)
+
+    def _load(self, force: bool) -> None:
+        try:
+            payload = self._read(force)
+        except (OSError, ValueError, requests.RequestException):
+            # NOTE: lookups fall back to the EDGAR search page until the retry delay passes;
+            # a previously loaded index keeps serving meanwhile.
+            self._failed_at = time.time()
+            return
+        self._ciks, self._titles = _parse(payload)
+        self._loaded_at = time.time()
+        self._failed_at = None
+
+    def _read(self, force: bool) -> T.Any:
+        if not self.source.startswith(("http://", "https://")):
+            with open(self.source, "r", encoding="utf-8") as f:
+                return json.load(f)
+        cached = self._cached_path()
+        if not force and cached and os.path.exists(cached) and time.time() - os.path.getmtime(cached) < self.max_age:
+            with open(cached, "r", encoding="utf-8") as f:
+                return json.load(f)
+        get_rate_scheduler().acquire("sec")
+        headers = {"User-Agent": self.user_agent} if self.user_agent else None
+        response = http_session().get(self.source, headers=headers, timeout=30)
+        response.raise_for_status()
+        payload = response.json()
+        self.downloads += 1
+        if cached:
+            os.makedirs(os.path.dirname(cached), exist_ok=True)
+            atomic_write(cached, lambda tmp: dump_json(payload, tmp))
+        return payload
+
+    def _cached_path(self) -> T.Optional[str]:
+        if self.cache_dir is None:
+            return None
+        return os.path.join(self.cache_dir, os.path.basename(self.source.split("?", 1)[0]))
+
+
+def _normalize(ticker: str) -> str:
+    # the SEC file writes share classes with a dash ("BRK-B"), other sources use a dot
+    return ticker.strip().upper().replace(".", "-")
+
+
+def _parse(payload: T.Any) -> T.Tuple[T.Dict[str, str], T.Dict[str, str]]:
+    """Read both the row-per-key (``company_tickers.json``) and columnar (``*_exchange.json``) layouts."""
+    if isinstance(payload, dict) and "fields" in payload:
+        fields = payload["fields"]
+        rows = [dict(zip(fields, row)) for row in payload.get("data", [])]
+    elif isinstance(payload, dict):
+        rows = list(payload.values())
+    else:
+        rows = list(payload)
+    ciks: T.Dict[str, str] = {}
+    titles: T.Dict[str, str] = {}
+    for row in rows:
+        ticker, cik = row.get("ticker"), row.get("cik_str", row.get("cik"))
+        if not ticker or cik is None:
+            continue
+        key = _normalize(str(ticker))
+        # NOTE: the file lists a company's primary ticker first; keep the first mapping
+        ciks.setdefault(key, str(cik).zfill(10))
+        titles.setdefault(key, str(row.get("title", row.get("name", ""))))
+    return ciks, titles
+
+
+_default_index: T.Optional[CikIndex] = None
+_default_lock = threading.Lock()
+
+
+def configure_cik_index(
+    source: T.Union[str, "os.PathLike[str]"] = SEC_TICKERS_URL,
+    cache_dir: T.Optional[T.Union[str, "os.PathLike[str]"]] = None,
+    max_age: float = DEFAULT_MAX_AGE,
+    user_agent: T.Optional[str] = None,
+) -> CikIndex:
+    """Replace the process-wide CIK index, e.g. with a local fixture file."""
+    global _default_index
+    with _default_lock:
+        _default_index = CikIndex(source, cache_dir=cache_dir, max_age=max_age, user_agent=user_agent)
+    return _default_index
+
+
+def get_cik_index() -> CikIndex:
+    """Return the process-wide CIK index (source and ``User-Agent`` from ``FINROBOT_SEC_TICKERS``
+    and ``FINROBOT_SEC_USER_AGENT`` if set)."""
+    global _default_index
+    with _default_lock:
+        if _default_index is None:
+            _default_index = CikIndex(
+                os.environ.get(SEC_TICKERS_ENV) or SEC_TICKERS_URL,
+                cache_dir=os.environ.get(SEC_CACHE_ENV) or None,
+                user_agent=os.environ.get(SEC_USER_AGENT_ENV) or None,
+            )
+        return _default_index
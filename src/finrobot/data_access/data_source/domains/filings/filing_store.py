@@ -0,0 +1,250 @@
+"""Filings Store - Content-addressed, compressed on-disk store of raw EDGAR filings.
+
+Raw filings never change once accepted by EDGAR, so a downloaded document can be kept for
+good. Documents are compressed one by one (zstd when ``zstandard`` is installed, gzip
+otherwise) and stored under the SHA-256 of their content::
+
+    <root>/objects/ab/abcdef....zst
+    <root>/index.jsonl            {"cik", "accession_number", "sha256", "codec", "size", ...}
+
+Blobs are written to a temporary file and renamed into place, and index entries are
+appended with a single ``O_APPEND`` write, so several processes can fill the same store;
+racing writers of one document produce identical blobs. ``open`` decompresses a single
+document as a stream.
+
+The store is opt-in: set ``FINROBOT_SEC_CACHE_DIR`` (documents go to its ``filings``
+subdirectory) or call ``configure_filing_store``.
+"""
+
+import gzip
+import hashlib
+import io
+import json
+import os
+import re
+import threading
+import time
+import typing as T
+from dataclasses import asdict, dataclass
+from urllib.parse import urlsplit
+
+from finrobot.infrastructure.io.files import atomic_write
+
+from .submissions import SEC_CACHE_ENV
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - gzip is always available
+    zstandard = None
+
+GZIP = "gzip"
+ZSTD = "zstd"
+EXTENSIONS = {GZIP: ".gz", ZSTD: ".zst"}
+INDEX_FILE = "index.jsonl"
+# https://www.sec.gov/Archives/edgar/data/<cik>/<accession number without dashes>/<accession number>.txt
+ARCHIVE_URL_RE = re.compile(r"/edgar/data/(\d+)/(\d{18})/(\d{10}-\d{2}-\d{6})\.txt$")
+
+
+@dataclass
+class FilingStoreStats:
+    """Counters describing how filing requests were served."""
+
+    hits: int = 0
+    misses: int = 0
+    stored: int = 0
+    bytes_in: int = 0  # uncompressed bytes stored
+    bytes_out: int = 0  # compressed bytes written
+
+    def to_dict(self) -> T.Dict[str, int]:
+        return asdict(self)
+
+
+class FilingStore:
+    """Raw filings keyed by (CIK, accession number).
+
+    Parameters:
+        root (str | PathLike): store directory.
+        codec (str | None): ``"zstd"`` or ``"gzip"``; zstd when available by default.
+        level (int | None): compression level (codec default when ``None``).
+    """
+
+    def __init__(
+        self,
+        root: T.Union[str, "os.PathLike[str]"],
+        codec: T.Optional[str] = None,
+        level: T.Optional[int] = None,
+    ) -> None:
+        if codec is None:
+            codec = ZSTD if zstandard is not None else GZIP
+        if codec not in EXTENSIONS:
+            raise ValueError(f"Unknown codec: {codec!r}")
+        if codec == ZSTD and zstandard is None:
+            raise ImportError("zstd compression requires the 'zstandard' package")
+        self.root = os.fspath(root)
+        self.codec = codec
+        self.level = level
+        self.stats = FilingStoreStats()
+        self._index: T.Dict[T.Tuple[str, str], T.Dict[str, T.Any]] = {}
+        self._index_offset = 0
+        self._lock = threading.Lock()
+
+    def get(self, cik: T.Union[str, int], accession_number: T.Union[str, int]) -> T.Optional[str]:
+        """The stored document, or ``None`` if it was never stored."""
+        stream = self.open(cik, accession_number)
+        if stream is None:
+            self._count(misses=1)
+            return None
+        with stream:
+            self._count(hits=1)
+            return stream.read()
+
+    def open(self, cik: T.Union[str, int], accession_number: T.Union[str, int]) -> T.Optional[T.TextIO]:
+        """Text stream over one stored document, decompressed incrementally."""
+        entry = self.entry(cik, accession_number)
+        if entry is None:
+            return None
+        path = self._object_path(entry["sha256"], entry["codec"])
+        if not os.path.exists(path):
+            return None
+        if entry["codec"] == GZIP:
+            return T.cast(T.TextIO, gzip.open(path, "rt", encoding="utf-8", newline=""))
+        if zstandard is None:
+            raise ImportError("reading zstd-compressed filings requires the 'zstandard' package")
+        raw = zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True)
+        return io.TextIOWrapper(T.cast(T.BinaryIO, raw), encoding="utf-8", newline="")
+
+    def put(self, cik: T.Union[str, int], accession_number: T.Union[str, int], text: str) -> str:
+        """Store a document; return its SHA-256. Storing identical content again is a no-op."""
+        key = _key(cik, accession_number)
+        data = text.encode("utf-8")
+        sha256 = hashlib.sha256(data).hexdigest()
+        existing = self.entry(*key)
+        if existing is not None and existing["sha256"] == sha256:
+            return sha256
+
+        path = self._object_path(sha256, self.codec)
+        compressed_size = os.path.getsize(path) if os.path.exists(path) else self._write_object(path, data)
+        entry = {
+            "cik": key[0],
+            "accession_number": key[1],
+            "sha256": sha256,
+            "codec": self.codec,
+            "size": len(data),
+            "compressed_size": compressed_size,
+            "stored_at": time.time(),
+        }
+        self._append(entry)
+        self._count(stored=1, bytes_in=len(data), bytes_out=compressed_size)
+        return sha256
+
+    def entry(self, cik: T.Union[str, int], accession_number: T.Union[str, int]) -> T.Optional[T.Dict[str, T.Any]]:
+        """Index entry of a document (picks up entries appended by other processes)."""
+        self._refresh()
+        with self._lock:
+            return self._index.get(_key(cik, accession_number))
+
+    def entries(self) -> T.List[T.Dict[str, T.Any]]:
+        self._refresh()
+        with self._lock:
+            return list(self._index.values())
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, tuple) and len(key) == 2 and self.entry(*key) is not None
+
+    def __len__(self) -> int:
+        return len(self.entries())
+
+    # ---------------------------------------------------------------- internals
+
+    def _object_path(self, sha256: str, codec: str) -> str:
+        return os.path.join(self.root, "objects", sha256[:2], f"{sha256}{EXTENSIONS[codec]}")
+
+    def _write_object(self, path: str, data: bytes) -> int:
+        if self.codec == ZSTD:
+            compressor = zstandard.ZstdCompressor(level=self.level if self.level is not None else 10)
+            blob = compressor.compress(data)
+        else:
+            blob = gzip.compress(data, compresslevel=self.level if self.level is not None else 6, mtime=0)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        def write(tmp: str) -> None:
+            with open(tmp, "wb") as f:
+                f.write(blob)
+
+        atomic_write(path, write)
+        return len(blob)
+
+    def _append(self, entry: T.Dict[str, T.Any]) -> None:
+        os.makedirs(self.root, exist_ok=True)
+        line = (json.dumps(entry, sort_keys=True) + "\n").encode("utf-8")
+        # NOTE: one write on an O_APPEND descriptor keeps concurrent appenders from interleaving.
+        fd = os.open(os.path.join(self.root, INDEX_FILE), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
+        with self._lock:
+            self._index[(entry["cik"], entry["accession_number"])] = entry
+
+    def _refresh(self) -> None:
+        """Read index lines appended since the last call (later entries win)."""
+        path = os.path.join(self.root, INDEX_FILE)
+        with self._lock:
+            if not os.path.exists(path) or os.path.getsize(path) <= self._index_offset:
+                return
+            with open(path, "rb") as f:
+                f.seek(self._index_offset)
+                chunk = f.read()
+            complete = chunk[: chunk.rfind(b"\n") + 1]  # a line still being written is read next time
+            self._index_offset += len(complete)
+            for line in complete.splitlines():
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                self._index[(entry["cik"], entry["accession_number"])] = entry
+
+    def _count(self, **deltas: int) -> None:
+        with self._lock:
+            for name, delta in deltas.items():
+                setattr(self.stats, name, getattr(self.stats, name) + delta)
+
+
+def parse_archive_url(url: str) -> T.Optional[T.Tuple[str, str]]:
+    """(CIK, accession number) of the full ``{accession number}.txt`` submission of a filing.
+
+    The store holds only that document per accession number, so any other archive URL (a
+    primary document such as ``aapl-20230930.htm``, an exhibit, an index page) is ``None``.
+    """
+    match = ARCHIVE_URL_RE.search(urlsplit(url).path)
+    if match is None or match.group(3).replace("-", "") != match.group(2):
+        return None
+    return _key(match.group(1), match.group(2))
+
+
+def _key(cik: T.Union[str, int], accession_number: T.Union[str, int]) -> T.Tuple[str, str]:
+    return str(int(str(cik))), str(accession_number).replace("-", "").zfill(18)
+
+
+_default_store: T.Optional[FilingStore] = None
+_configured = False
+_default_lock = threading.Lock()
+
+
+def configure_filing_store(
+    root: T.Optional[T.Union[str, "os.PathLike[str]"]], codec: T.Optional[str] = None
+) -> T.Optional[FilingStore]:
+    """Enable the process-wide filing store at ``root``, or disable it with ``None``."""
+    global _default_store, _configured
+    with _default_lock:
+        _default_store = FilingStore(root, codec=codec) if root else None
+        _configured = True
+    return _default_store
+
+
+def get_filing_store() -> T.Optional[FilingStore]:
+    """Return the process-wide filing store, created under ``FINROBOT_SEC_CACHE_DIR`` if set."""
+    global _default_store
+    with _default_lock:
+        if _default_store is None and not _configured and os.environ.get(SEC_CACHE_ENV):
+            _default_store = FilingStore(os.path.join(os.environ[SEC_CACHE_ENV], "filings"))
+        return _default_store
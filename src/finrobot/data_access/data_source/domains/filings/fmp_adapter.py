@@ -4,7 +4,9 @@ import os
 import typing as T
 from functools import wraps
 
-import requests
+from finrobot.data_access.data_source.clients import http_session
+from finrobot.data_access.data_source.rate_limits import get_rate_scheduler
+from finrobot.infrastructure.cache import single_flight
 from finrobot.infrastructure.utils import decorate_all_methods
 
 fmp_api_key: str = ""
@@ -27,6 +29,7 @@ def init_fmp_api(
     return wrapper
 
 
+@decorate_all_methods(single_flight("fmp"))
 @decorate_all_methods(init_fmp_api)
 class FMPFilingsAdapter:
     """FMP implementation for SEC filings data."""
@@ -41,7 +44,8 @@ class FMPFilingsAdapter:
         url = f"https://financialmodelingprep.com/api/v3/sec_filings/{ticker_symbol}?type=10-k&page=0&apikey={fmp_api_key}"
 
         filing_url = None
-        response = requests.get(url)
+        get_rate_scheduler().acquire("fmp")
+        response = http_session().get(url)
 
         if response.status_code == 200:
             data = response.json()
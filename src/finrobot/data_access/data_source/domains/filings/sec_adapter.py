@@ -5,8 +5,9 @@ import typing as T
 from functools import wraps
 from typing import Annotated, Any, Dict, List, Optional, Union
 
-import requests
+from finrobot.data_access.data_source.clients import ClientHandle, http_session
 from finrobot.data_access.data_source.fmp_utils import FMPUtils
+from finrobot.infrastructure.cache import single_flight
 from finrobot.infrastructure.io.files import SavePathType
 from finrobot.infrastructure.utils import decorate_all_methods
 from sec_api import ExtractorApi, QueryApi, RenderApi
@@ -14,28 +15,31 @@ from sec_api import ExtractorApi, QueryApi, RenderApi
 CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
 PDF_GENERATOR_API = "https://api.sec-api.io/filing-reader"
 
-extractor_api: T.Any = None
-query_api: T.Any = None
-render_api: T.Any = None
+# NOTE: sec-api clients are stateless wrappers around the library's own requests calls,
+# so they are shared process-wide; only their construction is saved here.
+extractor_api: T.Any = ClientHandle(
+    "sec_api.extractor", lambda: ExtractorApi(os.environ["SEC_API_KEY"]), credentials=("SEC_API_KEY",)
+)
+query_api: T.Any = ClientHandle(
+    "sec_api.query", lambda: QueryApi(os.environ["SEC_API_KEY"]), credentials=("SEC_API_KEY",)
+)
+render_api: T.Any = ClientHandle(
+    "sec_api.render", lambda: RenderApi(os.environ["SEC_API_KEY"]), credentials=("SEC_API_KEY",)
+)
 
 
 def init_sec_api(func: T.Callable[..., T.Any]) -> T.Callable[..., T.Any]:
     @wraps(func)
     def wrapper(*args: T.Any, **kwargs: T.Any) -> T.Any:
-        global extractor_api, query_api, render_api
         if os.environ.get("SEC_API_KEY") is None:
             print("Please set the environment variable SEC_API_KEY to use sec_api.")
             return None
-        else:
-            extractor_api = ExtractorApi(os.environ["SEC_API_KEY"])
-            query_api = QueryApi(os.environ["SEC_API_KEY"])
-            render_api = RenderApi(os.environ["SEC_API_KEY"])
-            print("Sec Api initialized")
-            return func(*args, **kwargs)
+        return func(*args, **kwargs)
 
     return wrapper
 
 
+@decorate_all_methods(single_flight("sec_api", unless=("save_path", "save_folder")))
 @decorate_all_methods(init_sec_api)
 class SECAdapter:
     """SEC API implementation of FilingsRepository."""
@@ -111,7 +115,7 @@ class SECAdapter:
                     os.makedirs(save_folder)
 
                 api_url = f"{PDF_GENERATOR_API}?token={os.environ['SEC_API_KEY']}&type=pdf&url={filing_url}"
-                response = requests.get(api_url, stream=True)
+                response = http_session().get(api_url, stream=True)
                 response.raise_for_status()
 
                 file_path = os.path.join(save_folder, file_name)
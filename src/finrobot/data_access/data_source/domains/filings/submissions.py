@@ -0,0 +1,258 @@
+"""Filings Submissions Cache - Conditional-GET cache of EDGAR ``submissions/CIK*.json``.
+
+The submissions document of a large filer is several megabytes and changes only when the
+company files something. The cache keeps the last document together with its ``ETag`` /
+``Last-Modified`` validators and revalidates with ``If-None-Match`` / ``If-Modified-Since``,
+so an unchanged document costs a bodyless ``304`` instead of a full download.
+
+``filings.recent`` only lists the latest ~1000 filings; older ones are paginated into the
+``filings.files`` pages (``CIK##########-submissions-001.json``, ...). Those pages never
+change once published, so each is downloaded once and merged into ``filings.recent`` of the
+returned document. If a page cannot be downloaded, the document is returned with
+``filings.recent`` alone and the failure is counted.
+
+Documents are kept in memory; set ``FINROBOT_SEC_CACHE_DIR`` or call
+``configure_submissions_cache`` to also persist them across processes.
+"""
+
+import json
+import os
+import threading
+import time
+import typing as T
+from dataclasses import asdict, dataclass
+
+import requests
+from finrobot.data_access.data_source.clients import http_session
+from finrobot.data_access.data_source.rate_limits import get_rate_scheduler
+from finrobot.infrastructure.io.files import atomic_write, dump_json
+
+SEC_SUBMISSIONS_URL = "https://data.sec.gov/submissions"
+SEC_CACHE_ENV = "FINROBOT_SEC_CACHE_DIR"
+# Seconds during which a cached document is served without revalidating it.
+DEFAULT_MAX_AGE = 60.0
+
+Document = T.Dict[str, T.Any]
+
+
+@dataclass
+class SubmissionsCacheStats:
+    """Counters describing how submissions requests were served."""
+
+    fresh: int = 0  # served without any request (younger than ``max_age``)
+    not_modified: int = 0  # revalidated with a 304
+    downloaded: int = 0  # full 200 response
+    stale: int = 0  # request failed, cached document served instead
+    history_pages: int = 0  # ``filings.files`` pages downloaded
+    history_failed: int = 0  # page download failed, ``filings.recent`` served alone
+
+    def to_dict(self) -> T.Dict[str, int]:
+        return asdict(self)
+
+
+@dataclass
+class SubmissionsResponse:
+    """Outcome of ``SubmissionsCache.fetch``; ``data`` is ``None`` when nothing could be served."""
+
+    status_code: int
+    data: T.Optional[Document]
+
+    @property
+    def ok(self) -> bool:
+        return self.data is not None
+
+
+class SubmissionsCache:
+    """Revalidating cache of EDGAR submissions documents and their history pages.
+
+    Parameters:
+        root (str | PathLike | None): directory persisting documents across processes.
+        max_age (float): seconds a document is reused before it is revalidated.
+        base_url (str): submissions endpoint.
+    """
+
+    def __init__(
+        self,
+        root: T.Optional[T.Union[str, "os.PathLike[str]"]] = None,
+        max_age: float = DEFAULT_MAX_AGE,
+        base_url: str = SEC_SUBMISSIONS_URL,
+    ) -> None:
+        self.root = os.fspath(root) if root else None
+        self.max_age = max_age
+        self.base_url = base_url
+        self.stats = SubmissionsCacheStats()
+        # CIK########## -> {"etag", "last_modified", "checked", "data"}
+        self._documents: T.Dict[str, T.Dict[str, T.Any]] = {}
+        # history page name -> columns
+        self._pages: T.Dict[str, Document] = {}
+        self._lock = threading.Lock()
+
+    def fetch(
+        self,
+        cik: T.Union[str, int],
+        headers: T.Optional[T.Dict[str, str]] = None,
+        since: T.Optional[str] = None,
+    ) -> SubmissionsResponse:
+        """Return the submissions document of ``cik`` with its history merged into ``filings.recent``.
+
+        Parameters:
+            cik (str | int): company CIK, zero-padded to ten digits if needed.
+            headers (dict | None): request headers (SEC requires a ``User-Agent``).
+            since (str | None): "yyyy-mm-dd"; only history pages holding filings on or after
+                this date are merged. ``None`` merges the whole history.
+
+        Returns:
+            SubmissionsResponse: the HTTP status of the last request and the document.
+        """
+        name = f"CIK{str(cik).zfill(10)}"
+        status_code, entry = self._revalidate(name, headers or {})
+        if entry is None:
+            return SubmissionsResponse(status_code, None)
+        return SubmissionsResponse(status_code, self._with_history(entry["data"], headers or {}, since))
+
+    def clear(self) -> None:
+        """Forget the in-memory documents and counters (files under ``root`` are kept)."""
+        with self._lock:
+            self._documents.clear()
+            self._pages.clear()
+            self.stats = SubmissionsCacheStats()
+
+    # ---------------------------------------------------------------- internals
+
+    def _revalidate(self, name: str, headers: T.Dict[str, str]) -> T.Tuple[int, T.Optional[T.Dict[str, T.Any]]]:
+        entry = self._entry(name)
+        if entry is not None and time.time() - entry["checked"] < self.max_age:
+            self._count(fresh=1)
+            return 200, entry
+
+        conditional = dict(headers)
+        if entry is not None:
+            if entry.get("etag"):
+                conditional["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                conditional["If-Modified-Since"] = entry["last_modified"]
+        get_rate_scheduler().acquire("sec")
+        response = http_session().get(f"{self.base_url}/{name}.json", headers=conditional)
+
+        if response.status_code == 304 and entry is not None:
+            self._count(not_modified=1)
+            entry = {**entry, "checked": time.time()}
+        elif response.status_code == 200:
+            self._count(downloaded=1)
+            entry = {
+                "etag": _header(response, "ETag"),
+                "last_modified": _header(response, "Last-Modified"),
+                "checked": time.time(),
+                "data": response.json(),
+            }
+        elif entry is not None:
+            # NOTE: an outdated document beats none; the next call revalidates again.
+            self._count(stale=1)
+            return response.status_code, entry
+        else:
+            return response.status_code, None
+        self._store(name, entry)
+        return 200, entry
+
+    def _with_history(self, data: Document, headers: T.Dict[str, str], since: T.Optional[str]) -> Document:
+        filings = data.get("filings", {})
+        pages = [
+            page["name"]
+            for page in filings.get("files", [])
+            if page.get("name") and (since is None or str(page.get("filingTo", "9999")) >= since)
+        ]
+        if not pages:
+            return data
+        history = [self._page(page, headers) for page in pages]
+        if any(columns is None for columns in history):
+            return data
+        recent = filings.get("recent", {})
+        merged = {column: list(values) for column, values in recent.items()}
+        for columns in T.cast(T.List[Document], history):
+            for column, values in merged.items():
+                values.extend(columns.get(column, [None] * len(columns.get("accessionNumber", []))))
+        return {**data, "filings": {**filings, "recent": merged}}
+
+    def _page(self, name: str, headers: T.Dict[str, str]) -> T.Optional[Document]:
+        with self._lock:
+            columns = self._pages.get(name)
+        if columns is None:
+            columns = self._read(name)
+        if columns is None:
+            get_rate_scheduler().acquire("sec")
+            try:
+                response = http_session().get(f"{self.base_url}/{name}", headers=headers)
+                response.raise_for_status()
+                columns = response.json()
+            except (requests.RequestException, ValueError):
+                # NOTE: failures are not remembered; the next call requests the page again.
+                self._count(history_failed=1)
+                return None
+            self._count(history_pages=1)
+            self._write(name, columns)
+        with self._lock:
+            self._pages[name] = columns
+        return columns
+
+    def _entry(self, name: str) -> T.Optional[T.Dict[str, T.Any]]:
+        with self._lock:
+            entry = self._documents.get(name)
+        if entry is None:
+            entry = self._read(f"{name}.json")
+            if entry is not None:
+                with self._lock:
+                    self._documents[name] = entry
+        return entry
+
+    def _store(self, name: str, entry: T.Dict[str, T.Any]) -> None:
+        with self._lock:
+            self._documents[name] = entry
+        self._write(f"{name}.json", entry)
+
+    def _count(self, **deltas: int) -> None:
+        with self._lock:
+            for field, delta in deltas.items():
+                setattr(self.stats, field, getattr(self.stats, field) + delta)
+
+    def _read(self, filename: str) -> T.Optional[T.Any]:
+        if self.root is None:
+            return None
+        path = os.path.join(self.root, filename)
+        if not os.path.exists(path):
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _write(self, filename: str, payload: T.Any) -> None:
+        if self.root is None:
+            return
+        os.makedirs(self.root, exist_ok=True)
+        atomic_write(os.path.join(self.root, filename), lambda tmp: dump_json(payload, tmp))
+
+
+def _header(response: requests.Response, name: str) -> T.Optional[str]:
+    value = (getattr(response, "headers", None) or {}).get(name)
+    return value if isinstance(value, str) else None
+
+
+_default_cache: T.Optional[SubmissionsCache] = None
+_default_lock = threading.Lock()
+
+
+def configure_submissions_cache(
+    root: T.Optional[T.Union[str, "os.PathLike[str]"]], max_age: float = DEFAULT_MAX_AGE
+) -> SubmissionsCache:
+    """Replace the process-wide submissions cache; ``root=None`` keeps documents in memory only."""
+    global _default_cache
+    with _default_lock:
+        _default_cache = SubmissionsCache(root, max_age=max_age)
+    return _default_cache
+
+
+def get_submissions_cache() -> SubmissionsCache:
+    """Return the process-wide submissions cache, persisted under ``FINROBOT_SEC_CACHE_DIR`` if set."""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = SubmissionsCache(os.environ.get(SEC_CACHE_ENV) or None)
+        return _default_cache
@@ -1,8 +1,14 @@
 """Market Data Domain - Stock prices, company info, financial statements."""
 
+from .basic_financials import BasicFinancials, BasicFinancialsCache, get_basic_financials_cache
+from .bulk import get_stock_data_bulk
+from .cached_repository import CachedMarketDataRepository, Lookup, MarketDataProvider, TierStats, YFinanceProvider
 from .entities import CompanyInfo, FinancialStatement, MarketData
 from .finnhub_adapter import FinnHubMarketAdapter
+from .price_cache import PriceCache, PriceCacheStats, configure_price_cache, get_price_cache
 from .repositories import MarketDataRepository
+from .statement_store import StatementStore
+from .ticker_registry import CachedTicker, TickerRegistry, get_ticker_registry
 from .yfinance_adapter import YFinanceAdapter
 
 __all__ = [
@@ -12,4 +18,21 @@ __all__ = [
     "MarketDataRepository",
     "YFinanceAdapter",
     "FinnHubMarketAdapter",
+    "PriceCache",
+    "PriceCacheStats",
+    "configure_price_cache",
+    "get_price_cache",
+    "TickerRegistry",
+    "CachedTicker",
+    "get_ticker_registry",
+    "get_stock_data_bulk",
+    "BasicFinancials",
+    "BasicFinancialsCache",
+    "get_basic_financials_cache",
+    "CachedMarketDataRepository",
+    "MarketDataProvider",
+    "YFinanceProvider",
+    "Lookup",
+    "TierStats",
+    "StatementStore",
 ]
@@ -0,0 +1,100 @@
+"""Market Data Basic Financials - Memoized Finnhub basic-financials payloads.
+
+``company_basic_financials(symbol, "all")`` returns a large payload: a ``metric`` dict of
+latest values and a ``series`` block of ``{freq: {metric: [{"period", "v"}, ...]}}``.
+The payload is cached per symbol, and each frequency of the series block is converted
+once into a tidy Series indexed by (period, metric) so history queries are slices.
+"""
+
+import os
+import typing as T
+
+import pandas as pd
+from finrobot.infrastructure.cache import TTLCache
+
+BASIC_FINANCIALS_TTL_ENV = "FINROBOT_BASIC_FINANCIALS_TTL"
+DEFAULT_BASIC_FINANCIALS_TTL = 6 * 60 * 60.0
+
+
+class BasicFinancials:
+    """Parsed basic-financials payload for one symbol."""
+
+    def __init__(self, payload: T.Dict[str, T.Any]) -> None:
+        self.payload = payload
+        self.series: T.Dict[str, pd.Series] = {}
+        self._metric_order: T.Dict[str, T.List[str]] = {}
+        self._latest_quarterly: T.Dict[str, T.Any] = {}
+        for freq, metrics in (payload.get("series") or {}).items():
+            self.series[freq] = _tidy(metrics)
+            self._metric_order[freq] = list(metrics)
+        for metric, values in ((payload.get("series") or {}).get("quarterly") or {}).items():
+            if values:
+                self._latest_quarterly[metric] = values[0]["v"]
+
+    @property
+    def empty(self) -> bool:
+        return not self.payload.get("series")
+
+    def history(
+        self,
+        freq: str,
+        start_date: str,
+        end_date: str,
+        selected_columns: T.Optional[T.List[str]] = None,
+    ) -> pd.DataFrame:
+        """Wide frame of ``freq`` values with ``start_date <= period <= end_date``, newest first."""
+        tidy = self.series[freq]
+        window = tidy.loc[start_date:end_date]
+        if selected_columns:
+            window = window[window.index.get_level_values("metric").isin(selected_columns)]
+        wide = window.unstack("metric")
+        columns = [metric for metric in self._metric_order[freq] if metric in wide.columns]
+        return wide.reindex(columns=columns).sort_index(ascending=False).rename_axis(index="date", columns=None)
+
+    def latest(self, selected_columns: T.Optional[T.List[str]] = None) -> T.Dict[str, T.Any]:
+        """Latest ``metric`` values overlaid with the most recent quarterly series values."""
+        output = dict(self.payload.get("metric") or {})
+        output.update(self._latest_quarterly)
+        if selected_columns:
+            output = {key: value for key, value in output.items() if key in selected_columns}
+        return output
+
+
+class BasicFinancialsCache:
+    """Per-symbol TTL cache of parsed basic-financials payloads."""
+
+    def __init__(self, ttl: T.Optional[float] = None) -> None:
+        if ttl is None:
+            ttl = float(os.environ.get(BASIC_FINANCIALS_TTL_ENV) or DEFAULT_BASIC_FINANCIALS_TTL)
+        self.entries: TTLCache[str, BasicFinancials] = TTLCache(ttl=ttl)
+
+    def get(self, symbol: str, fetch: T.Callable[[str], T.Dict[str, T.Any]]) -> BasicFinancials:
+        """Return the parsed payload for ``symbol``, calling ``fetch(symbol)`` on a miss."""
+        return T.cast(
+            BasicFinancials,
+            self.entries.get_or_set(symbol.upper(), lambda: BasicFinancials(fetch(symbol))),
+        )
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+
+_cache = BasicFinancialsCache()
+
+
+def get_basic_financials_cache() -> BasicFinancialsCache:
+    """Return the process-wide basic-financials cache."""
+    return _cache
+
+
+def _tidy(metrics: T.Dict[str, T.List[T.Dict[str, T.Any]]]) -> pd.Series:
+    periods, names, values = [], [], []
+    for metric, points in metrics.items():
+        for point in points:
+            periods.append(point["period"])
+            names.append(metric)
+            values.append(point["v"])
+    index = pd.MultiIndex.from_arrays([periods, names], names=["period", "metric"])
+    tidy = pd.Series(values, index=index, dtype="float64")
+    tidy = tidy[~tidy.index.duplicated(keep="last")]
+    return tidy.sort_index()
@@ -0,0 +1,114 @@
+"""Market Data Bulk - Universe-scale price downloads with batched multi-ticker requests.
+
+``YFinanceAdapter.get_stock_data`` costs one ``Ticker.history`` round trip per symbol.
+``get_stock_data_bulk`` instead splits the universe into chunks, downloads each chunk
+with a single ``yf.download`` call, runs the chunks in parallel and, when the price
+cache is enabled, serves covered symbols from disk and stores every new download.
+"""
+
+import typing as T
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import yfinance as yf
+
+from .price_cache import get_price_cache
+from .ticker_registry import get_ticker_registry
+
+DEFAULT_CHUNK_SIZE = 50
+DEFAULT_MAX_WORKERS = 4
+
+LONG = "long"
+DICT = "dict"
+
+
+def get_stock_data_bulk(
+    symbols: T.Sequence[str],
+    start_date: str,
+    end_date: str,
+    output: str = LONG,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> T.Union[pd.DataFrame, T.Dict[str, pd.DataFrame]]:
+    """Retrieve daily OHLCV data for many symbols over ``[start_date, end_date)``.
+
+    Parameters:
+        symbols (Sequence[str]): ticker symbols; duplicates are fetched once.
+        start_date (str): first day, 'yyyy-mm-dd'.
+        end_date (str): day after the last day, 'yyyy-mm-dd'.
+        output (str): "long" for one frame indexed by (Symbol, Date), "dict" for one frame per symbol.
+        chunk_size (int): symbols per multi-ticker request.
+        max_workers (int): chunks downloaded in parallel.
+
+    Returns:
+        DataFrame | Dict[str, DataFrame]: prices in the requested layout. Symbols without
+        data are omitted.
+    """
+    if output not in (LONG, DICT):
+        raise ValueError(f"output must be '{LONG}' or '{DICT}', got '{output}'")
+
+    symbols = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+    cache = get_price_cache()
+    cached = {symbol for symbol in symbols if cache is not None and cache.covers(symbol, start_date, end_date)}
+    missing = [symbol for symbol in symbols if symbol not in cached]
+
+    downloaded: T.Dict[str, pd.DataFrame] = {}
+    chunks = [missing[i : i + chunk_size] for i in range(0, len(missing), chunk_size)]
+    if chunks:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+            for chunk_frames in executor.map(lambda chunk: _download_chunk(chunk, start_date, end_date), chunks):
+                downloaded.update(chunk_frames)
+
+    frames: T.Dict[str, pd.DataFrame] = {}
+    for symbol in symbols:
+        if symbol in downloaded:
+            frame = downloaded[symbol]
+            if cache is not None:
+                cache.put(symbol, frame, start_date, end_date)
+        elif cache is not None and symbol in cached:
+            frame = cache.get(symbol, start_date, end_date, _history_fetcher(symbol))
+        else:
+            continue
+        if not frame.empty:
+            frames[symbol] = frame
+
+    if output == DICT:
+        return frames
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, names=["Symbol", "Date"])
+
+
+def _download_chunk(chunk: T.List[str], start_date: str, end_date: str) -> T.Dict[str, pd.DataFrame]:
+    """Download one chunk with a single request and split it per symbol."""
+    data = yf.download(
+        chunk,
+        start=start_date,
+        end=end_date,
+        actions=True,  # same columns as Ticker.history
+        group_by="ticker",
+        threads=False,  # parallelism is across chunks
+        progress=False,
+    )
+    if data is None or data.empty:
+        return {}
+
+    frames = {}
+    for symbol in chunk:
+        if isinstance(data.columns, pd.MultiIndex):
+            if symbol not in data.columns.get_level_values(0):
+                continue
+            frame = data[symbol]
+        elif len(chunk) == 1:
+            frame = data
+        else:
+            continue
+        frame = frame.dropna(how="all").rename_axis(columns=None)
+        if not frame.empty:
+            frames[symbol] = frame
+    return frames
+
+
+def _history_fetcher(symbol: str) -> T.Callable[[str, str], pd.DataFrame]:
+    # Only used if the partition changed between the coverage check and the read.
+    return lambda start, end: get_ticker_registry().ticker(symbol).history(start=start, end=end)
@@ -0,0 +1,377 @@
+"""Market Data Cached Repository - Tiered MarketDataRepository implementation.
+
+Lookups go through three tiers and stop at the first one that can answer:
+
+1. memory: an LRU of entities capped by their approximate size in bytes;
+2. disk: Parquet files under ``cache_dir`` (prices via ``PriceCache`` with gap filling,
+   statements and company profiles with a freshness TTL);
+3. network: the configured providers, tried in order until one returns data.
+
+Every lookup is recorded as a ``Lookup`` naming the tier that served it. Callers get
+copies of the cached entities, so mutating a returned frame leaves the memory tier intact.
+"""
+
+import copy
+import dataclasses
+import json
+import os
+import sys
+import threading
+import time
+import typing as T
+from collections import OrderedDict, deque
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+
+import pandas as pd
+from finrobot.infrastructure.io.files import atomic_write, dump_json
+
+from .entities import CompanyInfo, FinancialStatement, MarketData
+from .price_cache import PriceCache, reaches_today
+from .repositories import MarketDataRepository
+from .statement_store import StatementStore
+from .ticker_registry import get_ticker_registry
+
+MEMORY = "memory"
+DISK = "disk"
+NETWORK = "network"
+TIERS = (MEMORY, DISK, NETWORK)
+
+DEFAULT_MEMORY_BYTES = 256 * 1024 * 1024
+DEFAULT_DISK_TTL = 24 * 60 * 60.0
+
+# statement_type -> yfinance Ticker attribute
+STATEMENT_FIELDS = {
+    "income": "financials",
+    "balance_sheet": "balance_sheet",
+    "cash_flow": "cashflow",
+}
+
+
+class MarketDataProvider(T.Protocol):
+    """Network source plugged behind the cache tiers."""
+
+    name: str
+
+    def fetch_stock_data(self, symbol: str, start_date: str, end_date: str) -> pd.DataFrame: ...
+
+    def fetch_company_info(self, symbol: str) -> CompanyInfo: ...
+
+    def fetch_statement(self, symbol: str, statement_type: str) -> pd.DataFrame: ...
+
+
+class YFinanceProvider:
+    """Default provider backed by the shared ``yf.Ticker`` registry."""
+
+    name = "yfinance"
+
+    def fetch_stock_data(self, symbol: str, start_date: str, end_date: str) -> pd.DataFrame:
+        return T.cast(pd.DataFrame, get_ticker_registry().ticker(symbol).history(start=start_date, end=end_date))
+
+    def fetch_company_info(self, symbol: str) -> CompanyInfo:
+        info = get_ticker_registry().field(symbol, "info") or {}
+        return CompanyInfo(
+            symbol=symbol,
+            name=info.get("shortName", "N/A"),
+            industry=info.get("industry", "N/A"),
+            sector=info.get("sector", "N/A"),
+            country=info.get("country", "N/A"),
+            website=info.get("website"),
+            description=info.get("longBusinessSummary"),
+            market_cap=info.get("marketCap"),
+            extra=dict(info),
+        )
+
+    def fetch_statement(self, symbol: str, statement_type: str) -> pd.DataFrame:
+        return T.cast(pd.DataFrame, get_ticker_registry().field(symbol, STATEMENT_FIELDS[statement_type]))
+
+
+@dataclass
+class Lookup:
+    """Record of one repository lookup."""
+
+    kind: str  # "prices", "company_info" or a statement type
+    symbol: str
+    tier: str
+    provider: T.Optional[str] = None  # set when served from the network
+
+
+@dataclass
+class TierStats:
+    """Number of lookups served by each tier."""
+
+    memory: int = 0
+    disk: int = 0
+    network: int = 0
+    evictions: int = 0
+
+    def to_dict(self) -> T.Dict[str, int]:
+        return asdict(self)
+
+
+@dataclass
+class _MemoryEntry:
+    value: T.Any
+    size: int = field(default=0)
+
+
+class MemoryLRU:
+    """LRU mapping whose capacity is the approximate size of its values in bytes."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MEMORY_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.evictions = 0
+        self._data: "OrderedDict[T.Hashable, _MemoryEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: T.Hashable) -> T.Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            self._data.move_to_end(key)
+            return entry.value
+
+    def set(self, key: T.Hashable, value: T.Any) -> None:
+        size = sizeof(value)
+        with self._lock:
+            if key in self._data:
+                self.size -= self._data.pop(key).size
+            if size > self.max_bytes:
+                return  # larger than the whole tier; never cached in memory
+            self._data[key] = _MemoryEntry(value, size)
+            self.size += size
+            while self.size > self.max_bytes:
+                _, evicted = self._data.popitem(last=False)
+                self.size -= evicted.size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.size = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class CachedMarketDataRepository(MarketDataRepository):
+    """MarketDataRepository served from memory, then disk, then the network providers.
+
+    Parameters:
+        providers (Sequence[MarketDataProvider] | None): network sources in priority order.
+            Defaults to yfinance.
+        cache_dir (str | PathLike | None): root of the disk tier; ``None`` disables it.
+        memory_bytes (int): capacity of the memory tier.
+        disk_ttl (float): seconds before statements and profiles on disk are refetched.
+        history (int): number of recent lookups kept in ``lookups``.
+        statement_store (StatementStore | None): columnar store every loaded statement is
+            ingested into, for cross-sectional queries over all symbols seen so far.
+    """
+
+    def __init__(
+        self,
+        providers: T.Optional[T.Sequence[MarketDataProvider]] = None,
+        cache_dir: T.Optional[T.Union[str, os.PathLike[str]]] = None,
+        memory_bytes: int = DEFAULT_MEMORY_BYTES,
+        disk_ttl: float = DEFAULT_DISK_TTL,
+        history: int = 1000,
+        statement_store: T.Optional[StatementStore] = None,
+    ) -> None:
+        self.providers: T.List[MarketDataProvider] = list(providers) if providers else [YFinanceProvider()]
+        self.cache_dir = os.fspath(cache_dir) if cache_dir is not None else None
+        self.memory = MemoryLRU(memory_bytes)
+        self.prices = PriceCache(os.path.join(self.cache_dir, "prices")) if self.cache_dir else None
+        self.disk_ttl = disk_ttl
+        self.statement_store = statement_store
+        self.lookups: T.Deque[Lookup] = deque(maxlen=history)
+        self._stats = TierStats()
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> TierStats:
+        with self._lock:
+            return TierStats(
+                memory=self._stats.memory,
+                disk=self._stats.disk,
+                network=self._stats.network,
+                evictions=self.memory.evictions,
+            )
+
+    @property
+    def last_lookup(self) -> T.Optional[Lookup]:
+        return self.lookups[-1] if self.lookups else None
+
+    # --------------------------------------------------------- repository API
+
+    def get_stock_data(self, symbol: str, start_date: str, end_date: str) -> MarketData:
+        symbol = symbol.upper()
+        key = ("prices", symbol, start_date, end_date)
+        # ranges reaching today skip the memory tier so the trailing bar is refreshed, as on disk
+        live = reaches_today(end_date)
+        cached = None if live else self.memory.get(key)
+        if cached is not None:
+            self._record("prices", symbol, MEMORY)
+            return T.cast(MarketData, _copy_entity(cached))
+
+        providers_used: T.List[str] = []
+
+        def fetch(start: str, end: str) -> pd.DataFrame:
+            frame, name = self._from_providers(lambda provider: provider.fetch_stock_data(symbol, start, end))
+            providers_used.append(name)
+            return T.cast(pd.DataFrame, frame) if frame is not None else pd.DataFrame()
+
+        frame = self.prices.get(symbol, start_date, end_date, fetch) if self.prices else fetch(start_date, end_date)
+        tier = NETWORK if providers_used else DISK
+        provider_name = providers_used[-1] if providers_used else None
+
+        market_data = MarketData(
+            symbol=symbol,
+            data=frame,
+            start_date=datetime.strptime(start_date, "%Y-%m-%d"),
+            end_date=datetime.strptime(end_date, "%Y-%m-%d"),
+        )
+        if not live:
+            self.memory.set(key, market_data)
+        self._record("prices", symbol, tier, provider_name)
+        return T.cast(MarketData, _copy_entity(market_data))
+
+    def get_company_info(self, symbol: str) -> CompanyInfo:
+        symbol = symbol.upper()
+        key = ("company_info", symbol)
+        cached = self.memory.get(key)
+        if cached is not None:
+            self._record("company_info", symbol, MEMORY)
+            return T.cast(CompanyInfo, _copy_entity(cached))
+
+        path = self._disk_path(symbol, "company_info.json")
+        if path is not None and self._fresh(path):
+            with open(path, "r") as f:
+                info = CompanyInfo(**json.load(f))
+            tier, provider_name = DISK, None
+        else:
+            info, provider_name = self._from_providers(lambda provider: provider.fetch_company_info(symbol))
+            if info is None:
+                raise ValueError(f"No provider returned company info for {symbol}")
+            tier = NETWORK
+            if path is not None:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                payload = json.loads(json.dumps(asdict(info), default=str))
+                atomic_write(path, lambda tmp: dump_json(payload, tmp))
+
+        self.memory.set(key, info)
+        self._record("company_info", symbol, tier, provider_name)
+        return T.cast(CompanyInfo, _copy_entity(info))
+
+    def get_income_statement(self, symbol: str) -> FinancialStatement:
+        return self._get_statement(symbol, "income")
+
+    def get_balance_sheet(self, symbol: str) -> FinancialStatement:
+        return self._get_statement(symbol, "balance_sheet")
+
+    def get_cash_flow(self, symbol: str) -> FinancialStatement:
+        return self._get_statement(symbol, "cash_flow")
+
+    def clear(self) -> None:
+        """Drop the memory tier (the disk tier is kept)."""
+        self.memory.clear()
+
+    # -------------------------------------------------------------- internals
+
+    def _get_statement(self, symbol: str, statement_type: str) -> FinancialStatement:
+        symbol = symbol.upper()
+        key = (statement_type, symbol)
+        cached = self.memory.get(key)
+        if cached is not None:
+            self._record(statement_type, symbol, MEMORY)
+            return T.cast(FinancialStatement, _copy_entity(cached))
+
+        path = self._disk_path(symbol, f"{statement_type}.parquet")
+        if path is not None and self._fresh(path):
+            # NOTE: statements are stored transposed because Parquet needs string column
+            # names and statement columns are period-end timestamps.
+            data = pd.read_parquet(path).T
+            tier, provider_name = DISK, None
+        else:
+            data, provider_name = self._from_providers(
+                lambda provider: provider.fetch_statement(symbol, statement_type)
+            )
+            if data is None:
+                data = pd.DataFrame()
+            tier = NETWORK
+            if path is not None and not data.empty:
+                transposed = data.T
+                transposed.columns = transposed.columns.astype(str)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                atomic_write(path, lambda tmp: transposed.to_parquet(tmp))
+
+        statement = FinancialStatement(symbol=symbol, statement_type=statement_type, data=data)
+        if self.statement_store is not None:
+            self.statement_store.ingest(statement)
+        self.memory.set(key, statement)
+        self._record(statement_type, symbol, tier, provider_name)
+        return T.cast(FinancialStatement, _copy_entity(statement))
+
+    def _from_providers(self, call: T.Callable[[MarketDataProvider], T.Any]) -> T.Tuple[T.Any, str]:
+        """Return the first non-empty provider result, falling back on errors or empty data.
+
+        The result is ``None`` when every provider returned ``None``.
+        """
+        result: T.Any = None
+        error: T.Optional[Exception] = None
+        for provider in self.providers:
+            try:
+                result = call(provider)
+            except Exception as exc:  # fall through to the next provider
+                error = exc
+                continue
+            if not _is_empty(result):
+                return result, provider.name
+        if result is None and error is not None:
+            raise error
+        return result, self.providers[-1].name
+
+    def _disk_path(self, symbol: str, name: str) -> T.Optional[str]:
+        if self.cache_dir is None:
+            return None
+        safe_symbol = symbol.replace(os.sep, "_").replace("/", "_")
+        return os.path.join(self.cache_dir, "fundamentals", f"symbol={safe_symbol}", name)
+
+    def _fresh(self, path: str) -> bool:
+        return os.path.exists(path) and time.time() - os.path.getmtime(path) < self.disk_ttl
+
+    def _record(self, kind: str, symbol: str, tier: str, provider: T.Optional[str] = None) -> None:
+        with self._lock:
+            setattr(self._stats, tier, getattr(self._stats, tier) + 1)
+            self.lookups.append(Lookup(kind=kind, symbol=symbol, tier=tier, provider=provider))
+
+
+def sizeof(value: T.Any) -> int:
+    """Approximate in-memory size of an entity, DataFrame or plain value in bytes."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, (MarketData, FinancialStatement)):
+        return sys.getsizeof(value) + sizeof(value.data)
+    if isinstance(value, CompanyInfo):
+        return sys.getsizeof(value) + len(json.dumps(asdict(value), default=str))
+    return sys.getsizeof(value)
+
+
+def _copy_entity(value: T.Any) -> T.Any:
+    """Copy of a cached entity that shares no mutable state with it."""
+    if isinstance(value, (MarketData, FinancialStatement)):
+        return dataclasses.replace(value, data=value.data.copy())
+    if isinstance(value, CompanyInfo):
+        return dataclasses.replace(value, extra=copy.deepcopy(value.extra))
+    return copy.deepcopy(value)
+
+
+def _is_empty(value: T.Any) -> bool:
+    if value is None:
+        return True
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return bool(value.empty)
+    return False
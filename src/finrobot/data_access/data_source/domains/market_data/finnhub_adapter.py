@@ -1,32 +1,37 @@
 import json
 import os
 import typing as T
-from collections import defaultdict
 from functools import wraps
 
-import finnhub
 import pandas as pd
+from finrobot.data_access.data_source.clients import ClientHandle, build_finnhub_client
+from finrobot.infrastructure.cache import single_flight
 from finrobot.infrastructure.io.files import SavePathType, save_output
 from finrobot.infrastructure.utils import decorate_all_methods
 
-finnhub_client: T.Any = None
+from .basic_financials import get_basic_financials_cache
+
+finnhub_client: T.Any = ClientHandle(
+    "finnhub", build_finnhub_client, credentials=("FINNHUB_API_KEY",), rate_limit="finnhub"
+)
+
+
+def _fetch_basic_financials(symbol: str) -> T.Dict[str, T.Any]:
+    return T.cast(T.Dict[str, T.Any], finnhub_client.company_basic_financials(symbol, "all"))
 
 
 def init_finnhub_client(func: T.Callable[..., T.Any]) -> T.Callable[..., T.Any]:
     @wraps(func)
     def wrapper(*args: T.Any, **kwargs: T.Any) -> T.Any:
-        global finnhub_client
         if os.environ.get("FINNHUB_API_KEY") is None:
             print("Please set the environment variable FINNHUB_API_KEY to use the Finnhub API.")
             return None
-        else:
-            finnhub_client = finnhub.Client(api_key=os.environ["FINNHUB_API_KEY"])
-            print("Finnhub client initialized")
-            return func(*args, **kwargs)
+        return func(*args, **kwargs)
 
     return wrapper
 
 
+@decorate_all_methods(single_flight("finnhub", unless=("save_path",)))
 @decorate_all_methods(init_finnhub_client)
 class FinnHubMarketAdapter:
     """FinnHub implementation for market data (company profiles, financials)."""
@@ -61,20 +66,11 @@ class FinnHubMarketAdapter:
         if freq not in ["annual", "quarterly"]:
             return f"Invalid reporting frequency {freq}."
 
-        basic_financials = finnhub_client.company_basic_financials(symbol, "all")
-        if not basic_financials["series"]:
+        basic_financials = get_basic_financials_cache().get(symbol, _fetch_basic_financials)
+        if basic_financials.empty:
             return f"Failed to find basic financials for symbol {symbol}!"
 
-        output_dict: T.Dict[str, T.Dict[str, T.Any]] = defaultdict(dict)
-        for metric, value_list in basic_financials["series"][freq].items():
-            if selected_columns and metric not in selected_columns:
-                continue
-            for value in value_list:
-                if value["period"] >= start_date and value["period"] <= end_date:
-                    output_dict[metric].update({value["period"]: value["v"]})
-
-        financials_output = pd.DataFrame(output_dict)
-        financials_output = financials_output.rename_axis(index="date")
+        financials_output = basic_financials.history(freq, start_date, end_date, selected_columns)
         save_output(financials_output, "basic financials", save_path=save_path)
 
         return financials_output
@@ -84,17 +80,10 @@ class FinnHubMarketAdapter:
         selected_columns: T.Optional[T.List[str]] = None,
     ) -> str:
         """Get latest basic financials."""
-        basic_financials = finnhub_client.company_basic_financials(symbol, "all")
-        if not basic_financials["series"]:
+        basic_financials = get_basic_financials_cache().get(symbol, _fetch_basic_financials)
+        if basic_financials.empty:
             return f"Failed to find basic financials for symbol {symbol}!"
 
-        output_dict = basic_financials["metric"]
-        for metric, value_list in basic_financials["series"]["quarterly"].items():
-            value = value_list[0]
-            output_dict.update({metric: value["v"]})
-
-        for k in list(output_dict.keys()):
-            if selected_columns and k not in selected_columns:
-                output_dict.pop(k)
+        output_dict = basic_financials.latest(selected_columns)
 
         return json.dumps(output_dict, indent=2)
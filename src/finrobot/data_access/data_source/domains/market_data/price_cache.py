@@ -0,0 +1,274 @@
+"""Market Data Price Cache - Parquet-backed OHLCV store partitioned by symbol.
+
+Each symbol lives in its own ``symbol=<SYMBOL>`` directory holding a ``prices.parquet``
+file and a ``coverage.json`` sidecar that records the contiguous date range already
+downloaded. Requests inside that range are served from disk; requests that extend it
+only download the missing leading and/or trailing gap.
+
+The cache is opt-in: set ``FINROBOT_PRICE_CACHE_DIR`` or call ``configure_price_cache``.
+"""
+
+import json
+import os
+import threading
+import typing as T
+from dataclasses import asdict, dataclass
+from datetime import datetime
+
+import pandas as pd
+from finrobot.infrastructure.io.files import atomic_write, dump_json
+
+PRICE_CACHE_ENV = "FINROBOT_PRICE_CACHE_DIR"
+DATE_FORMAT = "%Y-%m-%d"
+
+# fetch(start_date, end_date) -> OHLCV frame, end date exclusive (yfinance semantics)
+PriceFetcher = T.Callable[[str, str], pd.DataFrame]
+DateLike = T.Union[str, datetime, pd.Timestamp]
+
+
+@dataclass
+class PriceCacheStats:
+    """Counters describing how price requests were served."""
+
+    hits: int = 0  # served entirely from disk
+    partial_hits: int = 0  # served from disk after downloading a leading/trailing gap
+    misses: int = 0  # nothing on disk for the symbol yet
+    network_calls: int = 0  # number of fetcher invocations
+
+    @property
+    def requests(self) -> int:
+        return self.hits + self.partial_hits + self.misses
+
+    def to_dict(self) -> T.Dict[str, int]:
+        return asdict(self)
+
+
+class PriceCache:
+    """Local columnar cache of daily OHLCV history with incremental gap filling."""
+
+    DATA_FILE = "prices.parquet"
+    COVERAGE_FILE = "coverage.json"
+
+    def __init__(self, root: T.Union[str, os.PathLike[str]]) -> None:
+        self.root = os.fspath(root)
+        self.stats = PriceCacheStats()
+        self._lock = threading.Lock()
+        self._symbol_locks: T.Dict[str, threading.Lock] = {}
+
+    def get(
+        self,
+        symbol: str,
+        start_date: DateLike,
+        end_date: DateLike,
+        fetch: PriceFetcher,
+    ) -> pd.DataFrame:
+        """Return prices for ``[start_date, end_date)``, downloading only what is missing."""
+        start, end = _to_day(start_date), _to_day(end_date)
+        with self._lock_for(symbol):
+            frame, coverage = self._read(symbol)
+            gaps = _missing_ranges(coverage, start, end)
+            if not gaps:
+                self._count(hits=1)
+                return _slice(frame, start, end)
+
+            if coverage is None:
+                self._count(misses=1)
+            else:
+                self._count(partial_hits=1)
+            parts = [] if frame is None else [frame]
+            for gap_start, gap_end in gaps:
+                self._count(network_calls=1)
+                parts.append(fetch(gap_start.strftime(DATE_FORMAT), gap_end.strftime(DATE_FORMAT)))
+            frame = _merge(parts)
+            self._write(symbol, frame, _extend_coverage(coverage, start, end))
+            return _slice(frame, start, end)
+
+    def put(self, symbol: str, frame: pd.DataFrame, start_date: DateLike, end_date: DateLike) -> None:
+        """Merge an externally downloaded frame covering ``[start_date, end_date)`` into the cache."""
+        start, end = _to_day(start_date), _to_day(end_date)
+        with self._lock_for(symbol):
+            cached, coverage = self._read(symbol)
+            if coverage is not None and (start > coverage[1] or end < coverage[0]):
+                # NOTE: a disjoint range would leave a hole inside the recorded coverage,
+                # so the existing partition is replaced instead of merged.
+                cached, coverage = None, None
+            parts = [frame] if cached is None else [cached, frame]
+            self._write(symbol, _merge(parts), _extend_coverage(coverage, start, end))
+
+    def covers(self, symbol: str, start_date: DateLike, end_date: DateLike) -> bool:
+        """Whether ``[start_date, end_date)`` can be served without any download."""
+        return not _missing_ranges(self._read_coverage(symbol), _to_day(start_date), _to_day(end_date))
+
+    def coverage(self, symbol: str) -> T.Optional[T.Tuple[pd.Timestamp, pd.Timestamp]]:
+        """Return the cached ``[start, end)`` range for a symbol, if any."""
+        return self._read_coverage(symbol)
+
+    def clear(self, symbol: T.Optional[str] = None) -> None:
+        """Drop one symbol's partition, or every partition when no symbol is given."""
+        symbols = [symbol] if symbol else self.symbols()
+        for sym in symbols:
+            with self._lock_for(sym):
+                for name in (self.DATA_FILE, self.COVERAGE_FILE):
+                    path = os.path.join(self._partition(sym), name)
+                    if os.path.exists(path):
+                        os.remove(path)
+
+    def symbols(self) -> T.List[str]:
+        """List the symbols that currently have a partition on disk."""
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(name.split("=", 1)[1] for name in os.listdir(self.root) if name.startswith("symbol="))
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.stats = PriceCacheStats()
+
+    # ---------------------------------------------------------------- internals
+
+    def _count(self, **deltas: int) -> None:
+        with self._lock:
+            for name, delta in deltas.items():
+                setattr(self.stats, name, getattr(self.stats, name) + delta)
+
+    def _lock_for(self, symbol: str) -> threading.Lock:
+        with self._lock:
+            return self._symbol_locks.setdefault(symbol, threading.Lock())
+
+    def _partition(self, symbol: str) -> str:
+        safe_symbol = symbol.replace(os.sep, "_").replace("/", "_")
+        return os.path.join(self.root, f"symbol={safe_symbol}")
+
+    def _read_coverage(self, symbol: str) -> T.Optional[T.Tuple[pd.Timestamp, pd.Timestamp]]:
+        path = os.path.join(self._partition(symbol), self.COVERAGE_FILE)
+        if not os.path.exists(path):
+            return None
+        with open(path, "r") as f:
+            raw = json.load(f)
+        return pd.Timestamp(raw["start"]), pd.Timestamp(raw["end"])
+
+    def _read(self, symbol: str) -> T.Tuple[T.Optional[pd.DataFrame], T.Optional[T.Tuple[pd.Timestamp, pd.Timestamp]]]:
+        coverage = self._read_coverage(symbol)
+        data_path = os.path.join(self._partition(symbol), self.DATA_FILE)
+        if coverage is None or not os.path.exists(data_path):
+            return None, None
+        return pd.read_parquet(data_path), coverage
+
+    def _write(
+        self,
+        symbol: str,
+        frame: pd.DataFrame,
+        coverage: T.Tuple[pd.Timestamp, pd.Timestamp],
+    ) -> None:
+        partition = self._partition(symbol)
+        os.makedirs(partition, exist_ok=True)
+        # NOTE: data is replaced before coverage so a crash in between can only
+        # under-report what is on disk (causing a refetch), never over-report it.
+        atomic_write(os.path.join(partition, self.DATA_FILE), lambda path: frame.to_parquet(path))
+        payload = {"start": coverage[0].strftime(DATE_FORMAT), "end": coverage[1].strftime(DATE_FORMAT)}
+        atomic_write(
+            os.path.join(partition, self.COVERAGE_FILE),
+            lambda path: dump_json(payload, path),
+        )
+
+
+_default_cache: T.Optional[PriceCache] = None
+
+
+def configure_price_cache(root: T.Optional[T.Union[str, os.PathLike[str]]]) -> T.Optional[PriceCache]:
+    """Enable the process-wide price cache at ``root``, or disable it with ``None``."""
+    global _default_cache
+    _default_cache = PriceCache(root) if root else None
+    return _default_cache
+
+
+def get_price_cache() -> T.Optional[PriceCache]:
+    """Return the process-wide price cache, creating it from the environment if configured."""
+    global _default_cache
+    if _default_cache is None and os.environ.get(PRICE_CACHE_ENV):
+        _default_cache = PriceCache(os.environ[PRICE_CACHE_ENV])
+    return _default_cache
+
+
+def _to_day(value: DateLike) -> pd.Timestamp:
+    stamp = pd.Timestamp(value)
+    if stamp.tzinfo is not None:
+        stamp = stamp.tz_localize(None)
+    return stamp.normalize()
+
+
+def _today() -> pd.Timestamp:
+    return pd.Timestamp.now().normalize()
+
+
+def reaches_today(end: DateLike) -> bool:
+    """Whether a range ending at ``end`` includes the current, still trading session."""
+    return bool(_to_day(end) >= _today())
+
+
+def _missing_ranges(
+    coverage: T.Optional[T.Tuple[pd.Timestamp, pd.Timestamp]],
+    start: pd.Timestamp,
+    end: pd.Timestamp,
+) -> T.List[T.Tuple[pd.Timestamp, pd.Timestamp]]:
+    """Ranges to download so that coverage stays contiguous and includes ``[start, end)``."""
+    if start >= end:
+        return []
+    if coverage is None:
+        return [(start, end)]
+    cov_start, cov_end = coverage
+    gaps = []
+    if start < cov_start:
+        gaps.append((start, cov_start))
+    if end > cov_end:
+        gaps.append((cov_end, end))
+    return gaps
+
+
+def _extend_coverage(
+    coverage: T.Optional[T.Tuple[pd.Timestamp, pd.Timestamp]],
+    start: pd.Timestamp,
+    end: pd.Timestamp,
+) -> T.Tuple[pd.Timestamp, pd.Timestamp]:
+    # NOTE: the current session is still trading, so coverage never extends past today;
+    # requests reaching today always refresh the trailing bar.
+    end = min(end, _today())
+    if coverage is None:
+        return start, max(start, end)
+    return min(coverage[0], start), max(coverage[1], end)
+
+
+def _merge(parts: T.Sequence[pd.DataFrame]) -> pd.DataFrame:
+    frames = [part for part in parts if part is not None and not part.empty]
+    if not frames:
+        return next((part for part in parts if part is not None), pd.DataFrame())
+    if len({_is_tz_aware(frame) for frame in frames}) > 1:
+        # NOTE: bulk downloads may return exchange-local naive dates while Ticker.history
+        # is tz-aware; both label the same trading day, so align on the naive date.
+        frames = [_drop_tz(frame) for frame in frames]
+    merged = pd.concat(frames) if len(frames) > 1 else frames[0]
+    merged = merged[~merged.index.duplicated(keep="last")]
+    return merged.sort_index()
+
+
+def _is_tz_aware(frame: pd.DataFrame) -> bool:
+    return getattr(frame.index, "tz", None) is not None
+
+
+def _drop_tz(frame: pd.DataFrame) -> pd.DataFrame:
+    if not _is_tz_aware(frame):
+        return frame
+    frame = frame.copy()
+    frame.index = pd.DatetimeIndex(frame.index).tz_localize(None)
+    return frame
+
+
+def _slice(frame: T.Optional[pd.DataFrame], start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+    if frame is None:
+        return pd.DataFrame()
+    if frame.empty:
+        return frame.copy()
+    index = pd.DatetimeIndex(frame.index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    mask = (index >= start) & (index < end)
+    return frame.loc[mask].copy()
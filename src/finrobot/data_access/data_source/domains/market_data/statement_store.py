@@ -0,0 +1,258 @@
+"""Market Data Statement Store - Arrow-backed columnar store of financial statements.
+
+``FinancialStatement.data`` is the wide provider frame (line items x period ends) of one
+symbol. The store ingests statements once into a single long-format Arrow table::
+
+    symbol | statement_type | period | line_item | period_end | value
+
+with dictionary-encoded string columns, sorted so that every line item occupies one
+contiguous row range. New statements are merged into that table on the next query. A cross-sectional query ("Diluted EPS for 500 tickers over the last
+8 quarters") is then a zero-copy ``Table.slice`` narrowed with vectorized filters, instead
+of one pandas pivot per ticker.
+"""
+
+import threading
+import typing as T
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from .entities import FinancialStatement
+
+SCHEMA = pa.schema(
+    [
+        ("symbol", pa.dictionary(pa.int32(), pa.string())),
+        ("statement_type", pa.dictionary(pa.int32(), pa.string())),
+        ("period", pa.dictionary(pa.int32(), pa.string())),
+        ("line_item", pa.dictionary(pa.int32(), pa.string())),
+        ("period_end", pa.timestamp("ns")),
+        ("value", pa.float64()),
+    ]
+)
+PLAIN_SCHEMA = pa.schema(
+    [(field.name, field.type.value_type if pa.types.is_dictionary(field.type) else field.type) for field in SCHEMA]
+)
+SORT_KEYS = ["line_item", "symbol", "statement_type", "period", "period_end"]
+# a line item's history is ordered by period_end within each of these groups
+GROUP_KEYS = ["symbol", "statement_type", "period"]
+
+# (symbol, statement_type, period)
+StatementKey = T.Tuple[str, str, str]
+
+
+class StatementStore:
+    """Long-format, dictionary-encoded Arrow table of ingested statements."""
+
+    def __init__(self) -> None:
+        self._parts: T.Dict[StatementKey, pa.Table] = {}
+        self._pending: T.Dict[StatementKey, pa.Table] = {}
+        self._table: T.Optional[pa.Table] = None
+        self._ranges: T.Dict[str, T.Tuple[int, int]] = {}  # line_item -> [start, stop)
+        self._lock = threading.Lock()
+
+    def ingest(self, statement: FinancialStatement) -> int:
+        """Add (or replace) one statement; return the number of values stored."""
+        part = _to_long(statement)
+        key = (statement.symbol.upper(), statement.statement_type, statement.period)
+        with self._lock:
+            self._parts[key] = part
+            self._pending[key] = part
+        return int(part.num_rows)
+
+    def ingest_many(self, statements: T.Iterable[FinancialStatement]) -> int:
+        return sum(self.ingest(statement) for statement in statements)
+
+    @property
+    def table(self) -> pa.Table:
+        """The whole store as one sorted, single-chunk Arrow table."""
+        return self._snapshot()[0]
+
+    def line_item(
+        self,
+        line_item: str,
+        symbols: T.Optional[T.Sequence[str]] = None,
+        statement_type: T.Optional[str] = None,
+        period: T.Optional[str] = None,
+        start: T.Optional[T.Union[str, pd.Timestamp]] = None,
+        end: T.Optional[T.Union[str, pd.Timestamp]] = None,
+        last: T.Optional[int] = None,
+    ) -> pa.Table:
+        """Rows of ``line_item``, sorted by (symbol, statement_type, period, period_end).
+
+        Parameters:
+            line_item (str): e.g. "Diluted EPS".
+            symbols (Sequence[str] | None): restrict to these symbols.
+            statement_type (str | None): "income", "balance_sheet" or "cash_flow", for line
+                items that appear in several statements (e.g. "Net Income").
+            period (str | None): "annual" or "quarterly".
+            start, end (str | Timestamp | None): inclusive bounds on ``period_end``.
+            last (int | None): keep only the ``last`` most recent period ends of each
+                (symbol, statement_type, period).
+
+        Returns:
+            pa.Table: a zero-copy slice of the store when only ``line_item`` is given.
+        """
+        table, ranges = self._snapshot()
+        begin, stop = ranges.get(line_item, (0, 0))
+        rows = table.slice(begin, stop - begin)
+
+        mask = None
+        if symbols is not None:
+            mask = _and(mask, pc.is_in(rows["symbol"], value_set=pa.array([s.upper() for s in symbols])))
+        if statement_type is not None:
+            mask = _and(mask, pc.equal(rows["statement_type"], statement_type))
+        if period is not None:
+            mask = _and(mask, pc.equal(rows["period"], period))
+        if start is not None:
+            mask = _and(mask, pc.greater_equal(rows["period_end"], _timestamp(start)))
+        if end is not None:
+            mask = _and(mask, pc.less_equal(rows["period_end"], _timestamp(end)))
+        if mask is not None:
+            rows = rows.filter(mask)
+        if last is not None:
+            rows = rows.take(_last_per_group(rows, last))
+        return rows
+
+    def pivot(self, line_item: str, **filters: T.Any) -> pd.DataFrame:
+        """``line_item`` as a period_end x symbol frame (see ``line_item`` for ``filters``).
+
+        Raises:
+            ValueError: when a symbol has several values for one period end, e.g. a line item
+                found in several statements or an annual and a quarterly period ending on the
+                same day; narrow the rows with ``statement_type`` and ``period``.
+        """
+        rows = self.line_item(line_item, **filters)
+        frame = rows.select(["symbol", "period_end", "value"]).to_pandas()
+        frame["symbol"] = frame["symbol"].astype(str)
+        duplicated = frame.duplicated(["symbol", "period_end"], keep=False)
+        if duplicated.any():
+            clashes = sorted(set(frame.loc[duplicated, "symbol"]))
+            raise ValueError(
+                f"{line_item!r} has several values per period end for {clashes}; "
+                "pass statement_type and period to pick one statement"
+            )
+        wide = frame.pivot(index="period_end", columns="symbol", values="value")
+        return wide.rename_axis(columns=None)
+
+    def statement(self, symbol: str, statement_type: str, period: str = "annual") -> FinancialStatement:
+        """Rebuild the wide statement of one symbol (line items x period ends, newest first)."""
+        with self._lock:
+            part = self._parts.get((symbol.upper(), statement_type, period))
+        if part is None:
+            raise KeyError((symbol.upper(), statement_type, period))
+        frame = part.select(["line_item", "period_end", "value"]).to_pandas()
+        frame["line_item"] = frame["line_item"].astype(str)
+        wide = frame.pivot(index="line_item", columns="period_end", values="value")
+        wide = wide.reindex(index=list(dict.fromkeys(frame["line_item"])))
+        wide = wide[sorted(wide.columns, reverse=True)].rename_axis(index=None, columns=None)
+        return FinancialStatement(symbol=symbol.upper(), statement_type=statement_type, data=wide, period=period)
+
+    def symbols(self) -> T.List[str]:
+        with self._lock:
+            return sorted({symbol for symbol, _, _ in self._parts})
+
+    def line_items(self) -> T.List[str]:
+        return list(self._snapshot()[1])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._parts.clear()
+            self._pending.clear()
+            self._table = None
+            self._ranges = {}
+
+    def __len__(self) -> int:
+        return int(self.table.num_rows)
+
+    def _snapshot(self) -> T.Tuple[pa.Table, T.Dict[str, T.Tuple[int, int]]]:
+        with self._lock:
+            if self._table is None or self._pending:
+                self._compact()
+            return T.cast(pa.Table, self._table), self._ranges
+
+    def _compact(self) -> None:
+        """Merge the pending statements into the table, replacing earlier rows of their keys."""
+        pending, self._pending = self._pending, {}
+        tables = list(pending.values())
+        if self._table is not None and self._table.num_rows:
+            kept = self._table.cast(PLAIN_SCHEMA)
+            if pending:
+                replaced = pa.array(["\x1f".join(key) for key in pending])
+                kept = kept.filter(pc.invert(pc.is_in(_keys(kept), value_set=replaced)))
+            tables.insert(0, kept)
+        if not tables:
+            self._table = SCHEMA.empty_table()
+            self._ranges = {}
+            return
+        table = pa.concat_tables(tables).sort_by([(key, "ascending") for key in SORT_KEYS])
+        columns = [
+            pc.dictionary_encode(table[name].combine_chunks())
+            if pa.types.is_dictionary(SCHEMA.field(name).type)
+            else table[name].combine_chunks()
+            for name in SCHEMA.names
+        ]
+        self._table = pa.Table.from_arrays(columns, schema=SCHEMA)
+
+        line_items = self._table["line_item"].chunk(0) if self._table.num_rows else None
+        self._ranges = {}
+        if line_items is not None:
+            codes = line_items.indices.to_numpy()
+            bounds = np.flatnonzero(np.diff(codes)) + 1
+            starts = np.concatenate([[0], bounds])
+            stops = np.concatenate([bounds, [len(codes)]])
+            names = line_items.dictionary.to_pylist()
+            for begin, stop in zip(starts, stops):
+                self._ranges[names[codes[begin]]] = (int(begin), int(stop))
+
+
+def _to_long(statement: FinancialStatement) -> pa.Table:
+    """Melt a wide (line items x period ends) frame into plain-string long-format rows."""
+    data = statement.data
+    if data is None or data.empty:
+        values = pd.Series(dtype="float64")
+    else:
+        frame = data.copy()
+        frame.columns = pd.to_datetime(frame.columns)
+        frame.index = frame.index.astype(str)
+        values = frame.apply(pd.to_numeric, errors="coerce").stack().dropna()
+    line_items = values.index.get_level_values(0) if len(values) else []
+    period_ends = values.index.get_level_values(1) if len(values) else []
+    count = len(values)
+    return pa.table(
+        {
+            "symbol": pa.array([statement.symbol.upper()] * count, pa.string()),
+            "statement_type": pa.array([statement.statement_type] * count, pa.string()),
+            "period": pa.array([statement.period] * count, pa.string()),
+            "line_item": pa.array(list(line_items), pa.string()),
+            "period_end": pa.array(pd.DatetimeIndex(period_ends).as_unit("ns"), pa.timestamp("ns")),
+            "value": pa.array(values.to_numpy(dtype="float64"), pa.float64()),
+        }
+    )
+
+
+def _and(mask: T.Optional[pa.ChunkedArray], condition: pa.ChunkedArray) -> pa.ChunkedArray:
+    return condition if mask is None else pc.and_(mask, condition)
+
+
+def _timestamp(value: T.Union[str, pd.Timestamp]) -> pa.Scalar:
+    return pa.scalar(pd.Timestamp(value).as_unit("ns"), pa.timestamp("ns"))
+
+
+def _keys(table: pa.Table) -> pa.ChunkedArray:
+    """``StatementKey`` of every row, joined into one string."""
+    return pc.binary_join_element_wise(table["symbol"], table["statement_type"], table["period"], "\x1f")
+
+
+def _last_per_group(rows: pa.Table, last: int) -> np.ndarray:
+    """Row positions of the ``last`` rows of every contiguous (symbol, statement, period) group."""
+    if rows.num_rows == 0:
+        return np.array([], dtype=np.int64)
+    changed = np.zeros(rows.num_rows - 1, dtype=bool)
+    for name in GROUP_KEYS:
+        codes = np.asarray(pc.dictionary_encode(rows[name]).combine_chunks().indices)
+        changed |= np.diff(codes) != 0
+    stops = np.concatenate([np.flatnonzero(changed) + 1, [rows.num_rows]])
+    starts = np.concatenate([[0], stops[:-1]])
+    return np.concatenate([np.arange(max(begin, stop - last), stop) for begin, stop in zip(starts, stops)])
@@ -0,0 +1,140 @@
+"""Market Data Ticker Registry - Shared yf.Ticker objects with TTL-cached attributes.
+
+A single report asks for ``ticker.info`` of the same symbol from several places; each
+``yf.Ticker(symbol).info`` access is a network round trip. The registry keeps one
+``yf.Ticker`` per symbol and memoizes the expensive attributes, with separate expiry
+for fast-moving quote data and slow-moving financial statements. Callers get a copy of
+each memoized value, so mutating an ``info`` dict or a statement frame cannot change
+what the next caller sees.
+"""
+
+import copy
+import os
+import threading
+import typing as T
+from collections import OrderedDict
+
+import yfinance as yf
+from finrobot.infrastructure.cache import TTLCache
+
+QUOTE = "quote"
+STATEMENT = "statement"
+
+# Ticker attributes served from the cache, grouped by how quickly they go stale.
+FIELD_CLASSES: T.Dict[str, str] = {
+    "info": QUOTE,
+    "recommendations": QUOTE,
+    "dividends": STATEMENT,
+    "financials": STATEMENT,
+    "balance_sheet": STATEMENT,
+    "cashflow": STATEMENT,
+}
+
+QUOTE_TTL_ENV = "FINROBOT_QUOTE_TTL"
+STATEMENT_TTL_ENV = "FINROBOT_STATEMENT_TTL"
+DEFAULT_QUOTE_TTL = 5 * 60.0
+DEFAULT_STATEMENT_TTL = 24 * 60 * 60.0
+# Least recently used symbols beyond this many are dropped along with their fields.
+DEFAULT_MAX_TICKERS = 256
+
+
+def _ttl_from_env(name: str, default: float) -> float:
+    value = os.environ.get(name)
+    return float(value) if value else default
+
+
+def _copy(value: T.Any) -> T.Any:
+    if type(value).__module__.startswith("pandas"):
+        return value.copy()
+    return copy.deepcopy(value)
+
+
+class CachedTicker:
+    """Proxy over a shared ``yf.Ticker`` that serves ``FIELD_CLASSES`` attributes from the registry."""
+
+    def __init__(self, registry: "TickerRegistry", symbol: str) -> None:
+        self._registry = registry
+        self._symbol = symbol
+
+    def __getattr__(self, name: str) -> T.Any:
+        if name in FIELD_CLASSES:
+            return self._registry.field(self._symbol, name)
+        return getattr(self._registry.ticker(self._symbol), name)
+
+    def __repr__(self) -> str:
+        return f"CachedTicker({self._symbol!r})"
+
+
+class TickerRegistry:
+    """Per-process registry of ``yf.Ticker`` objects and their memoized attributes."""
+
+    def __init__(
+        self,
+        quote_ttl: T.Optional[float] = None,
+        statement_ttl: T.Optional[float] = None,
+        max_tickers: int = DEFAULT_MAX_TICKERS,
+    ) -> None:
+        self.ttls = {
+            QUOTE: _ttl_from_env(QUOTE_TTL_ENV, DEFAULT_QUOTE_TTL) if quote_ttl is None else quote_ttl,
+            STATEMENT: (
+                _ttl_from_env(STATEMENT_TTL_ENV, DEFAULT_STATEMENT_TTL) if statement_ttl is None else statement_ttl
+            ),
+        }
+        self.max_tickers = max_tickers
+        self.fields: TTLCache[T.Tuple[str, str], T.Any] = self._new_fields()
+        self._tickers: "OrderedDict[str, T.Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def ticker(self, symbol: str) -> T.Any:
+        """Return the shared ``yf.Ticker`` for ``symbol``, creating it on first use."""
+        symbol = symbol.upper()
+        evicted = []
+        with self._lock:
+            if symbol in self._tickers:
+                self._tickers.move_to_end(symbol)
+            else:
+                self._tickers[symbol] = yf.Ticker(symbol)
+                while len(self._tickers) > self.max_tickers:
+                    evicted.append(self._tickers.popitem(last=False)[0])
+            ticker = self._tickers[symbol]
+        for old in evicted:
+            self.invalidate(old)
+        return ticker
+
+    def cached_ticker(self, symbol: str) -> CachedTicker:
+        return CachedTicker(self, symbol.upper())
+
+    def field(self, symbol: str, name: str) -> T.Any:
+        """Return a copy of ``ticker.<name>`` for ``symbol``, refetching once its TTL has expired."""
+        symbol = symbol.upper()
+        ttl = self.ttls[FIELD_CLASSES[name]]
+        return _copy(self.fields.get_or_set((symbol, name), lambda: getattr(self.ticker(symbol), name), ttl=ttl))
+
+    def configure(self, quote_ttl: T.Optional[float] = None, statement_ttl: T.Optional[float] = None) -> None:
+        """Change expiry per field class; already cached values keep their original expiry."""
+        if quote_ttl is not None:
+            self.ttls[QUOTE] = quote_ttl
+        if statement_ttl is not None:
+            self.ttls[STATEMENT] = statement_ttl
+
+    def invalidate(self, symbol: str) -> None:
+        symbol = symbol.upper()
+        for name in FIELD_CLASSES:
+            self.fields.invalidate((symbol, name))
+
+    def clear(self) -> None:
+        """Forget every ticker, cached field and statistic."""
+        with self._lock:
+            self._tickers.clear()
+        self.fields = self._new_fields()
+
+    def _new_fields(self) -> "TTLCache[T.Tuple[str, str], T.Any]":
+        return TTLCache(ttl=self.ttls[QUOTE], maxsize=self.max_tickers * len(FIELD_CLASSES))
+
+
+_registry = TickerRegistry()
+
+
+def get_ticker_registry() -> TickerRegistry:
+    """Return the process-wide ticker registry."""
+    return _registry
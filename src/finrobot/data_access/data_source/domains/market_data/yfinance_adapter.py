@@ -2,22 +2,27 @@ import typing as T
 from functools import wraps
 
 import yfinance as yf
+from finrobot.infrastructure.cache import single_flight
 from finrobot.infrastructure.io.files import SavePathType, save_output
 from finrobot.infrastructure.utils import decorate_all_methods
 from pandas import DataFrame
 
+from .price_cache import get_price_cache
+from .ticker_registry import get_ticker_registry
+
 
 def init_ticker(func: T.Callable[..., T.Any]) -> T.Callable[..., T.Any]:
-    """Decorator to initialize yf.Ticker and pass it to the function."""
+    """Decorator to look up the shared yf.Ticker for the symbol and pass it to the function."""
 
     @wraps(func)
     def wrapper(symbol: str, *args: T.Any, **kwargs: T.Any) -> T.Any:
-        ticker = yf.Ticker(symbol)
+        ticker = get_ticker_registry().cached_ticker(symbol)
         return func(ticker, *args, **kwargs)
 
     return wrapper
 
 
+@decorate_all_methods(single_flight("yfinance", unless=("save_path",)))
 @decorate_all_methods(init_ticker)
 class YFinanceAdapter:
     """YFinance implementation of MarketDataRepository."""
@@ -30,7 +35,11 @@ class YFinanceAdapter:
     ) -> DataFrame:
         """retrieve stock price data for designated ticker symbol"""
         ticker = symbol  # symbol is actually the ticker object due to decorator
-        stock_data = ticker.history(start=start_date, end=end_date)
+        cache = get_price_cache()
+        if cache is not None:
+            stock_data = cache.get(ticker.ticker, start_date, end_date, lambda s, e: ticker.history(start=s, end=e))
+        else:
+            stock_data = ticker.history(start=start_date, end=end_date)
         save_output(stock_data, f"Stock data for {ticker.ticker}", save_path)
         return stock_data
 
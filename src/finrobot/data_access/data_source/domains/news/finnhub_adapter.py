@@ -7,29 +7,29 @@ from datetime import datetime
 from functools import wraps
 from typing import Annotated, Any, Callable, Optional
 
-import finnhub
 import pandas as pd
+from finrobot.data_access.data_source.clients import ClientHandle, build_finnhub_client
+from finrobot.infrastructure.cache import single_flight
 from finrobot.infrastructure.io.files import SavePathType, save_output
 from finrobot.infrastructure.utils import decorate_all_methods
 
-finnhub_client: T.Any = None
+finnhub_client: T.Any = ClientHandle(
+    "finnhub", build_finnhub_client, credentials=("FINNHUB_API_KEY",), rate_limit="finnhub"
+)
 
 
 def init_finnhub_client(func: T.Callable[..., T.Any]) -> T.Callable[..., T.Any]:
     @wraps(func)
     def wrapper(*args: T.Any, **kwargs: T.Any) -> T.Any:
-        global finnhub_client
         if os.environ.get("FINNHUB_API_KEY") is None:
             print("Please set the environment variable FINNHUB_API_KEY to use the Finnhub API.")
             return None
-        else:
-            finnhub_client = finnhub.Client(api_key=os.environ["FINNHUB_API_KEY"])
-            print("Finnhub client initialized")
-            return func(*args, **kwargs)
+        return func(*args, **kwargs)
 
     return wrapper
 
 
+@decorate_all_methods(single_flight("finnhub", unless=("save_path",)))
 @decorate_all_methods(init_finnhub_client)
 class FinnHubNewsAdapter:
     """FinnHub implementation for news data."""
@@ -4,32 +4,32 @@ from datetime import datetime, timezone
 from functools import wraps
 
 import pandas as pd
-import praw
+from finrobot.data_access.data_source.clients import ClientHandle, build_reddit_client
+from finrobot.infrastructure.cache import single_flight
 from finrobot.infrastructure.io.files import SavePathType, save_output
 from finrobot.infrastructure.utils import decorate_all_methods
 
-reddit_client: T.Any = None
+# NOTE: praw.Reddit is not thread-safe, so each thread gets its own instance.
+reddit_client: T.Any = ClientHandle(
+    "reddit",
+    build_reddit_client,
+    credentials=("REDDIT_CLIENT_ID", "REDDIT_CLIENT_SECRET"),
+    thread_local=True,
+)
 
 
 def init_reddit_client(func: T.Callable[..., T.Any]) -> T.Callable[..., T.Any]:
     @wraps(func)
     def wrapper(*args: T.Any, **kwargs: T.Any) -> T.Any:
-        global reddit_client
         if not all([os.environ.get("REDDIT_CLIENT_ID"), os.environ.get("REDDIT_CLIENT_SECRET")]):
             print("Please set the environment variables for Reddit API credentials.")
             return None
-        else:
-            reddit_client = praw.Reddit(
-                client_id=os.environ["REDDIT_CLIENT_ID"],
-                client_secret=os.environ["REDDIT_CLIENT_SECRET"],
-                user_agent="python:finrobot:v0.1 (by /u/finrobot)",
-            )
-            print("Reddit client initialized")
-            return func(*args, **kwargs)
+        return func(*args, **kwargs)
 
     return wrapper
 
 
+@decorate_all_methods(single_flight("reddit", unless=("save_path",)))
 @decorate_all_methods(init_reddit_client)
 class RedditAdapter:
     """Reddit implementation of SocialRepository."""
@@ -4,6 +4,7 @@ import typing as T
 from datetime import datetime
 
 import requests
+from finrobot.data_access.data_source.rate_limits import rate_limited
 from tenacity import retry, stop_after_attempt, wait_random_exponential
 
 
@@ -39,6 +40,7 @@ def extract_speakers(cont: str) -> T.List[str]:
 
 
 @retry(wait=wait_random_exponential(min=1, max=5), stop=stop_after_attempt(2))
+@rate_limited("earnings_calls")
 def get_earnings_transcript(quarter: str, ticker: str, year: int) -> T.Any:
     """Get the earnings transcripts
 
@@ -0,0 +1,364 @@
+"""Filings Pipeline - Streaming download -> parse of EDGAR filings.
+
+Downloads run on a thread pool and every filing is handed to a parser process as soon as
+it arrives, so network waits and CPU-bound section extraction overlap. At most
+``queue_size`` raw filings are held at a time (downloading, waiting or being parsed): a
+download only starts once a slot is free, which bounds memory for large filing sets.
+
+Results are yielded in completion order; a filing that fails to download or parse is
+reported with its error instead of aborting the others::
+
+    for result in stream_filings(acc_nums, download=get_filing_partial, parse=extractor.get_section_texts_from_text):
+        ...
+
+``download`` may return a ``FilingRef`` to an entry of the filing store, so a parser
+process only receives a path and reads the filing itself. Plain text goes through the
+process pool's pipe, unless ``spool_dir`` is given: then it is written there and read back
+by the parser, which trades a disk round trip per filing for not copying the raw text
+between processes. Large results come back through shared memory. The parser pool is
+shared by all calls (see ``get_parser_pool``) instead of being started for every batch.
+"""
+
+import concurrent.futures
+import contextlib
+import functools
+import json
+import os
+import queue
+import tempfile
+import threading
+import time
+import typing as T
+from concurrent.futures import BrokenExecutor
+from dataclasses import asdict, dataclass, field
+from multiprocessing import resource_tracker, shared_memory
+
+from finrobot.data_access.data_source.domains.filings.filing_store import FilingStore
+
+DEFAULT_DOWNLOAD_WORKERS = 4
+DEFAULT_PARSE_WORKERS = 4
+# Results at least this large (JSON bytes) are returned through shared memory.
+SHARED_MEMORY_MIN_BYTES = 256 * 1024
+
+Sections = T.Dict[str, str]
+
+
+@dataclass(frozen=True)
+class FilingRef:
+    """Where a parser process reads a raw filing: a spooled file or a filing store entry."""
+
+    path: T.Optional[str] = None
+    store_root: T.Optional[str] = None
+    cik: T.Optional[str] = None
+    accession_number: T.Optional[str] = None
+    spooled: bool = False  # a temporary file, removed once read
+
+    @classmethod
+    def stored(cls, store_root: str, cik: T.Union[str, int], accession_number: T.Union[str, int]) -> "FilingRef":
+        return cls(store_root=store_root, cik=str(cik), accession_number=str(accession_number))
+
+    def read(self) -> str:
+        if self.path is not None:
+            try:
+                with open(self.path, "r", encoding="utf-8", newline="") as f:
+                    return f.read()
+            finally:
+                if self.spooled:
+                    self.discard()
+        text = _store(T.cast(str, self.store_root)).get(T.cast(str, self.cik), T.cast(str, self.accession_number))
+        if text is None:
+            raise FileNotFoundError(f"{self.cik}/{self.accession_number} is not in the filing store {self.store_root}")
+        return text
+
+    def discard(self) -> None:
+        """Remove a spooled file (no-op for store entries)."""
+        if self.spooled and self.path is not None:
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+
+
+@dataclass
+class FilingResult:
+    """Outcome of one filing; ``sections`` is ``None`` when ``error`` is set."""
+
+    index: int  # position in the requested accession numbers
+    accession_number: str
+    sections: T.Optional[Sections] = None
+    error: T.Optional[str] = None
+    download_seconds: float = 0.0
+    queue_seconds: float = 0.0  # downloaded, waiting for a parser
+    parse_seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class PipelineStats:
+    """Per-stage totals of one ``stream_filings`` run (seconds are summed over filings)."""
+
+    parsed: int = 0
+    failed: int = 0
+    download_seconds: float = 0.0
+    queue_seconds: float = 0.0
+    parse_seconds: float = 0.0
+    wall_seconds: float = 0.0
+    errors: T.Dict[str, str] = field(default_factory=dict)
+
+    def add(self, result: FilingResult) -> None:
+        self.download_seconds += result.download_seconds
+        self.queue_seconds += result.queue_seconds
+        self.parse_seconds += result.parse_seconds
+        if result.ok:
+            self.parsed += 1
+        else:
+            self.failed += 1
+            self.errors[result.accession_number] = T.cast(str, result.error)
+
+    def to_dict(self) -> T.Dict[str, T.Any]:
+        return asdict(self)
+
+
+def stream_filings(
+    accession_numbers: T.Sequence[str],
+    download: T.Callable[[str], T.Union[str, FilingRef]],
+    parse: T.Callable[[str], Sections],
+    download_workers: int = DEFAULT_DOWNLOAD_WORKERS,
+    parse_workers: int = DEFAULT_PARSE_WORKERS,
+    queue_size: T.Optional[int] = None,
+    stats: T.Optional[PipelineStats] = None,
+    parsers: T.Optional[concurrent.futures.Executor] = None,
+    spool_dir: T.Optional[str] = None,
+) -> T.Iterator[FilingResult]:
+    """Download and parse filings concurrently, yielding each result as soon as it is ready.
+
+    Parameters:
+        accession_numbers (Sequence[str]): filings to process.
+        download (Callable[[str], str | FilingRef]): accession number -> raw filing text, or a
+            reference the parser process reads it from (run on threads).
+        parse (Callable[[str], dict]): raw text -> {section name: text}; must be picklable,
+            it runs in a process pool.
+        download_workers (int): concurrent downloads.
+        parse_workers (int): parser processes of the shared pool.
+        queue_size (int | None): raw filings held at once, ``2 * parse_workers`` by default.
+        stats (PipelineStats | None): filled with per-stage timings as results arrive.
+        parsers (Executor | None): pool to parse on instead of ``get_parser_pool(parse_workers)``.
+        spool_dir (str | None): directory to spool downloaded text to for the parsers; by default
+            the text is sent to them directly.
+    """
+    stats = stats if stats is not None else PipelineStats()
+    if not accession_numbers:
+        return
+    started = time.perf_counter()
+    slots = threading.BoundedSemaphore(queue_size or 2 * parse_workers)
+    results: "queue.Queue[FilingResult]" = queue.Queue()
+    cancelled = threading.Event()
+
+    shared_pool = parsers is None
+    lease: T.ContextManager[concurrent.futures.Executor] = (
+        _leased_parser_pool(parse_workers) if parsers is None else contextlib.nullcontext(parsers)
+    )
+
+    with lease as pool, concurrent.futures.ThreadPoolExecutor(max_workers=download_workers) as downloads:
+
+        def finish(result: FilingResult) -> None:
+            slots.release()
+            results.put(result)
+
+        def fetch(index: int, accession_number: str) -> None:
+            slots.acquire()
+            result = FilingResult(index, accession_number)
+            if cancelled.is_set():
+                result.error = "cancelled"
+                finish(result)
+                return
+            begin = time.perf_counter()
+            try:
+                filing = download(accession_number)
+                if not filing:
+                    raise ValueError("empty filing")
+                ref = filing if isinstance(filing, FilingRef) or spool_dir is None else _spool(filing, spool_dir)
+                del filing  # the spooled file holds the raw filing from here on
+            except Exception as e:
+                result.download_seconds = time.perf_counter() - begin
+                result.error = f"download failed: {e!r}"
+                finish(result)
+                return
+            result.download_seconds = time.perf_counter() - begin
+            queued = time.time()
+            try:
+                future = pool.submit(_timed_parse, parse, ref)
+            except RuntimeError as e:  # broken or shut down pool
+                _discard(ref)
+                if shared_pool:
+                    _discard_parser_pool(pool)
+                result.error = f"parse failed: {e!r}"
+                finish(result)
+                return
+
+            def parsed(done: "concurrent.futures.Future[T.Any]") -> None:
+                if shared_pool and not done.cancelled() and isinstance(done.exception(), BrokenExecutor):
+                    _discard_parser_pool(pool)  # a parser process died
+                finish(_parsed(result, done, queued, ref))
+
+            future.add_done_callback(parsed)
+
+        for index, accession_number in enumerate(accession_numbers):
+            downloads.submit(fetch, index, accession_number)
+        try:
+            for _ in range(len(accession_numbers)):
+                result = results.get()
+                stats.add(result)
+                yield result
+        finally:
+            # an abandoned generator stops scheduling new downloads; running ones finish
+            cancelled.set()
+            stats.wall_seconds = time.perf_counter() - started
+
+
+def _timed_parse(parse: T.Callable[[str], Sections], ref: T.Union[str, FilingRef]) -> T.Tuple[T.Any, float, float]:
+    """Runs in the parser process: (packed sections, wall-clock start, seconds spent reading and parsing)."""
+    started, begin = time.time(), time.perf_counter()
+    sections = parse(ref.read() if isinstance(ref, FilingRef) else ref)
+    return _pack(sections), started, time.perf_counter() - begin
+
+
+def _parsed(
+    result: FilingResult, future: "concurrent.futures.Future[T.Any]", queued: float, ref: T.Union[str, FilingRef]
+) -> FilingResult:
+    try:
+        packed, started, seconds = future.result()
+        sections = _unpack(packed)
+    except Exception as e:
+        _discard(ref)  # the parser may not have reached the file
+        result.error = f"parse failed: {e!r}"
+        return result
+    result.sections = sections
+    result.queue_seconds = max(0.0, started - queued)
+    result.parse_seconds = seconds
+    return result
+
+
+def _spool(text: str, spool_dir: str) -> FilingRef:
+    fd, path = tempfile.mkstemp(prefix="filing-", suffix=".txt", dir=spool_dir)
+    with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+        f.write(text)
+    return FilingRef(path=path, spooled=True)
+
+
+def _discard(ref: T.Union[str, FilingRef]) -> None:
+    if isinstance(ref, FilingRef):
+        ref.discard()
+
+
+@functools.lru_cache(maxsize=8)
+def _store(root: str) -> FilingStore:
+    """Filing stores opened by this (parser) process; the index is re-read incrementally."""
+    return FilingStore(root)
+
+
+@dataclass(frozen=True)
+class _SharedResult:
+    name: str
+    size: int
+
+
+def _pack(sections: T.Any) -> T.Any:
+    """Move a large result into a shared memory block; small ones are pickled as usual.
+
+    The block stays registered with the resource tracker, which the parser processes share
+    with the parent (started in ``get_parser_pool``): ``_unpack`` unlinks and unregisters it,
+    and if the parent dies before that, the tracker unlinks it once the parser processes have
+    exited too, instead of leaking it in ``/dev/shm``.
+    """
+    try:
+        data = json.dumps(sections).encode("utf-8")
+    except (TypeError, ValueError):
+        return sections
+    if len(data) < SHARED_MEMORY_MIN_BYTES:
+        return sections
+    block = shared_memory.SharedMemory(create=True, size=len(data))
+    try:
+        T.cast(memoryview, block.buf)[: len(data)] = data
+    finally:
+        block.close()
+    return _SharedResult(block.name, len(data))
+
+
+def _unpack(packed: T.Any) -> T.Any:
+    if not isinstance(packed, _SharedResult):
+        return packed
+    block = shared_memory.SharedMemory(name=packed.name)
+    try:
+        return json.loads(bytes(T.cast(memoryview, block.buf)[: packed.size]).decode("utf-8"))
+    finally:
+        block.close()
+        block.unlink()
+
+
+_parser_pool: T.Optional[concurrent.futures.Executor] = None
+_parser_pool_workers = 0
+_parser_pool_users: T.Dict[concurrent.futures.Executor, int] = {}  # running stream_filings calls per pool
+_parser_pool_lock = threading.Lock()
+
+
+def get_parser_pool(workers: int = DEFAULT_PARSE_WORKERS) -> concurrent.futures.Executor:
+    """Return the process pool shared by ``stream_filings`` calls, started on first use.
+
+    Asking for a different number of workers replaces the pool; the old one is shut down
+    once the ``stream_filings`` calls still submitting to it are done.
+    """
+    with _parser_pool_lock:
+        return _current_parser_pool(workers)
+
+
+def _current_parser_pool(workers: int) -> concurrent.futures.Executor:
+    global _parser_pool, _parser_pool_workers
+    if _parser_pool is None or _parser_pool_workers != workers:
+        retired = _parser_pool
+        # parser processes must share this process' resource tracker, see ``_pack``
+        resource_tracker.ensure_running()
+        _parser_pool = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+        _parser_pool_workers = workers
+        if retired is not None and retired not in _parser_pool_users:
+            retired.shutdown(wait=False)
+    return _parser_pool
+
+
+@contextlib.contextmanager
+def _leased_parser_pool(workers: int) -> T.Iterator[concurrent.futures.Executor]:
+    """The shared pool, kept running until the caller is done even if another call replaces it."""
+    with _parser_pool_lock:
+        pool = _current_parser_pool(workers)
+        _parser_pool_users[pool] = _parser_pool_users.get(pool, 0) + 1
+    try:
+        yield pool
+    finally:
+        with _parser_pool_lock:
+            _parser_pool_users[pool] -= 1
+            retired = not _parser_pool_users[pool] and pool is not _parser_pool
+            if not _parser_pool_users[pool]:
+                del _parser_pool_users[pool]
+        if retired:
+            pool.shutdown(wait=False)
+
+
+def shutdown_parser_pool(wait: bool = True) -> None:
+    """Stop the shared parser pool; the next ``stream_filings`` call starts a new one."""
+    global _parser_pool
+    with _parser_pool_lock:
+        pool, _parser_pool = _parser_pool, None
+    if pool is not None:
+        pool.shutdown(wait=wait)
+
+
+def _discard_parser_pool(pool: concurrent.futures.Executor) -> None:
+    """Forget a broken shared pool so the next call starts a fresh one."""
+    global _parser_pool
+    with _parser_pool_lock:
+        if _parser_pool is pool:
+            _parser_pool = None
+    pool.shutdown(wait=False)
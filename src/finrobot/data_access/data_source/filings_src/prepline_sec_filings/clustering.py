@@ -0,0 +1,161 @@
+"""Title clustering - 1-D density clustering of title positions for TOC detection.
+
+``SECDocument.get_table_of_contents`` looks for densely packed Titles: title positions in
+the element list are clustered and the cluster holding both a "table of contents" and a
+risk title is the TOC. Positions are one-dimensional and already sorted, so DBSCAN's
+neighbourhood queries reduce to a sweep over gaps between neighbouring titles:
+
+- a title is a *core* title when at least ``min_samples`` titles (itself included) lie
+  within ``eps`` of it;
+- consecutive core titles no more than ``eps`` apart belong to the same cluster;
+- other titles within ``eps`` of a core title join its cluster (the left one on ties,
+  as DBSCAN expands clusters in input order), the rest are noise (``-1``).
+
+``gap_clusters`` returns the same labels as ``sklearn.cluster.DBSCAN(eps, min_samples)``
+on sorted positions without importing sklearn. ``dbscan_clusters`` keeps the original
+path available; select one per document with ``SECDocument.toc_clusterer``.
+
+Run ``python -m finrobot.data_access.data_source.filings_src.prepline_sec_filings.clustering
+<filing store dir>`` to compare both clusterers on stored filings.
+"""
+
+import sys
+import time
+import typing as T
+from dataclasses import asdict, dataclass, field
+
+import numpy as np
+import numpy.typing as npt
+
+DEFAULT_EPS = 6.0
+# sklearn's DBSCAN default, used by the original get_table_of_contents
+DEFAULT_MIN_SAMPLES = 5
+
+Clusterer = T.Callable[[npt.NDArray[np.float32], float, int], npt.NDArray[np.int_]]
+
+
+def gap_clusters(
+    positions: npt.NDArray[np.float32], eps: float = DEFAULT_EPS, min_samples: int = DEFAULT_MIN_SAMPLES
+) -> npt.NDArray[np.int_]:
+    """Cluster labels of 1-D ``positions`` (shape ``(n,)`` or ``(n, 1)``); ``-1`` marks noise."""
+    x = np.asarray(positions, dtype=np.float64).reshape(-1)
+    labels = np.full(len(x), -1, dtype=np.int_)
+    if len(x) == 0:
+        return labels
+    order = np.argsort(x, kind="stable")
+    xs = x[order]
+
+    # neighbours within eps, bounds included (as in sklearn's radius queries)
+    counts = np.searchsorted(xs, xs + eps, side="right") - np.searchsorted(xs, xs - eps, side="left")
+    is_core = counts >= min_samples
+    core_x = xs[is_core]
+    if len(core_x) == 0:
+        return labels
+
+    # a new cluster starts wherever the gap to the previous core title exceeds eps
+    core_labels = np.concatenate(([0], np.cumsum(np.diff(core_x) > eps)))
+    sorted_labels = np.full(len(xs), -1, dtype=np.int_)
+    sorted_labels[is_core] = core_labels
+
+    border = np.flatnonzero(~is_core)
+    prev_core = np.searchsorted(core_x, xs[border], side="right") - 1
+    next_core = prev_core + 1
+    has_prev = prev_core >= 0
+    reach_prev = has_prev & (xs[border] - core_x[np.maximum(prev_core, 0)] <= eps)
+    has_next = next_core < len(core_x)
+    reach_next = has_next & (core_x[np.minimum(next_core, len(core_x) - 1)] - xs[border] <= eps)
+    sorted_labels[border[reach_prev]] = core_labels[prev_core[reach_prev]]
+    only_next = reach_next & ~reach_prev
+    sorted_labels[border[only_next]] = core_labels[next_core[only_next]]
+
+    labels[order] = sorted_labels
+    return labels
+
+
+def dbscan_clusters(
+    positions: npt.NDArray[np.float32], eps: float = DEFAULT_EPS, min_samples: int = DEFAULT_MIN_SAMPLES
+) -> npt.NDArray[np.int_]:
+    """Cluster labels from ``sklearn.cluster.DBSCAN`` (imported on first use)."""
+    from sklearn.cluster import DBSCAN
+
+    x = np.asarray(positions, dtype=np.float32).reshape(-1, 1)
+    return T.cast(npt.NDArray[np.int_], DBSCAN(eps=eps, min_samples=min_samples).fit_predict(x))
+
+
+CLUSTERERS: T.Dict[str, Clusterer] = {"gap": gap_clusters, "dbscan": dbscan_clusters}
+DEFAULT_CLUSTERER = "gap"
+
+
+def get_clusterer(name: str) -> Clusterer:
+    """Clusterer registered under ``name`` (``"gap"`` or ``"dbscan"``)."""
+    try:
+        return CLUSTERERS[name]
+    except KeyError:
+        raise ValueError(f"Unknown title clusterer {name!r}, must be one of {', '.join(CLUSTERERS)}") from None
+
+
+@dataclass
+class ClusterBenchmark:
+    """Timings of each clusterer over the same title positions."""
+
+    documents: int = 0
+    titles: int = 0
+    seconds: T.Dict[str, float] = field(default_factory=dict)
+    mismatches: T.List[int] = field(default_factory=list)  # documents whose labels differ
+
+    def to_dict(self) -> T.Dict[str, T.Any]:
+        return asdict(self)
+
+
+def benchmark_clusterers(
+    corpus: T.Iterable[npt.NDArray[np.float32]],
+    clusterers: T.Sequence[str] = ("gap", "dbscan"),
+    repeat: int = 3,
+    eps: float = DEFAULT_EPS,
+    min_samples: int = DEFAULT_MIN_SAMPLES,
+) -> ClusterBenchmark:
+    """Time ``clusterers`` on the title positions of each document (best of ``repeat``) and
+    record the documents where their labels disagree with the first clusterer."""
+    result = ClusterBenchmark(seconds={name: 0.0 for name in clusterers})
+    for n, positions in enumerate(corpus):
+        result.documents += 1
+        result.titles += len(positions)
+        labels = []
+        for name in clusterers:
+            clusterer = get_clusterer(name)
+            best = float("inf")
+            for _ in range(repeat):
+                begin = time.perf_counter()
+                out = clusterer(positions, eps, min_samples)
+                best = min(best, time.perf_counter() - begin)
+            result.seconds[name] += best
+            labels.append(out)
+        if any(not np.array_equal(labels[0], other) for other in labels[1:]):
+            result.mismatches.append(n)
+    return result
+
+
+def _stored_title_positions(root: str) -> T.Iterator[npt.NDArray[np.float32]]:
+    """Title positions of every filing in the filing store at ``root``."""
+    from finrobot.data_access.data_source.domains.filings.filing_store import FilingStore
+
+    from .sec_document import VALID_FILING_TYPES, SECDocument, to_sklearn_format
+
+    store = FilingStore(root)
+    for entry in store.entries():
+        text = store.get(entry["cik"], entry["accession_number"])
+        if not text:
+            continue
+        document = SECDocument.from_string(text)
+        if document.filing_type in VALID_FILING_TYPES:
+            yield to_sklearn_format(document.elements)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        sys.exit(f"usage: python -m {__spec__.name if __spec__ else 'clustering'} <filing store dir>")
+    report = benchmark_clusterers(list(_stored_title_positions(sys.argv[1])))
+    print(f"{report.documents} filings, {report.titles} titles")
+    for name, seconds in report.seconds.items():
+        print(f"{name:>8}: {seconds * 1000:.1f} ms")
+    print(f"label mismatches: {report.mismatches or 'none'}")
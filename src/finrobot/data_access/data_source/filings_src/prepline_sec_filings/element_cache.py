@@ -0,0 +1,188 @@
+"""Element cache - Parsed SECDocument elements keyed by a hash of the filing text.
+
+``SECDocument.from_string`` partitions the whole filing HTML, which dominates the cost of
+``pipeline_api``. The partitioned element list (type and text, in document order) and the
+filing type only depend on the input, so they are stored under the SHA-256 of the text:
+extracting other sections or new regex sections from the same filing rebuilds the
+document from the stored elements instead of parsing it again.
+
+Entries are kept in a small in-memory LRU, and also on disk (gzip JSON) under the
+``elements`` subdirectory of ``FINROBOT_SEC_CACHE_DIR`` when it is set.
+"""
+
+import gzip
+import hashlib
+import io
+import json
+import os
+import threading
+import typing as T
+from collections import OrderedDict
+
+import unstructured.documents.elements as unstructured_elements
+from finrobot.data_access.data_source.domains.filings.submissions import SEC_CACHE_ENV
+from finrobot.infrastructure.io.files import atomic_write
+from unstructured.documents.elements import ListItem, NarrativeText, Text, Title
+
+# Bump when the parser or the stored format changes so older entries are ignored.
+ELEMENT_CACHE_VERSION = 1
+DEFAULT_MAX_ENTRIES = 32
+
+ELEMENT_TYPES: T.Dict[str, T.Type[T.Any]] = {cls.__name__: cls for cls in (Text, Title, NarrativeText, ListItem)}
+
+# (filing type, [(element type, text), ...])
+ParsedElements = T.Tuple[T.Optional[str], T.List[T.Tuple[str, str]]]
+DocumentT = T.TypeVar("DocumentT")
+
+
+class ElementCache:
+    """Serialized element lists of parsed filings.
+
+    Parameters:
+        root (str | PathLike | None): directory persisting entries across processes.
+        max_entries (int): parsed filings kept in memory.
+    """
+
+    def __init__(
+        self,
+        root: T.Optional[T.Union[str, "os.PathLike[str]"]] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        self.root = os.fspath(root) if root else None
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, ParsedElements]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def document(self, text: str, document_cls: T.Type[DocumentT], streaming: bool = False) -> DocumentT:
+        """``document_cls.from_string(text)``, rebuilt from cached elements when possible.
+        With ``streaming`` the filing is partitioned by ``document_cls.from_stream`` instead."""
+        key = content_key(text, variant="stream" if streaming else "")
+        parsed = self.get(key)
+        if parsed is not None:
+            filing_type, records = parsed
+            document = document_cls.from_elements([_element_type(kind)(value) for kind, value in records])
+            document.filing_type = filing_type
+            return T.cast(DocumentT, document)
+
+        if streaming:
+            document = document_cls.from_stream(io.StringIO(text))
+        else:
+            document = document_cls.from_string(text)
+        parsed = _serialize(document)
+        if parsed is not None:
+            self.put(key, parsed)
+        return T.cast(DocumentT, document)
+
+    def get(self, key: str) -> T.Optional[ParsedElements]:
+        with self._lock:
+            parsed = self._entries.get(key)
+            if parsed is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return parsed
+        parsed = self._read(key)
+        with self._lock:
+            if parsed is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._remember(key, parsed)
+        return parsed
+
+    def put(self, key: str, parsed: ParsedElements) -> None:
+        with self._lock:
+            self._remember(key, parsed)
+        self._write(key, parsed)
+
+    def clear(self) -> None:
+        """Forget the in-memory entries (files under ``root`` are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    # ---------------------------------------------------------------- internals
+
+    def _remember(self, key: str, parsed: ParsedElements) -> None:
+        self._entries[key] = parsed
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _path(self, key: str) -> T.Optional[str]:
+        return os.path.join(self.root, key[:2], f"{key}.json.gz") if self.root else None
+
+    def _read(self, key: str) -> T.Optional[ParsedElements]:
+        path = self._path(key)
+        if path is None or not os.path.exists(path):
+            return None
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            payload = json.load(f)
+        return payload["filing_type"], [(kind, value) for kind, value in payload["elements"]]
+
+    def _write(self, key: str, parsed: ParsedElements) -> None:
+        path = self._path(key)
+        if path is None:
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        def write(tmp: str) -> None:
+            with gzip.open(tmp, "wt", encoding="utf-8") as f:
+                json.dump({"filing_type": parsed[0], "elements": parsed[1]}, f)
+
+        atomic_write(path, write)
+
+
+def content_key(text: str, variant: str = "") -> str:
+    """Cache key of a filing: SHA-256 of the cache version, the parser variant and the text."""
+    digest = hashlib.sha256(f"v{ELEMENT_CACHE_VERSION}\n".encode())
+    if variant:
+        digest.update(f"{variant}\n".encode())
+    digest.update(text.encode("utf-8", errors="surrogatepass"))
+    return digest.hexdigest()
+
+
+def _serialize(document: T.Any) -> T.Optional[ParsedElements]:
+    """(filing type, [(type, text), ...]), or ``None`` for elements that cannot be rebuilt."""
+    elements = getattr(document, "elements", None)
+    if not isinstance(elements, list):
+        return None
+    records = []
+    for element in elements:
+        kind = type(element).__name__
+        if _element_type(kind) is not type(element) or not isinstance(getattr(element, "text", None), str):
+            return None
+        records.append((kind, element.text))
+    filing_type = getattr(document, "filing_type", None)
+    return (filing_type if isinstance(filing_type, str) else None), records
+
+
+def _element_type(kind: str) -> T.Type[T.Any]:
+    """Element class named ``kind`` (``Title``, ``NarrativeText``, ``Table``, ...), ``Text`` if unknown."""
+    cls = ELEMENT_TYPES.get(kind) or getattr(unstructured_elements, kind, None)
+    return cls if isinstance(cls, type) else Text
+
+
+_default_cache: T.Optional[ElementCache] = None
+_default_lock = threading.Lock()
+
+
+def configure_element_cache(
+    root: T.Optional[T.Union[str, "os.PathLike[str]"]] = None, max_entries: int = DEFAULT_MAX_ENTRIES
+) -> ElementCache:
+    """Replace the process-wide element cache; ``root=None`` keeps entries in memory only."""
+    global _default_cache
+    with _default_lock:
+        _default_cache = ElementCache(root, max_entries=max_entries)
+    return _default_cache
+
+
+def get_element_cache() -> ElementCache:
+    """Return the process-wide element cache, persisted under ``FINROBOT_SEC_CACHE_DIR`` if set."""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            root = os.environ.get(SEC_CACHE_ENV)
+            _default_cache = ElementCache(os.path.join(root, "elements") if root else None)
+        return _default_cache
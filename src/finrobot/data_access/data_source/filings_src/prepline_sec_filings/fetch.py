@@ -7,10 +7,12 @@ import webbrowser
 from typing import Dict, Final, List, Optional, Tuple, Union
 
 import requests
+from finrobot.data_access.data_source.domains.filings.cik_index import get_cik_index
+from finrobot.data_access.data_source.domains.filings.filing_store import get_filing_store
 from finrobot.data_access.data_source.filings_src.prepline_sec_filings.sec_document import (
     VALID_FILING_TYPES,
 )
-from ratelimit import limits, sleep_and_retry
+from finrobot.data_access.data_source.rate_limits import rate_limited
 
 SEC_ARCHIVE_URL: Final[str] = "https://www.sec.gov/Archives/edgar/data"
 SEC_SEARCH_URL: Final[str] = "http://www.sec.gov/cgi-bin/browse-edgar"
@@ -22,12 +24,17 @@ def get_filing(accession_number: Union[str, int], cik: Union[str, int], company:
     limits specified on the SEC website.
     ref: https://www.sec.gov/os/accessing-edgar-data"""
 
-    session = _get_session(company, email)
-    return T.cast(str, _get_filing(session, cik, accession_number))
+    store = get_filing_store()
+    text = store.get(cik, accession_number) if store is not None else None
+    if text is None:
+        session = _get_session(company, email)
+        text = T.cast(str, _get_filing(session, cik, accession_number))
+        if store is not None:
+            store.put(cik, accession_number, text)
+    return text
 
 
-@sleep_and_retry  # type: ignore[untyped-decorator]
-@limits(calls=10, period=1)  # type: ignore[untyped-decorator]
+@rate_limited("sec")
 def _get_filing(session: requests.Session, cik: Union[str, int], accession_number: Union[str, int]) -> str:
     """Wrapped so filings can be retrieved with an existing session."""
     url = archive_url(cik, accession_number)
@@ -45,9 +52,17 @@ def _get_filing(session: requests.Session, cik: Union[str, int], accession_numbe
     return response.text
 
 
-@sleep_and_retry  # type: ignore[untyped-decorator]
-@limits(calls=2, period=1)  # type: ignore[untyped-decorator]
 def get_cik_by_ticker(ticker: str) -> str:
+    """Gets a CIK number from a stock ticker, using the SEC bulk ticker file and falling
+    back to a search on the SEC website for tickers it does not list."""
+    cik = get_cik_index().cik(ticker)
+    if cik is not None:
+        return cik
+    return _search_cik_by_ticker(ticker)
+
+
+@rate_limited("sec")
+def _search_cik_by_ticker(ticker: str) -> str:
     """Gets a CIK number from a stock ticker by running a search on the SEC website."""
     cik_re = re.compile(r".*CIK=(\d{10}).*")
     url = _search_url(ticker)
@@ -76,8 +91,7 @@ def get_cik_by_ticker(ticker: str) -> str:
     return str(results[0])
 
 
-@sleep_and_retry  # type: ignore[untyped-decorator]
-@limits(calls=10, period=1)  # type: ignore[untyped-decorator]
+@rate_limited("sec")
 def get_forms_by_cik(session: requests.Session, cik: Union[str, int]) -> Dict[str, str]:
     """Gets retrieves dict of recent SEC form filings for a given cik number."""
     json_name = f"CIK{cik}.json"
@@ -124,7 +138,7 @@ def get_recent_cik_and_acc_by_ticker(
     The retrieved_form_type may be an amended version of requested form_type, e.g. 10-Q/A for 10-Q.
     """
     session = _get_session(company, email)
-    cik = get_cik_by_ticker(session, ticker)
+    cik = get_cik_by_ticker(ticker)
     acc_num, retrieved_form_type = _get_recent_acc_num_by_cik(session, cik, _form_types(form_type))
     return cik, acc_num, retrieved_form_type
 
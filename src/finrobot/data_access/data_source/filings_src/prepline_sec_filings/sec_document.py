@@ -2,7 +2,7 @@ import re
 import sys
 import typing as T
 from functools import partial
-from typing import Any, Iterable, Iterator, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 if sys.version_info < (3, 8):
     from typing_extensions import Final
@@ -15,10 +15,20 @@ import numpy as np
 import numpy.typing as npt
 
 # from src.prepline_sec_filings.title import is_possible_title
+from finrobot.data_access.data_source.filings_src.prepline_sec_filings.clustering import (
+    DEFAULT_CLUSTERER,
+    DEFAULT_EPS,
+    DEFAULT_MIN_SAMPLES,
+    get_clusterer,
+)
 from finrobot.data_access.data_source.filings_src.prepline_sec_filings.sections import (
     SECSection,
 )
-from sklearn.cluster import DBSCAN
+from finrobot.data_access.data_source.filings_src.prepline_sec_filings.streaming import (
+    DEFAULT_CHUNK_SIZE,
+    PartitionStats,
+    iter_filing_elements,
+)
 from unstructured.cleaners.core import clean
 from unstructured.documents.elements import (
     Element,
@@ -57,15 +67,37 @@ def _raise_for_invalid_filing_type(filing_type: Optional[str]) -> None:
 
 class SECDocument(HTMLDocument):
     filing_type: Optional[str] = None
+    # "gap" (sorted sweep) or "dbscan" (sklearn); both yield the same title clusters
+    toc_clusterer: str = DEFAULT_CLUSTERER
+    _element_features: Optional["ElementFeatures"] = None
+    _section_index: Optional["SectionIndex"] = None
+
+    @classmethod
+    def from_stream(cls, source: T.Union[str, T.TextIO], chunk_size: int = DEFAULT_CHUNK_SIZE) -> "SECDocument":
+        """Builds the document with the streaming partitioner: the filing is read in chunks and
+        never parsed into a full HTML tree, which keeps peak memory low on very large filings."""
+        stats = PartitionStats()
+        document: SECDocument = cls.from_elements(
+            list(iter_filing_elements(source, chunk_size=chunk_size, stats=stats))
+        )
+        document.filing_type = stats.filing_type
+        return document
+
+    def element_features(self) -> "ElementFeatures":
+        """Per-element feature table of this document, computed on first use."""
+        if self._element_features is None or self._element_features.source is not self.elements:
+            self._element_features = ElementFeatures(self.elements, self.filing_type)
+        return self._element_features
 
     def _filter_table_of_contents(self, elements: List[Text]) -> List[Text]:
         """Filter out unnecessary elements in the table of contents using keyword search."""
         if self.filing_type in REPORT_TYPES:
+            features = self.element_features()
             # NOTE(yuming): Narrow TOC as all elements within
             # the first two titles that contain the keyword 'part i\b'.
             start, end = None, None
             for i, element in enumerate(elements):
-                if bool(re.match(r"(?i)part i\b", clean_sec_text(element.text))):
+                if bool(re.match(r"(?i)part i\b", features.clean(element))):
                     if start is None:
                         # NOTE(yuming): Found the start of the TOC section.
                         start = i
@@ -77,9 +109,10 @@ class SECDocument(HTMLDocument):
         elif self.filing_type in S1_TYPES:
             # NOTE(yuming): Narrow TOC as all elements within
             # the first pair of duplicated titles that contain the keyword 'prospectus'.
+            features = self.element_features()
             title_indices = defaultdict(list)
             for i, element in enumerate(elements):
-                clean_title_text = clean_sec_text(element.text).lower()
+                clean_title_text = features.clean(element)
                 title_indices[clean_title_text].append(i)
             duplicate_title_indices = {k: v for k, v in title_indices.items() if len(v) > 1}
             for title, indices in duplicate_title_indices.items():
@@ -97,12 +130,13 @@ class SECDocument(HTMLDocument):
         """Identifies text sections that are likely the table of contents."""
         out_cls = self.__class__
         _raise_for_invalid_filing_type(self.filing_type)
-        title_locs = to_sklearn_format(self.elements)
+        features = self.element_features()
+        title_locs = to_sklearn_format(self.elements, features)
         if len(title_locs) == 0:
             return out_cls.from_elements([])
         # NOTE(alan): Might be a way to do the same thing that doesn't involve the transformations
         # necessary to get it into sklearn. We're just looking for densely packed Titles.
-        res = DBSCAN(eps=6.0).fit_predict(title_locs)
+        res = get_clusterer(self.toc_clusterer)(title_locs, DEFAULT_EPS, DEFAULT_MIN_SAMPLES)
         for i in range(res.max() + 1):
             idxs = cluster_num_to_indices(i, title_locs, res)
             cluster_elements: List[Text] = [self.elements[i] for i in idxs]
@@ -110,11 +144,11 @@ class SECDocument(HTMLDocument):
                 [
                     # TODO(alan): Maybe swap risk title out for something more generic? It helps to
                     # have 2 markers though, I think.
-                    is_risk_title(el.text, self.filing_type)
+                    features.risk_title(el)
                     for el in cluster_elements
                     if isinstance(el, Title)
                 ]
-            ) and any([is_toc_title(el.text) for el in cluster_elements if isinstance(el, Title)]):
+            ) and any([features.toc_title(el) for el in cluster_elements if isinstance(el, Title)]):
                 return out_cls.from_elements(self._filter_table_of_contents(cluster_elements))
         return out_cls.from_elements(self._filter_table_of_contents(self.elements))
 
@@ -122,15 +156,16 @@ class SECDocument(HTMLDocument):
         """Identifies narrative text sections that fall under the given section heading without
         using the table of contents."""
         _raise_for_invalid_filing_type(self.filing_type)
+        features = self.element_features()
         # NOTE(robinson) - We are not skipping table text because the risk narrative section
         # usually does not contain any tables and sometimes tables are used for
         # title formating
         section_elements: List[NarrativeText] = list()
         in_section = False
         for element in self.elements:
-            is_title = is_possible_title(element.text)
+            is_title = features.title(element)
             if in_section:
-                if is_title and is_item_title(element.text, self.filing_type):
+                if is_title and features.item_title(element):
                     if section_elements:
                         return section_elements
                     else:
@@ -138,7 +173,7 @@ class SECDocument(HTMLDocument):
                 elif isinstance(element, NarrativeText) or isinstance(element, ListItem):
                     section_elements.append(element)
 
-            if is_title and is_section_elem(section, element, self.filing_type):
+            if is_title and is_section_elem(section, element, self.filing_type, features):
                 in_section = True
 
         return section_elements
@@ -147,14 +182,15 @@ class SECDocument(HTMLDocument):
         """Identifies section title and next section title in TOC under the given section heading"""
         # Note(yuming): The matching section and the section after the matching section
         # can be thought of as placeholders to look for matching content below the toc.
-        section_toc = first(el for el in toc.elements if is_section_elem(section, el, self.filing_type))
+        features = self.element_features()
+        section_toc = first(el for el in toc.elements if is_section_elem(section, el, self.filing_type, features))
         if section_toc is None:
             # NOTE(yuming): unable to identify the section in TOC
             return (None, None)
 
         after_section_toc = toc.after_element(section_toc)
         next_section_toc = first(
-            el for el in after_section_toc.elements if not is_section_elem(section, el, self.filing_type)
+            el for el in after_section_toc.elements if not is_section_elem(section, el, self.filing_type, features)
         )
         if next_section_toc is None:
             # NOTE(yuming): unable to identify the next section title in TOC,
@@ -186,7 +222,7 @@ class SECDocument(HTMLDocument):
         # NOTE(yuming): map section_toc to the section title after TOC
         # to find the start of the section
         section_start_element = get_element_by_title(
-            reversed(doc_after_section_toc.elements), section_toc.text, self.filing_type
+            reversed(doc_after_section_toc.elements), section_toc.text, self.filing_type, self.element_features()
         )
         if section_start_element is None:
             return []
@@ -203,7 +239,7 @@ class SECDocument(HTMLDocument):
         # NOTE(yuming): map next_section_toc to the section title after TOC
         # to find the start of the next section, which is also the end of the section we want
         section_end_element = get_element_by_title(
-            doc_after_section_heading.elements, next_section_toc.text, self.filing_type
+            doc_after_section_heading.elements, next_section_toc.text, self.filing_type, self.element_features()
         )
 
         if section_end_element is None:
@@ -213,6 +249,22 @@ class SECDocument(HTMLDocument):
 
         return get_narrative_texts(doc_after_section_heading.before_element(section_end_element))
 
+    def get_section_narratives(
+        self, sections: Iterable[SECSection], exact_headings: bool = False
+    ) -> Dict[SECSection, List[NarrativeText]]:
+        """Narratives of several sections at once, as ``get_section_narrative`` returns them for
+        each section. The table of contents and the element lookups are computed once per
+        document instead of once per section.
+
+        With ``exact_headings`` sections are sliced at the matched headings themselves instead
+        of the first element equal to them, so a section whose body heading repeats its table
+        of contents entry is extracted rather than returned empty."""
+        _raise_for_invalid_filing_type(self.filing_type)
+        if self._section_index is None or self._section_index.source is not self.elements:
+            self._section_index = SectionIndex(self)
+        index = self._section_index
+        return {section: index.narrative(section, exact_headings) for section in sections}
+
     def get_risk_narrative(self) -> List[NarrativeText]:
         """Identifies narrative text sections that fall under the "risk" heading"""
         return self.get_section_narrative(SECSection.RISK_FACTORS)
@@ -245,8 +297,11 @@ class SECDocument(HTMLDocument):
             if section == SECSection.FORM_SUMMARY:
                 return True
             if section == SECSection.EXHIBITS:
+                features = self.element_features()
                 form_summary_section = first(
-                    el for el in toc.elements if is_section_elem(SECSection.FORM_SUMMARY, el, self.filing_type)
+                    el
+                    for el in toc.elements
+                    if is_section_elem(SECSection.FORM_SUMMARY, el, self.filing_type, features)
                 )
                 # if FORM_SUMMARY is not in toc, the last section is EXHIBITS
                 if form_summary_section is None:
@@ -258,6 +313,133 @@ class SECDocument(HTMLDocument):
         return False
 
 
+class ElementFeatures:
+    """Per-element features used by section matching, computed in one pass over a document.
+
+    Section matching otherwise cleans and classifies the same element text for every TOC
+    entry and every section. Row ``i`` holds, for ``elements[i]``: the cleaned lowercase
+    text, the text matched against section patterns (item prefix removed for reports),
+    and the ``is_possible_title``, item-title and risk-title flags. Elements are looked up
+    by identity, so sub-documents from ``after_element``/``before_element`` share the table;
+    other elements fall back to classifying their text.
+    """
+
+    def __init__(self, elements: List[Text], filing_type: Optional[str]) -> None:
+        _raise_for_invalid_filing_type(filing_type)
+        self.filing_type = filing_type
+        self.source = elements  # rebuilt when the document gets a new element list
+        self.positions: Dict[int, int] = {}
+        self.cleaned: List[str] = []
+        self.section_text: List[str] = []
+        self.is_title: List[bool] = []
+        self.is_item_title: List[bool] = []
+        self.is_risk_title: List[bool] = []
+        report = filing_type in REPORT_TYPES
+        for i, element in enumerate(elements):
+            self.positions.setdefault(id(element), i)
+            text = element.text
+            cleaned = clean_sec_text(text, lowercase=True)
+            self.cleaned.append(cleaned)
+            self.is_title.append(is_possible_title(text))
+            if report:
+                self.section_text.append(clean_sec_text(remove_item_from_section_text(text), lowercase=True))
+                self.is_item_title.append(ITEM_TITLE_RE.match(cleaned) is not None)
+                self.is_risk_title.append(is_10k_risk_title(cleaned))
+            else:
+                self.section_text.append(cleaned)
+                self.is_item_title.append(is_s1_section_title(text))
+                self.is_risk_title.append(is_s1_risk_title(cleaned))
+
+    def row(self, element: Any) -> Optional[int]:
+        return self.positions.get(id(element))
+
+    def clean(self, element: Any) -> str:
+        row = self.row(element)
+        return self.cleaned[row] if row is not None else clean_sec_text(element.text, lowercase=True)
+
+    def title(self, element: Any) -> bool:
+        row = self.row(element)
+        return self.is_title[row] if row is not None else is_possible_title(element.text)
+
+    def item_title(self, element: Any) -> bool:
+        row = self.row(element)
+        return self.is_item_title[row] if row is not None else is_item_title(element.text, self.filing_type)
+
+    def risk_title(self, element: Any) -> bool:
+        row = self.row(element)
+        return self.is_risk_title[row] if row is not None else is_risk_title(element.text, self.filing_type)
+
+    def toc_title(self, element: Any) -> bool:
+        return self.clean(element) in ("table of contents", "index")
+
+
+class SectionIndex:
+    """Table of contents and per-element lookups of one document, for multi-section extraction.
+
+    ``get_section_narrative`` recomputes the TOC (title detection and clustering) and copies the
+    element list in ``after_element`` for each section. Here the TOC and element positions are
+    computed once and every section becomes a slice of ``elements``.
+
+    NOTE: slices start and end at the first element *equal* to the matched one (same text and
+    category), as ``after_element``/``before_element`` locate elements with ``elements.index``.
+    When a body heading is equal to its TOC entry, the section therefore starts at the TOC
+    entry, exactly as in ``get_section_narrative``; ``exact_headings`` slices at the matched
+    elements themselves instead.
+    """
+
+    def __init__(self, document: SECDocument) -> None:
+        self.document = document
+        self.filing_type = document.filing_type
+        self.source = document.elements  # rebuilt when the document gets a new element list
+        self.elements: List[Text] = list(document.elements)
+        self.features = document.element_features()
+        self.toc = document.get_table_of_contents()
+        self.has_toc = bool(self.toc.pages)
+
+    def narrative(self, section: SECSection, exact_headings: bool = False) -> List[NarrativeText]:
+        """``document.get_section_narrative(section)``, or sliced at the matched headings with ``exact_headings``."""
+        document = self.document
+        if not self.has_toc:
+            return document.get_section_narrative_no_toc(section)
+
+        section_toc, next_section_toc = document._get_toc_sections(section, self.toc)
+        if section_toc is None:
+            return []
+        elements = self.elements
+        toc_entry = next_section_toc if next_section_toc else section_toc
+        after_toc = (T.cast(int, self.features.row(toc_entry)) if exact_headings else elements.index(toc_entry)) + 1
+        # the last element after the TOC entry that matches the section title
+        heading = self._find_title(section_toc.text, range(len(elements) - 1, after_toc - 1, -1))
+        if heading is None:
+            return []
+        start = heading if exact_headings else elements.index(elements[heading])
+
+        if document._is_last_section_in_report(section, self.toc) or next_section_toc is None:
+            return self._narrative_texts(start + 1, len(elements), up_to_next_title=True)
+        end = self._find_title(next_section_toc.text, range(start + 1, len(elements)))
+        if end is None:
+            return self._narrative_texts(start + 1, len(elements), up_to_next_title=True)
+        return self._narrative_texts(start + 1, end if exact_headings else elements.index(elements[end], start + 1))
+
+    def _find_title(self, title: str, positions: Iterable[int]) -> Optional[int]:
+        """``get_element_by_title`` over element positions."""
+        match = match_10k_toc_title_to_section if self.filing_type in REPORT_TYPES else match_s1_toc_title_to_section
+        clean_title = clean_sec_text(title, lowercase=True)
+        cleaned = self.features.cleaned
+        return T.cast(Optional[int], first(i for i in positions if match(cleaned[i], clean_title)))
+
+    def _narrative_texts(self, start: int, stop: int, up_to_next_title: bool = False) -> List[NarrativeText]:
+        """``get_narrative_texts`` of ``elements[start:stop]``."""
+        narrative_texts: List[Text] = []
+        for el in self.elements[start:stop]:
+            if isinstance(el, NarrativeText) or isinstance(el, ListItem):
+                narrative_texts.append(el)
+            elif up_to_next_title:
+                break
+        # ListItems included, as in ``get_narrative_texts``
+        return T.cast(List[NarrativeText], narrative_texts)
+
+
 def get_narrative_texts(doc: HTMLDocument, up_to_next_title: Optional[bool] = False) -> List[Text]:
     """Returns a list of NarrativeText or ListItem from document,
     with option to return narrative texts only up to next Title element."""
@@ -273,9 +455,16 @@ def get_narrative_texts(doc: HTMLDocument, up_to_next_title: Optional[bool] = Fa
         return [el for el in doc.elements if isinstance(el, NarrativeText) or isinstance(el, ListItem)]
 
 
-def is_section_elem(section: SECSection, elem: Text, filing_type: Optional[str]) -> bool:
+def is_section_elem(
+    section: SECSection, elem: Text, filing_type: Optional[str], features: Optional[ElementFeatures] = None
+) -> bool:
     """Checks to see if a text element matches the section title for a given filing type"""
     _raise_for_invalid_filing_type(filing_type)
+    row = features.row(elem) if features is not None else None
+    if features is not None and row is not None:
+        if section is SECSection.RISK_FACTORS:
+            return features.is_risk_title[row]
+        return bool(re.search(section.pattern, features.section_text[row]))
     if section is SECSection.RISK_FACTORS:
         return is_risk_title(elem.text, filing_type=filing_type)
     else:
@@ -333,13 +522,15 @@ def is_s1_risk_title(title: str) -> bool:
     return title.strip().lower() == "risk factors"
 
 
-def to_sklearn_format(elements: List[Element]) -> npt.NDArray[np.float32]:
+def to_sklearn_format(elements: List[Element], features: Optional[ElementFeatures] = None) -> npt.NDArray[np.float32]:
     """The input to clustering needs to be locations in euclidean space, so we need to interpret
     the locations of Titles within the sequence of elements as locations in 1d space
     """
-    is_title: npt.NDArray[np.bool_] = np.array(
-        [is_possible_title(el.text) for el in elements][: len(elements)], dtype=bool
-    )
+    if features is not None:
+        titles = [features.title(el) for el in elements]
+    else:
+        titles = [is_possible_title(el.text) for el in elements]
+    is_title: npt.NDArray[np.bool_] = np.array(titles[: len(elements)], dtype=bool)
     title_locs = np.arange(len(is_title)).astype(np.float32)[is_title].reshape(-1, 1)
     return title_locs
 
@@ -388,6 +579,7 @@ def get_element_by_title(
     elements: Iterator[Element],
     title: str,
     filing_type: Optional[str],
+    features: Optional[ElementFeatures] = None,
 ) -> Optional[Element]:
     """Get element from Element list whose text approximately matches title"""
     _raise_for_invalid_filing_type(filing_type)
@@ -395,11 +587,14 @@ def get_element_by_title(
         match = match_10k_toc_title_to_section
     elif filing_type in S1_TYPES:
         match = match_s1_toc_title_to_section
+    clean_title = clean_sec_text(title, lowercase=True)
+    if features is not None:
+        return T.cast(Optional[Element], first(el for el in elements if match(features.clean(el), clean_title)))
     return first(
         el
         for el in elements
         if match(
             clean_sec_text(el.text, lowercase=True),
-            clean_sec_text(title, lowercase=True),
+            clean_title,
         )
     )
@@ -0,0 +1,201 @@
+"""Streaming partitioner - Low-memory partitioning of large filing HTML into elements.
+
+``SECDocument.from_string`` builds the whole lxml tree of a filing before partitioning it;
+for 10-K/S-1 documents with inline XBRL that tree is many times the size of the text. Here
+the HTML is fed to lxml in chunks with a parser *target*, so no tree is built at all: text
+is collected between block-level tags, classified into ``Title``/``NarrativeText``/
+``ListItem``/``Text`` and yielded right away. Hidden blocks (inline XBRL headers,
+``display:none`` containers, ``<head>``, ``<style>``, ``<script>``) are skipped as they
+are parsed, and so are the ``<DOCUMENT>``s of a submission that are not HTML or plain text
+(uuencoded ``GRAPHIC``/``ZIP``/``EXCEL`` blocks, PDFs). Memory is bounded by ``chunk_size`` plus the text of the current block::
+
+    stats = PartitionStats()
+    for element in iter_filing_elements(store.open(cik, accession_number), stats=stats):
+        ...
+    stats.filing_type  # from the <TYPE> header of the submission
+"""
+
+import io
+import re
+import typing as T
+from dataclasses import asdict, dataclass
+
+from lxml import etree
+from unstructured.cleaners.core import clean_bullets
+from unstructured.documents.elements import ListItem, NarrativeText, Text, Title
+from unstructured.nlp.partition import is_bulleted_text, is_possible_narrative_text, is_possible_title
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Tags whose start or end separates two elements.
+BLOCK_TAGS = frozenset(
+    ["html", "body", "div", "p", "pre", "center", "blockquote", "section", "article", "table", "thead", "tbody"]
+    + ["tr", "td", "th", "ul", "ol", "li", "dl", "dd", "dt", "h1", "h2", "h3", "h4", "h5", "h6", "hr", "page"]
+    + ["document", "text"]
+)
+# EDGAR submission headers (``<TYPE>10-K``): unclosed, their value runs up to the next tag.
+HEADER_TAGS = frozenset(["sec-document", "type", "sequence", "filename", "description"])
+# Tags whose content never reaches the output.
+HIDDEN_TAGS = frozenset(
+    ["head", "title", "style", "script", "noscript", "ix:header", "xbrl", "xml", "sec-header", "ims-header"]
+)
+# Submission documents (``<TYPE>``/``<FILENAME>`` headers) whose ``<TEXT>`` is not HTML or text.
+BINARY_DOCUMENT_TYPES = frozenset(["GRAPHIC", "ZIP", "EXCEL", "PDF", "XML", "JSON"])
+TEXT_DOCUMENT_EXTENSIONS = frozenset(["htm", "html", "txt"])
+HIDDEN_STYLE_RE = re.compile(r"display\s*:\s*none", re.IGNORECASE)
+WHITESPACE_RE = re.compile(r"[\s\u200b]+")
+
+
+@dataclass
+class PartitionStats:
+    """Totals of one streaming partition, filled in as elements are yielded."""
+
+    filing_type: T.Optional[str] = None
+    chars: int = 0  # characters fed to the parser
+    elements: int = 0
+    hidden_blocks: int = 0
+    skipped_documents: int = 0  # non-text <DOCUMENT>s of the submission
+    max_block_chars: int = 0  # largest text held for a single element
+
+    def to_dict(self) -> T.Dict[str, T.Any]:
+        return asdict(self)
+
+
+class _Collector:
+    """lxml parser target turning start/end/data events into element texts."""
+
+    def __init__(self, stats: PartitionStats) -> None:
+        self.stats = stats
+        self.texts: T.List[str] = []  # completed element texts, drained after every feed
+        self._parts: T.List[str] = []
+        self._size = 0
+        self._hidden: T.List[str] = []  # open tags of the hidden block being skipped
+        self._header: T.Optional[str] = None
+        self._header_parts: T.List[str] = []
+        self._document: T.Dict[str, str] = {}  # headers of the current <DOCUMENT>
+
+    def start(self, tag: str, attrib: T.Dict[str, str]) -> None:
+        tag = tag.lower()
+        if self._hidden:
+            self._hidden.append(tag)
+            return
+        self._end_header()
+        if tag in HIDDEN_TAGS or HIDDEN_STYLE_RE.search(attrib.get("style", "")):
+            self._flush()
+            self._hidden.append(tag)
+            self.stats.hidden_blocks += 1
+            return
+        if tag == "text" and not self._is_text_document():
+            self._flush()
+            self._hidden.append(tag)
+            self.stats.skipped_documents += 1
+            return
+        if tag == "document":
+            self._document = {}
+        if tag in HEADER_TAGS:
+            self._flush()
+            self._header = tag
+        elif tag in BLOCK_TAGS:
+            self._flush()
+        elif tag == "br":
+            self._add(" ")
+
+    def end(self, tag: str) -> None:
+        tag = tag.lower()
+        if self._hidden:
+            # lxml reports an end for every start, so the stack unwinds in order
+            self._hidden.pop()
+            return
+        self._end_header()
+        if tag in BLOCK_TAGS:
+            self._flush()
+
+    def data(self, data: str) -> None:
+        if self._hidden:
+            return
+        if self._header is not None:
+            self._header_parts.append(data)
+            return
+        self._add(data)
+
+    def comment(self, text: str) -> None:
+        pass
+
+    def close(self) -> None:
+        self._end_header()
+        self._flush()
+
+    def _add(self, data: str) -> None:
+        self._parts.append(data)
+        self._size += len(data)
+
+    def _flush(self) -> None:
+        if not self._parts:
+            return
+        self.stats.max_block_chars = max(self.stats.max_block_chars, self._size)
+        text = WHITESPACE_RE.sub(" ", "".join(self._parts)).strip()
+        self._parts, self._size = [], 0
+        if text:
+            self.texts.append(text)
+
+    def _end_header(self) -> None:
+        if self._header is None:
+            return
+        value = "".join(self._header_parts).strip()
+        if self._header == "type" and self.stats.filing_type is None and value:
+            # the first <TYPE> is the main document of the submission
+            self.stats.filing_type = value.split()[0]
+        if value:
+            self._document[self._header] = value.split()[0]
+        self._header, self._header_parts = None, []
+
+    def _is_text_document(self) -> bool:
+        if self._document.get("type", "").upper() in BINARY_DOCUMENT_TYPES:
+            return False
+        filename = self._document.get("filename", "")
+        return "." not in filename or filename.rsplit(".", 1)[1].lower() in TEXT_DOCUMENT_EXTENSIONS
+
+
+def iter_filing_elements(
+    source: T.Union[str, T.TextIO],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    stats: T.Optional[PartitionStats] = None,
+) -> T.Iterator[Text]:
+    """Partition filing HTML into elements, yielding each one as soon as its block closes.
+
+    Parameters:
+        source (str | TextIO): filing text, or a text stream read ``chunk_size`` characters at a time.
+        chunk_size (int): characters fed to the parser at once.
+        stats (PartitionStats | None): receives the filing type and counters.
+    """
+    stats = stats if stats is not None else PartitionStats()
+    stream = io.StringIO(source) if isinstance(source, str) else source
+    collector = _Collector(stats)
+    parser = etree.HTMLParser(target=collector, recover=True, remove_comments=True, remove_pis=True)
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        stats.chars += len(chunk)
+        parser.feed(chunk)
+        yield from _drain(collector, stats)
+    parser.close()
+    yield from _drain(collector, stats)
+
+
+def _drain(collector: _Collector, stats: PartitionStats) -> T.Iterator[Text]:
+    texts, collector.texts = collector.texts, []
+    for text in texts:
+        stats.elements += 1
+        yield to_element(text)
+
+
+def to_element(text: str) -> Text:
+    """Element type of a block of text, following unstructured's HTML partitioning."""
+    if is_bulleted_text(text):
+        return ListItem(clean_bullets(text))
+    if is_possible_narrative_text(text):
+        return NarrativeText(text)
+    if is_possible_title(text):
+        return Title(text)
+    return Text(text)
@@ -1,11 +1,12 @@
-import concurrent.futures
 import re
 import typing as T
 from datetime import datetime
 from functools import partial
 
 import pandas as pd
-import requests
+from finrobot.data_access.data_source.domains.filings.filing_store import get_filing_store
+from finrobot.data_access.data_source.domains.filings.submissions import get_submissions_cache
+from finrobot.data_access.data_source.filings_src.pipeline import FilingRef, PipelineStats, stream_filings
 from finrobot.data_access.data_source.filings_src.prepline_sec_filings.fetch import (
     get_cik_by_ticker,
     get_filing,
@@ -29,17 +30,16 @@ def sec_main(
             forms.append(ft)
             forms.append(ft + "/A")
 
-    url = f"https://data.sec.gov/submissions/CIK{cik}.json"
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
     }
-    # Send a GET request to the URL with headers
-    response = requests.get(url, headers=headers)
+    # Revalidated against the local copy; history pages back to the requested year are merged in
+    response = get_submissions_cache().fetch(cik, headers=headers, since=f"{year}-01-01")
 
-    if response.status_code == 200:
-        json_data = response.json()
-    else:
+    json_data = response.data
+    if json_data is None:
         print(f"Error: Unable to fetch data. Status code: {response.status_code}")
+        return [], []
 
     form_lists = []
     filings = json_data["filings"]
@@ -71,38 +71,48 @@ def sec_main(
     acc_nums_list = [fl["accession_number"] for fl in form_lists]
 
     get_filing_partial = partial(
-        get_filing,
+        _get_filing_for_parser,
         cik=rgld_cik,
         company="Unstructured Technologies",
         email="support@unstructured.io",
     )
     sec_extractor = SECExtractor(ticker=ticker)
-    print("Started Scraping")
-    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
-        results = executor.map(get_filing_partial, acc_nums_list)
-    results_texts = []
-    for res in results:
-        if res != "":
-            results_texts.append(res)
-    assert len(results_texts) == len(
-        acc_nums_list
-    ), f"The scraped text {len(results_texts)} is not matching with accession number texts {len(acc_nums_list)}"
-    print("Scraped")
-    print("Started Extracting")
-    with concurrent.futures.ProcessPoolExecutor(max_workers=4) as executor:
-        results = executor.map(sec_extractor.get_section_texts_from_text, results_texts)  # type: ignore[arg-type]
-    section_texts = []
-    for res in results:
-        section_texts.append(res)
-    assert len(section_texts) == len(
-        acc_nums_list
-    ), f"The section text {len(section_texts)} is not matching with accession number texts {len(acc_nums_list)}"
-
-    print("Extracted")
+    print("Started Scraping and Extracting")
+    # Filings are parsed as soon as they are downloaded; a failed filing is reported and skipped.
+    # Parser processes read stored filings from disk and persist across calls.
+    stats = PipelineStats()
+    section_texts: T.Dict[int, T.Dict[str, str]] = {}
+    for result in stream_filings(
+        acc_nums_list,
+        download=get_filing_partial,
+        parse=sec_extractor.get_section_texts_from_text,
+        stats=stats,
+    ):
+        if result.ok:
+            section_texts[result.index] = T.cast(T.Dict[str, str], result.sections)
+        else:
+            print(f"Skipping {result.accession_number}: {result.error}")
+    print(
+        f"Extracted {stats.parsed}/{len(acc_nums_list)} filings in {stats.wall_seconds:.1f}s "
+        f"(download {stats.download_seconds:.1f}s, queued {stats.queue_seconds:.1f}s, parse {stats.parse_seconds:.1f}s)"
+    )
     docs = []
     for idx, val in enumerate(form_lists):
         # val['sec_texts'] = section_texts[idx]
-        for sec_name, sec_text in section_texts[idx].items():
+        for sec_name, sec_text in section_texts.get(idx, {}).items():
             val.update({"section_name": sec_name})
             docs.append(Document(page_content=sec_text, metadata=val))
     return docs, sec_form_names
+
+
+def _get_filing_for_parser(accession_number: str, cik: int, company: str, email: str) -> T.Union[str, FilingRef]:
+    """The filing as a reference into the filing store when one is configured, so the parser
+    process reads it from the store instead of receiving the text."""
+    store = get_filing_store()
+    if store is None:
+        return get_filing(accession_number, cik=cik, company=company, email=email)
+    if store.entry(cik, accession_number) is None:
+        text = get_filing(accession_number, cik=cik, company=company, email=email)
+        if store.entry(cik, accession_number) is None:
+            return text
+    return FilingRef.stored(store.root, cik, accession_number)
@@ -6,6 +6,8 @@ from datetime import date
 from enum import Enum
 
 import requests
+from finrobot.data_access.data_source.domains.filings.filing_store import get_filing_store, parse_archive_url
+from finrobot.data_access.data_source.filings_src.prepline_sec_filings.element_cache import get_element_cache
 from finrobot.data_access.data_source.filings_src.prepline_sec_filings.sec_document import (
     REPORT_TYPES,
     VALID_FILING_TYPES,
@@ -19,7 +21,7 @@ from finrobot.data_access.data_source.filings_src.prepline_sec_filings.sections
     section_string_to_enum,
     validate_section_names,
 )
-from ratelimit import limits, sleep_and_retry
+from finrobot.data_access.data_source.rate_limits import rate_limited
 from unstructured.staging.base import convert_to_isd
 
 DATE_FORMAT_TOKENS = "%Y-%m-%d"
@@ -76,6 +78,8 @@ class SECExtractor:
         ticker: str,
         sections: T.List[str] = ["_ALL"],
         filing_type: T.Optional[str] = None,
+        streaming: bool = False,
+        exact_headings: bool = False,
     ) -> None:
         """_summary_
 
@@ -86,11 +90,17 @@ class SECExtractor:
             start_date (str, optional): start date of getting files. Defaults to DEFAULT_AFTER_DATE.
             end_date (str, optional): end date of getting files. Defaults to DEFAULT_BEFORE_DATE.
             sections (List[str], optional): sections required, check sections names. Defaults to ["_ALL"].
+            streaming (bool, optional): partition filings with the low-memory streaming partitioner
+                instead of building the HTML tree. Defaults to False.
+            exact_headings (bool, optional): slice sections at the matched body headings, so sections whose
+                heading repeats its table of contents entry are extracted. Defaults to False.
         """
 
         self.ticker = ticker
         self.sections = sections
         self.filing_type = filing_type
+        self.streaming = streaming
+        self.exact_headings = exact_headings
 
     def get_year(self, filing_details: str) -> T.Optional[str]:
         """Get the year for 10-K and year,month for 10-Q
@@ -168,7 +178,8 @@ class SECExtractor:
         """
         validate_section_names(m_section)
 
-        sec_document = SECDocument.from_string(text)
+        # Re-extracting sections from the same filing skips the HTML partitioning
+        sec_document = get_element_cache().document(text, SECDocument, streaming=self.streaming)
         if sec_document.filing_type not in VALID_FILING_TYPES:
             raise ValueError(
                 f"SEC document filing type {sec_document.filing_type} is not supported, "
@@ -187,24 +198,38 @@ class SECExtractor:
 
             else:
                 m_section = [enum.name for enum in SECTIONS_S1]
+        # The table of contents is computed once and shared by every requested section
+        narratives = sec_document.get_section_narratives(
+            [section_string_to_enum[section] for section in m_section], exact_headings=self.exact_headings
+        )
         for section in m_section:
-            results[section] = sec_document.get_section_narrative(section_string_to_enum[section])
+            results[section] = narratives[section_string_to_enum[section]]
 
         for i, section_regex in enumerate(m_section_regex):
             regex_num = get_regex_enum(section_regex)
             with timeout(seconds=5):
-                section_elements = sec_document.get_section_narrative(regex_num)
+                section_elements = sec_document.get_section_narratives([regex_num], self.exact_headings)[regex_num]
                 results[f"REGEX_{i}"] = section_elements
         return {
             section: convert_to_isd(section_narrative) for section, section_narrative in results.items()
         }, sec_document.filing_type
 
-    @sleep_and_retry  # type: ignore[untyped-decorator]
-    @limits(calls=10, period=1)  # type: ignore[untyped-decorator]
     def get_filing(self, url: str, company: str, email: str) -> str:
-        """Fetches the specified filing from the SEC EDGAR Archives. Conforms to the rate
-        limits specified on the SEC website.
+        """Fetches the specified filing from the SEC EDGAR Archives, or from the local filing
+        store when its full ``{accession}.txt`` submission was downloaded before (other documents
+        are always downloaded). Conforms to the rate limits specified on the SEC website.
         ref: https://www.sec.gov/os/accessing-edgar-data"""
+        store = get_filing_store()
+        key = parse_archive_url(url) if store is not None else None
+        text = store.get(*key) if store is not None and key is not None else None
+        if text is None:
+            text = self._download_filing(url, company, email)
+            if store is not None and key is not None:
+                store.put(*key, text)
+        return text
+
+    @rate_limited("sec")
+    def _download_filing(self, url: str, company: str, email: str) -> str:
         session = self._get_session(company, email)
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
@@ -0,0 +1,211 @@
+"""FMP Data - Deduplicated, cached access to Financial Modeling Prep endpoints.
+
+The metric builders in ``FMPUtils`` need the same few statement endpoints
+(income-statement, ratios, key-metrics) for every symbol. This layer fetches each
+``(endpoint, symbol)`` payload once, keeps it for a TTL, and serves smaller ``limit``
+requests from a larger cached payload. Endpoints that accept a comma-separated
+symbol list are batched into a single request. The ``a*`` variants fan requests out
+concurrently for multi-symbol comparisons. ``index`` exposes a cached payload as a
+``PointInTimeIndex`` for date lookups.
+"""
+
+import asyncio
+import os
+import threading
+import typing as T
+
+from finrobot.data_access.data_source.clients import http_session
+from finrobot.data_access.data_source.point_in_time import PointInTimeIndex
+from finrobot.data_access.data_source.rate_limits import get_rate_scheduler
+from finrobot.infrastructure.cache import TTLCache
+
+FMP_BASE_URL = "https://financialmodelingprep.com/api/v3"
+# Endpoints addressed as ``<base>/<endpoint>?symbol=<symbol>`` instead of ``/<endpoint>/<symbol>``.
+QUERY_ENDPOINTS = {"price-target": "https://financialmodelingprep.com/api/v4"}
+FMP_TTL_ENV = "FINROBOT_FMP_TTL"
+DEFAULT_FMP_TTL = 6 * 60 * 60.0
+
+# Endpoints that take "AAPL,MSFT,..." and return one row per symbol.
+BATCH_ENDPOINTS = frozenset({"quote", "profile"})
+MAX_BATCH_SIZE = 50
+# Upper bound on concurrent requests in the async fan-out (the shared pool holds 32).
+DEFAULT_CONCURRENCY = 8
+
+Payload = T.Any  # list of rows on success, FMP error object otherwise
+
+
+class FMPDataClient:
+    """TTL-cached fetcher for FMP ``/<endpoint>/<symbol>`` resources."""
+
+    def __init__(self, ttl: T.Optional[float] = None, base_url: str = FMP_BASE_URL) -> None:
+        if ttl is None:
+            ttl = float(os.environ.get(FMP_TTL_ENV) or DEFAULT_FMP_TTL)
+        self.base_url = base_url
+        # (endpoint, SYMBOL) -> (limit the payload was fetched with, payload)
+        self.cache: TTLCache[T.Tuple[str, str], T.Tuple[T.Optional[int], Payload]] = TTLCache(ttl=ttl)
+        self.network_calls = 0
+        # (endpoint, SYMBOL, date_key) -> (cache entry the index was built from, index)
+        self._indexes: T.Dict[T.Tuple[str, str, str], T.Tuple[T.Any, PointInTimeIndex]] = {}
+        self._lock = threading.Lock()
+
+    def fetch(self, endpoint: str, symbol: str, limit: T.Optional[int] = None) -> Payload:
+        """Return the payload of ``endpoint`` for one symbol."""
+        return self.fetch_many(endpoint, [symbol], limit=limit)[symbol]
+
+    def fetch_many(
+        self, endpoint: str, symbols: T.Sequence[str], limit: T.Optional[int] = None
+    ) -> T.Dict[str, Payload]:
+        """Return ``{symbol: payload}``, requesting only symbols that are not cached."""
+        results, requests = self._plan(endpoint, symbols, limit)
+        for chunk in requests:
+            get_rate_scheduler().acquire("fmp")
+            results.update(self._absorb(endpoint, chunk, limit, self._request(endpoint, ",".join(chunk), limit)))
+        return results
+
+    def statements(
+        self, symbols: T.Sequence[str], endpoints: T.Sequence[str], limit: T.Optional[int] = None
+    ) -> T.Dict[str, T.Dict[str, Payload]]:
+        """Return ``{symbol: {endpoint: payload}}`` for every requested combination."""
+        for endpoint in endpoints:
+            if endpoint in BATCH_ENDPOINTS:
+                self.fetch_many(endpoint, symbols, limit=limit)
+        return {symbol: {endpoint: self.fetch(endpoint, symbol, limit) for endpoint in endpoints} for symbol in symbols}
+
+    async def afetch_many(
+        self,
+        endpoint: str,
+        symbols: T.Sequence[str],
+        limit: T.Optional[int] = None,
+        semaphore: T.Optional[asyncio.Semaphore] = None,
+    ) -> T.Dict[str, Payload]:
+        """Async ``fetch_many``: missing symbols are requested concurrently."""
+        semaphore = semaphore or asyncio.Semaphore(DEFAULT_CONCURRENCY)
+        results, requests = self._plan(endpoint, symbols, limit)
+
+        async def request(chunk: T.List[str]) -> T.Dict[str, Payload]:
+            async with semaphore:
+                await get_rate_scheduler().aacquire("fmp")
+                rows = await asyncio.to_thread(self._request, endpoint, ",".join(chunk), limit)
+            return self._absorb(endpoint, chunk, limit, rows)
+
+        for fetched in await asyncio.gather(*(request(chunk) for chunk in requests)):
+            results.update(fetched)
+        return results
+
+    async def astatements(
+        self,
+        symbols: T.Sequence[str],
+        endpoints: T.Sequence[str],
+        limit: T.Optional[int] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> T.Dict[str, T.Dict[str, Payload]]:
+        """Async ``statements``: every (symbol, endpoint) request runs concurrently.
+
+        At most ``concurrency`` requests are in flight, paced by the ``fmp`` rate quota.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        payloads = await asyncio.gather(
+            *(self.afetch_many(endpoint, symbols, limit=limit, semaphore=semaphore) for endpoint in endpoints)
+        )
+        by_endpoint = dict(zip(endpoints, payloads))
+        return {symbol: {endpoint: by_endpoint[endpoint][symbol] for endpoint in endpoints} for symbol in symbols}
+
+    def index(
+        self, endpoint: str, symbol: str, limit: T.Optional[int] = None, date_key: str = "date"
+    ) -> PointInTimeIndex:
+        """Point-in-time index of ``endpoint`` for one symbol, rebuilt only when the payload is refetched."""
+        payload = self.fetch(endpoint, symbol, limit=limit)
+        key = (endpoint, symbol.upper(), date_key)
+        entry = self.cache.get((endpoint, symbol.upper()))
+        with self._lock:
+            built = self._indexes.get(key)
+        if built is not None and entry is not None and built[0] is entry:
+            return built[1]
+        if entry is None:  # error objects and empty results are not cached
+            return PointInTimeIndex(payload if isinstance(payload, list) else [], date_key)
+        # the cached payload may hold more rows than ``limit``; all of them are indexed
+        index = PointInTimeIndex(entry[1], date_key)
+        with self._lock:
+            self._indexes[key] = (entry, index)
+        return index
+
+    def clear(self) -> None:
+        self.cache.clear()
+        with self._lock:
+            self.network_calls = 0
+            self._indexes.clear()
+
+    def _plan(
+        self, endpoint: str, symbols: T.Sequence[str], limit: T.Optional[int]
+    ) -> T.Tuple[T.Dict[str, Payload], T.List[T.List[str]]]:
+        """Split ``symbols`` into cached payloads and the symbol groups still to request."""
+        results: T.Dict[str, Payload] = {}
+        missing: T.List[str] = []
+        for symbol in symbols:
+            cached = self._cached(endpoint, symbol, limit)
+            if cached is None:
+                missing.append(symbol)
+            else:
+                results[symbol] = cached
+        missing = list(dict.fromkeys(missing))
+        if endpoint in BATCH_ENDPOINTS:
+            return results, [missing[i : i + MAX_BATCH_SIZE] for i in range(0, len(missing), MAX_BATCH_SIZE)]
+        return results, [[symbol] for symbol in missing]
+
+    def _absorb(self, endpoint: str, chunk: T.List[str], limit: T.Optional[int], rows: Payload) -> T.Dict[str, Payload]:
+        """Cache the response of one request and split it per symbol."""
+        if len(chunk) == 1 and endpoint not in BATCH_ENDPOINTS:
+            return {chunk[0]: self._store(endpoint, chunk[0], limit, rows)}
+        results = {}
+        for symbol in chunk:
+            if isinstance(rows, list):
+                payload = [row for row in rows if str(row.get("symbol", "")).upper() == symbol.upper()]
+            else:
+                payload = rows
+            results[symbol] = self._store(endpoint, symbol, limit, payload)
+        return results
+
+    def _cached(self, endpoint: str, symbol: str, limit: T.Optional[int]) -> T.Optional[Payload]:
+        entry = self.cache.get((endpoint, symbol.upper()))
+        if entry is None:
+            return None
+        cached_limit, payload = entry
+        if cached_limit is None:
+            return payload[:limit] if limit is not None else payload
+        if limit is not None and cached_limit >= limit:
+            return payload[:limit]
+        return None
+
+    def _store(self, endpoint: str, symbol: str, limit: T.Optional[int], payload: Payload) -> Payload:
+        # NOTE: error objects and empty results are not cached so a fixed key or a
+        # newly listed symbol is picked up on the next call.
+        if isinstance(payload, list) and payload:
+            self.cache.set((endpoint, symbol.upper()), (limit, payload))
+        return payload
+
+    def _request(self, endpoint: str, symbols: str, limit: T.Optional[int]) -> Payload:
+        query = f"apikey={os.environ.get('FMP_API_KEY')}"
+        if limit is not None:
+            query = f"limit={limit}&{query}"
+        with self._lock:
+            self.network_calls += 1
+        if endpoint in QUERY_ENDPOINTS:
+            url = f"{QUERY_ENDPOINTS[endpoint]}/{endpoint}?symbol={symbols}&{query}"
+        else:
+            url = f"{self.base_url}/{endpoint}/{symbols}?{query}"
+        response = http_session().get(url)
+        # NOTE: failures are returned in FMP's own error shape, which is never cached.
+        if not response.ok:
+            return {"Error Message": f"HTTP {response.status_code}"}
+        try:
+            return response.json()
+        except ValueError:
+            return {"Error Message": f"HTTP {response.status_code}: response is not JSON"}
+
+
+_client = FMPDataClient()
+
+
+def get_fmp_data_client() -> FMPDataClient:
+    """Return the process-wide FMP data client."""
+    return _client
@@ -6,8 +6,12 @@ from typing import Annotated, Any, Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
-import requests
-from finrobot.infrastructure.utils import decorate_all_methods, get_next_weekday
+from finrobot.data_access.data_source.clients import http_session
+from finrobot.data_access.data_source.fmp_data import DEFAULT_CONCURRENCY, get_fmp_data_client
+from finrobot.data_access.data_source.point_in_time import PointInTimeIndex
+from finrobot.data_access.data_source.rate_limits import get_rate_scheduler
+from finrobot.infrastructure.cache import single_flight
+from finrobot.infrastructure.utils import decorate_all_methods, get_next_weekday, run_sync
 
 fmp_api_key: Optional[str] = None
 
@@ -27,6 +31,7 @@ def init_fmp_api(func: T.Callable[..., T.Any]) -> T.Callable[..., T.Any]:
     return wrapper
 
 
+@decorate_all_methods(single_flight("fmp"))
 @decorate_all_methods(init_fmp_api)
 class FMPUtils:
     def get_target_price(
@@ -34,34 +39,17 @@ class FMPUtils:
         date: Annotated[str, "date of the target price, should be 'yyyy-mm-dd'"],
     ) -> str:
         """Get the target price for a given stock on a given date"""
-        # API URL
-        url = f"https://financialmodelingprep.com/api/v4/price-target?symbol={ticker_symbol}&apikey={fmp_api_key}"
-
-        # 发送GET请求
-        price_target = "Not Given"
-        response = requests.get(url)
-
-        # 确保请求成功
-        if response.status_code == 200:
-            # 解析JSON数据
-            data = response.json()
-            est = []
-
-            target_date = datetime.strptime(date, "%Y-%m-%d")
-            for tprice in data:
-                tdate = tprice["publishedDate"].split("T")[0]
-                tdate_obj = datetime.strptime(tdate, "%Y-%m-%d")
-                if abs((tdate_obj - target_date).days) <= 999:
-                    est.append(tprice["priceTarget"])
-
-            if est:
-                price_target = f"{np.min(est)} - {np.max(est)} (md. {np.median(est)})"
-            else:
-                price_target = "N/A"
-        else:
-            return f"Failed to retrieve data: {response.status_code}"
-
-        return price_target
+        data = get_fmp_data_client().fetch("price-target", ticker_symbol)
+        if not isinstance(data, list):
+            return f"Failed to retrieve data: {data}"
+
+        # 目标日期前后999天内的分析师目标价
+        index = get_fmp_data_client().index("price-target", ticker_symbol, date_key="publishedDate")
+        est = index.column("priceTarget")[index.window(date, days=TARGET_PRICE_WINDOW_DAYS)]
+        est = est[~np.isnan(est)]
+        if not len(est):
+            return "N/A"
+        return f"{np.min(est)} - {np.max(est)} (md. {np.median(est)})"
 
     def get_sec_report(
         ticker_symbol: Annotated[str, "ticker symbol"],
@@ -76,7 +64,8 @@ class FMPUtils:
 
         # 发送GET请求
         filing_url = None
-        response = requests.get(url)
+        get_rate_scheduler().acquire("fmp")
+        response = http_session().get(url)
 
         # 确保请求成功
         if response.status_code == 200:
@@ -104,11 +93,17 @@ class FMPUtils:
         """Get the historical market capitalization for a given stock on a given date"""
         date_obj = datetime.strptime(date_str, "%Y-%m-%d")
         date = get_next_weekday(date_obj).strftime("%Y-%m-%d")
-        url = f"https://financialmodelingprep.com/api/v3/historical-market-capitalization/{ticker_symbol}?limit=100&from={date}&to={date}&apikey={fmp_api_key}"
 
-        # 发送GET请求
-        mkt_cap = None
-        response = requests.get(url)
+        # 优先使用缓存的完整市值历史
+        index = _market_cap_index(ticker_symbol)
+        if _covers(index, date):
+            position = index.asof(date)
+            if index.dates[position] == np.datetime64(date) and "marketCap" in index.records[position]:
+                return T.cast(float, index.records[position]["marketCap"])
+            return "No market cap data found"
+
+        # 缓存历史之外的日期: 单独请求
+        response = _request_market_cap_range(ticker_symbol, date, date)
 
         # 确保请求成功
         if response.status_code == 200:
@@ -126,93 +121,32 @@ class FMPUtils:
     ) -> Union[float, str]:
         """Get the historical book value per share for a given stock on a given date"""
         # 从FMP API获取历史关键财务指标数据
-        url = f"https://financialmodelingprep.com/api/v3/key-metrics/{ticker_symbol}?limit=40&apikey={fmp_api_key}"
-        response = requests.get(url)
-        data = response.json()
+        data = get_fmp_data_client().fetch("key-metrics", ticker_symbol, limit=BVPS_HISTORY_LIMIT)
 
         if not data:
             return "No data available"
 
         # 找到最接近目标日期的数据
-        closest_data = None
-        min_date_diff = float("inf")
-        target_date_obj = datetime.strptime(target_date, "%Y-%m-%d")
-        for entry in data:
-            date_of_data = datetime.strptime(entry["date"], "%Y-%m-%d")
-            date_diff = abs((target_date_obj - date_of_data).days)
-            if date_diff < min_date_diff:
-                min_date_diff = date_diff
-                closest_data = entry
-
-        if closest_data:
-            return T.cast(Union[float, str], closest_data.get("bookValuePerShare", "No BVPS data available"))
-        else:
+        index = get_fmp_data_client().index("key-metrics", ticker_symbol, limit=BVPS_HISTORY_LIMIT)
+        position = index.nearest(target_date)
+        if position < 0:
             return "No close date data found"
+        return T.cast(Union[float, str], index.records[position].get("bookValuePerShare", "No BVPS data available"))
 
     def get_financial_metrics(
         ticker_symbol: Annotated[str, "ticker symbol"],
         years: Annotated[int, "number of the years to search from, default to 4"] = 4,
     ) -> pd.DataFrame:
         """Get the financial metrics for a given stock for the last 'years' years"""
-        # Base URL setup for FMP API
-        base_url = "https://financialmodelingprep.com/api/v3"
+        data = get_fmp_data_client().statements([ticker_symbol], FINANCIAL_METRICS_ENDPOINTS, limit=years)
+        income_data, key_metrics_data, ratios_data = (data[ticker_symbol][e] for e in FINANCIAL_METRICS_ENDPOINTS)
         # Create DataFrame
         df = pd.DataFrame()
 
-        # Iterate over the last 'years' years of data
-        for year_offset in range(years):
-            # Construct URL for income statement and ratios for each year
-            income_statement_url = f"{base_url}/income-statement/{ticker_symbol}?limit={years}&apikey={fmp_api_key}"
-            ratios_url = f"{base_url}/ratios/{ticker_symbol}?limit={years}&apikey={fmp_api_key}"
-            key_metrics_url = f"{base_url}/key-metrics/{ticker_symbol}?limit={years}&apikey={fmp_api_key}"
-
-            # Requesting data from the API
-            income_data = requests.get(income_statement_url).json()
-            key_metrics_data = requests.get(key_metrics_url).json()
-            ratios_data = requests.get(ratios_url).json()
-
-            # Extracting needed metrics for each year
-            if income_data and key_metrics_data and ratios_data:
-                metrics = {
-                    "Revenue": round(income_data[year_offset]["revenue"] / 1e6),
-                    "Revenue Growth": "{}%".format(
-                        round(
-                            (
-                                (income_data[year_offset]["revenue"] - income_data[year_offset - 1]["revenue"])
-                                / income_data[year_offset - 1]["revenue"]
-                            )
-                            * 100,
-                            1,
-                        )
-                    ),
-                    "Gross Revenue": round(income_data[year_offset]["grossProfit"] / 1e6),
-                    "Gross Margin": round(
-                        (income_data[year_offset]["grossProfit"] / income_data[year_offset]["revenue"]),
-                        2,
-                    ),
-                    "EBITDA": round(income_data[year_offset]["ebitda"] / 1e6),
-                    "EBITDA Margin": round((income_data[year_offset]["ebitdaratio"]), 2),
-                    "FCF": round(
-                        float(key_metrics_data[year_offset]["enterpriseValue"])
-                        / float(key_metrics_data[year_offset]["evToOperatingCashFlow"])
-                        / 1e6
-                    ),
-                    "FCF Conversion": round(
-                        (
-                            (
-                                key_metrics_data[year_offset]["enterpriseValue"]
-                                / key_metrics_data[year_offset]["evToOperatingCashFlow"]
-                            )
-                            / income_data[year_offset]["netIncome"]
-                        ),
-                        2,
-                    ),
-                    "ROIC": "{}%".format(round((key_metrics_data[year_offset]["roic"]) * 100, 1)),
-                    "EV/EBITDA": round((key_metrics_data[year_offset]["enterpriseValueOverEBITDA"]), 2),
-                    "PE Ratio": round(ratios_data[year_offset]["priceEarningsRatio"], 2),
-                    "PB Ratio": round(key_metrics_data[year_offset]["pbRatio"], 2),
-                }
-                # Append the year and metrics to the DataFrame
+        # Extracting needed metrics for each of the last 'years' years
+        if income_data and key_metrics_data and ratios_data:
+            for year_offset in range(years):
+                metrics = _financial_metrics(income_data, key_metrics_data, ratios_data, year_offset)
                 # Extracting the year from the date
                 year = income_data[year_offset]["date"][:4]
                 df[year] = pd.Series(metrics)
@@ -227,68 +161,192 @@ class FMPUtils:
         years: Annotated[int, "number of the years to search from, default to 4"] = 4,
     ) -> Dict[str, pd.DataFrame]:
         """Get financial metrics for the company and its competitors."""
-        base_url = "https://financialmodelingprep.com/api/v3"
-        all_data = {}
-
-        symbols = [ticker_symbol] + competitors  # Combine company and competitors into one list
-
-        for symbol in symbols:
-            income_statement_url = f"{base_url}/income-statement/{symbol}?limit={years}&apikey={fmp_api_key}"
-            ratios_url = f"{base_url}/ratios/{symbol}?limit={years}&apikey={fmp_api_key}"
-            key_metrics_url = f"{base_url}/key-metrics/{symbol}?limit={years}&apikey={fmp_api_key}"
-
-            income_data = requests.get(income_statement_url).json()
-            ratios_data = requests.get(ratios_url).json()
-            key_metrics_data = requests.get(key_metrics_url).json()
-
-            metrics = {}
-
-            if income_data and ratios_data and key_metrics_data:
-                for year_offset in range(years):
-                    metrics[year_offset] = {
-                        "Revenue": round(income_data[year_offset]["revenue"] / 1e6),
-                        "Revenue Growth": (
-                            "{}%".format(
-                                (
-                                    round(
-                                        income_data[year_offset]["revenue"]
-                                        - income_data[year_offset - 1]["revenue"]
-                                        / income_data[year_offset - 1]["revenue"]
-                                    )
-                                    * 100,
-                                    1,
-                                )
+        return T.cast(
+            Dict[str, pd.DataFrame],
+            run_sync(aget_competitor_financial_metrics(ticker_symbol, competitors, years=years)),
+        )
+
+
+FINANCIAL_METRICS_ENDPOINTS = ("income-statement", "key-metrics", "ratios")
+COMPETITOR_METRICS_ENDPOINTS = ("income-statement", "ratios", "key-metrics")
+BVPS_HISTORY_LIMIT = 40
+# daily rows of market-cap history fetched per symbol (about 20 years)
+MARKET_CAP_HISTORY_LIMIT = 5000
+# analyst targets published within this many days of the requested date are summarised
+TARGET_PRICE_WINDOW_DAYS = 999
+
+
+async def aget_competitor_financial_metrics(
+    ticker_symbol: str,
+    competitors: List[str],
+    years: int = 4,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> Dict[str, pd.DataFrame]:
+    """Async variant of ``FMPUtils.get_competitor_financial_metrics``.
+
+    Statements for all symbols are fetched concurrently, with at most ``concurrency``
+    requests in flight.
+    """
+    symbols = [ticker_symbol] + competitors  # Combine company and competitors into one list
+    data = await get_fmp_data_client().astatements(
+        symbols, COMPETITOR_METRICS_ENDPOINTS, limit=years, concurrency=concurrency
+    )
+    return {symbol: _competitor_metrics_frame(data[symbol], years) for symbol in symbols}
+
+
+def get_historical_bvps_series(ticker_symbol: str, dates: T.Sequence[T.Any]) -> pd.Series:
+    """Vectorized ``FMPUtils.get_historical_bvps`` for many dates (e.g. backfills).
+
+    Returns:
+        pd.Series: book value per share of the nearest key-metrics row, indexed by ``dates``
+        (NaN when the symbol has no data).
+    """
+    index = get_fmp_data_client().index("key-metrics", ticker_symbol, limit=BVPS_HISTORY_LIMIT)
+    positions = np.atleast_1d(index.nearest(dates))
+    values = index.column("bookValuePerShare")
+    bvps = values[positions] if len(index) else np.full(len(positions), np.nan)
+    return pd.Series(bvps, index=pd.DatetimeIndex(pd.to_datetime(list(dates))), name="bookValuePerShare")
+
+
+def get_historical_market_cap_series(ticker_symbol: str, dates: T.Sequence[T.Any]) -> pd.Series:
+    """Vectorized ``FMPUtils.get_historical_market_cap`` for many dates.
+
+    Weekend dates are moved to the next Monday as in the single-date lookup. Dates before
+    the cached history are fetched with one ``from``/``to`` range request.
+
+    Returns:
+        pd.Series: market cap per requested date (NaN when there is no row for that day).
+    """
+    requested = pd.DatetimeIndex(pd.to_datetime(list(dates)))
+    days = np.busday_offset(requested.values.astype("datetime64[D]"), 0, roll="forward")
+    index = _market_cap_index(ticker_symbol)
+    rows = dict(zip(index.dates, index.column("marketCap")))
+
+    missing = [day for day in days if not _covers(index, day)]
+    if missing:
+        response = _request_market_cap_range(ticker_symbol, str(min(missing)), str(max(missing)))
+        extra = PointInTimeIndex(response.json() if response.status_code == 200 else [])
+        rows.update(zip(extra.dates, extra.column("marketCap")))
+
+    return pd.Series([rows.get(day, np.nan) for day in days], index=requested, name="marketCap")
+
+
+def _market_cap_index(ticker_symbol: str) -> PointInTimeIndex:
+    """Cached daily market-cap history of ``ticker_symbol``, fetched once per TTL."""
+    return get_fmp_data_client().index(
+        "historical-market-capitalization", ticker_symbol, limit=MARKET_CAP_HISTORY_LIMIT
+    )
+
+
+def _covers(index: PointInTimeIndex, date: T.Any) -> bool:
+    return bool(len(index)) and index.dates[0] <= np.datetime64(date, "D") <= index.dates[-1]
+
+
+def _request_market_cap_range(ticker_symbol: str, start: str, end: str) -> T.Any:
+    url = (
+        f"https://financialmodelingprep.com/api/v3/historical-market-capitalization/{ticker_symbol}"
+        f"?limit={MARKET_CAP_HISTORY_LIMIT}&from={start}&to={end}&apikey={os.environ.get('FMP_API_KEY')}"
+    )
+    get_rate_scheduler().acquire("fmp")
+    return http_session().get(url)
+
+
+def _financial_metrics(
+    income_data: List[Dict[str, Any]],
+    key_metrics_data: List[Dict[str, Any]],
+    ratios_data: List[Dict[str, Any]],
+    year_offset: int,
+) -> Dict[str, Any]:
+    return {
+        "Revenue": round(income_data[year_offset]["revenue"] / 1e6),
+        "Revenue Growth": "{}%".format(
+            round(
+                (
+                    (income_data[year_offset]["revenue"] - income_data[year_offset - 1]["revenue"])
+                    / income_data[year_offset - 1]["revenue"]
+                )
+                * 100,
+                1,
+            )
+        ),
+        "Gross Revenue": round(income_data[year_offset]["grossProfit"] / 1e6),
+        "Gross Margin": round(
+            (income_data[year_offset]["grossProfit"] / income_data[year_offset]["revenue"]),
+            2,
+        ),
+        "EBITDA": round(income_data[year_offset]["ebitda"] / 1e6),
+        "EBITDA Margin": round((income_data[year_offset]["ebitdaratio"]), 2),
+        "FCF": round(
+            float(key_metrics_data[year_offset]["enterpriseValue"])
+            / float(key_metrics_data[year_offset]["evToOperatingCashFlow"])
+            / 1e6
+        ),
+        "FCF Conversion": round(
+            (
+                (
+                    key_metrics_data[year_offset]["enterpriseValue"]
+                    / key_metrics_data[year_offset]["evToOperatingCashFlow"]
+                )
+                / income_data[year_offset]["netIncome"]
+            ),
+            2,
+        ),
+        "ROIC": "{}%".format(round((key_metrics_data[year_offset]["roic"]) * 100, 1)),
+        "EV/EBITDA": round((key_metrics_data[year_offset]["enterpriseValueOverEBITDA"]), 2),
+        "PE Ratio": round(ratios_data[year_offset]["priceEarningsRatio"], 2),
+        "PB Ratio": round(key_metrics_data[year_offset]["pbRatio"], 2),
+    }
+
+
+def _competitor_metrics_frame(data: Dict[str, Any], years: int) -> pd.DataFrame:
+    income_data = data["income-statement"]
+    ratios_data = data["ratios"]
+    key_metrics_data = data["key-metrics"]
+
+    metrics = {}
+
+    if income_data and ratios_data and key_metrics_data:
+        for year_offset in range(years):
+            metrics[year_offset] = {
+                "Revenue": round(income_data[year_offset]["revenue"] / 1e6),
+                "Revenue Growth": (
+                    "{}%".format(
+                        (
+                            round(
+                                income_data[year_offset]["revenue"]
+                                - income_data[year_offset - 1]["revenue"] / income_data[year_offset - 1]["revenue"]
                             )
-                            if year_offset > 0
-                            else None
-                        ),
-                        "Gross Margin": round(
-                            (income_data[year_offset]["grossProfit"] / income_data[year_offset]["revenue"]),
-                            2,
-                        ),
-                        "EBITDA Margin": round((income_data[year_offset]["ebitdaratio"]), 2),
-                        "FCF Conversion": round(
-                            (
-                                float(key_metrics_data[year_offset]["enterpriseValue"])
-                                / float(key_metrics_data[year_offset]["evToOperatingCashFlow"])
-                                / income_data[year_offset]["netIncome"]
-                                if key_metrics_data[year_offset]["evToOperatingCashFlow"] != 0
-                                else 0.0
-                            ),
-                            2,
-                        ),
-                        "ROIC": "{}%".format(round((key_metrics_data[year_offset]["roic"]) * 100, 1)),
-                        "EV/EBITDA": round(
-                            (key_metrics_data[year_offset]["enterpriseValueOverEBITDA"]),
-                            2,
-                        ),
-                    }
-
-            df = pd.DataFrame.from_dict(metrics, orient="index")
-            df = df.sort_index(axis=1)
-            all_data[symbol] = df
-
-        return all_data
+                            * 100,
+                            1,
+                        )
+                    )
+                    if year_offset > 0
+                    else None
+                ),
+                "Gross Margin": round(
+                    (income_data[year_offset]["grossProfit"] / income_data[year_offset]["revenue"]),
+                    2,
+                ),
+                "EBITDA Margin": round((income_data[year_offset]["ebitdaratio"]), 2),
+                "FCF Conversion": round(
+                    (
+                        float(key_metrics_data[year_offset]["enterpriseValue"])
+                        / float(key_metrics_data[year_offset]["evToOperatingCashFlow"])
+                        / income_data[year_offset]["netIncome"]
+                        if key_metrics_data[year_offset]["evToOperatingCashFlow"] != 0
+                        else 0.0
+                    ),
+                    2,
+                ),
+                "ROIC": "{}%".format(round((key_metrics_data[year_offset]["roic"]) * 100, 1)),
+                "EV/EBITDA": round(
+                    (key_metrics_data[year_offset]["enterpriseValueOverEBITDA"]),
+                    2,
+                ),
+            }
+
+    df = pd.DataFrame.from_dict(metrics, orient="index")
+    return df.sort_index(axis=1)
 
 
 if __name__ == "__main__":
@@ -8,6 +8,8 @@ from typing import Any, Dict, Final, List, Tuple, Union
 import pandas as pd
 import pdfkit
 import requests
+from finrobot.data_access.data_source.domains.filings.submissions import get_submissions_cache
+from finrobot.data_access.data_source.filings_src.prepline_sec_filings.fetch import get_cik_by_ticker
 
 SEC_SEARCH_URL: Final[str] = "http://www.sec.gov/cgi-bin/browse-edgar"
 
@@ -18,35 +20,6 @@ def _search_url(cik: Union[str, int]) -> str:
     return url
 
 
-def get_cik_by_ticker(ticker: str) -> str:
-    """Gets a CIK number from a stock ticker by running a search on the SEC website."""
-    cik_re = re.compile(r".*CIK=(\d{10}).*")
-    url = _search_url(ticker)
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-    }
-    # headers =  {
-    # 'authority': 'www.google.com',
-    # 'accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-    # 'accept-language': 'en-US,en;q=0.9',
-    # 'cache-control': 'max-age=0',
-    # 'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0.0.0 Safari/537.36',
-    # # Add more headers as needed
-    # }
-    company = "Indiana-University-Bloomington"
-    email = "athecolab@gmail.com"
-    headers = {
-        "User-Agent": f"{company} {email}",
-        "Content-Type": "text/html",
-    }
-    response = requests.get(url, stream=True, headers=headers)
-    # response = requests.get(url, headers=headers)
-    # response = requests.get(url)
-    response.raise_for_status()
-    results = cik_re.findall(response.text)
-    return str(results[0])
-
-
 SEC_EDGAR_URL = "https://www.sec.gov/Archives/edgar/data"
 
 BASE_DIR = "output/SEC_EDGAR_FILINGS"
@@ -69,15 +42,14 @@ def sec_save_pdfs(
             forms.append(ft)
             forms.append(ft + "/A")
 
-    url = f"https://data.sec.gov/submissions/CIK{cik}.json"
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
     }
-    # Send a GET request to the URL with headers
-    response = requests.get(url, headers=headers)
+    # Revalidated against the local copy; history pages back to the requested year are merged in
+    response = get_submissions_cache().fetch(cik, headers=headers, since=f"{year}-01-01")
 
-    if response.status_code == 200:
-        json_data = response.json()
+    if response.ok:
+        json_data = T.cast(Dict[str, Any], response.data)
     else:
         print(f"Error: Unable to fetch data. Status code: {response.status_code}")
         return [], {}, "", ticker_year_path
@@ -0,0 +1,78 @@
+"""Point-in-Time Index - Binary-searchable, date-sorted view of per-symbol FMP payloads.
+
+Payloads such as ``key-metrics`` or ``price-target`` are lists of dated rows. The index
+parses the dates once into a sorted ``datetime64[D]`` array, so "value as of D",
+"nearest to D" and "rows within N days of D" are ``np.searchsorted`` lookups in
+O(log n). ``asof`` and ``nearest`` accept a single date or an array of dates (for
+backfills); ``windows`` is the array form of ``window``.
+"""
+
+import typing as T
+
+import numpy as np
+
+DateLike = T.Any  # "yyyy-mm-dd" string, datetime, np.datetime64 or a sequence of them
+
+
+class PointInTimeIndex:
+    """Rows of one payload sorted by date."""
+
+    def __init__(self, records: T.Sequence[T.Dict[str, T.Any]], date_key: str = "date") -> None:
+        dated = [record for record in records if isinstance(record, dict) and record.get(date_key)]
+        # only the day part is used, e.g. "2023-01-01T00:00:00" -> 2023-01-01
+        dates = np.array([str(record[date_key])[:10] for record in dated], dtype="datetime64[D]")
+        order = np.argsort(dates, kind="stable")
+        self.date_key = date_key
+        self.dates = dates[order]
+        self.records = [dated[position] for position in order]
+        self._columns: T.Dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def column(self, field: str) -> np.ndarray:
+        """Float values of ``field`` aligned with ``dates`` (NaN where missing)."""
+        if field not in self._columns:
+            values = [record.get(field) for record in self.records]
+            self._columns[field] = np.array(
+                [value if isinstance(value, (int, float)) else np.nan for value in values], dtype="float64"
+            )
+        return self._columns[field]
+
+    def asof(self, dates: DateLike) -> T.Union[int, np.ndarray]:
+        """Position of the latest row dated on or before each date (-1 if there is none)."""
+        positions = np.searchsorted(self.dates, _as_days(dates), side="right") - 1
+        return _unwrap(dates, positions)
+
+    def nearest(self, dates: DateLike) -> T.Union[int, np.ndarray]:
+        """Position of the row closest to each date, the later row winning ties (-1 if empty)."""
+        targets = np.atleast_1d(_as_days(dates))
+        if not len(self.dates):
+            return _unwrap(dates, np.full(len(targets), -1))
+        after = np.searchsorted(self.dates, targets, side="left")
+        before = after - 1
+        after_clipped = np.minimum(after, len(self.dates) - 1)
+        take_after = (after < len(self.dates)) & (
+            (before < 0) | (self.dates[after_clipped] - targets <= targets - self.dates[np.maximum(before, 0)])
+        )
+        return _unwrap(dates, np.where(take_after, after, before))
+
+    def window(self, date: T.Union[str, np.datetime64], days: int) -> slice:
+        """Row slice dated within ``days`` days (inclusive) of ``date``."""
+        return self.windows([date], days)[0]
+
+    def windows(self, dates: DateLike, days: int) -> T.List[slice]:
+        """Row slices dated within ``days`` days (inclusive) of each date."""
+        targets = np.atleast_1d(_as_days(dates))
+        delta = np.timedelta64(days, "D")
+        starts = np.searchsorted(self.dates, targets - delta, side="left")
+        stops = np.searchsorted(self.dates, targets + delta, side="right")
+        return [slice(int(start), int(stop)) for start, stop in zip(starts, stops)]
+
+
+def _as_days(dates: DateLike) -> np.ndarray:
+    return np.asarray(dates, dtype="datetime64[D]")
+
+
+def _unwrap(dates: DateLike, positions: np.ndarray) -> T.Union[int, np.ndarray]:
+    return positions if np.ndim(_as_days(dates)) else int(np.atleast_1d(positions)[0])
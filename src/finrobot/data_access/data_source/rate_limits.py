@@ -0,0 +1,273 @@
+"""Data Source Rate Limits - Process-wide, priority-aware request scheduling per provider.
+
+Every provider has one named quota, a token bucket shared by all threads and asyncio
+tasks in the process, so parallel code cannot exceed it (e.g. the SEC's 10 requests per
+second). When callers queue for a token, interactive calls are served before background
+prefetch. Wait times are recorded per provider and priority::
+
+    @rate_limited("sec")
+    def get_forms_by_cik(session, cik): ...
+
+
+    with rate_priority(Priority.BACKGROUND):
+        prefetch_filings(tickers)  # yields to interactive agent calls
+
+    get_rate_scheduler().stats()  # {"sec": {"interactive": {...}, "background": {...}}, ...}
+"""
+
+import asyncio
+import enum
+import heapq
+import itertools
+import threading
+import time
+import typing as T
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from functools import wraps
+
+F = T.TypeVar("F", bound=T.Callable[..., T.Any])
+
+# provider -> (calls, period in seconds, burst)
+PROVIDER_RATE_LIMITS: T.Dict[str, T.Tuple[int, float, int]] = {
+    "sec": (10, 1.0, 1),
+    "fmp": (10, 1.0, 5),
+    "finnhub": (30, 1.0, 10),
+    "earnings_calls": (5, 1.0, 1),
+}
+
+
+class Priority(enum.IntEnum):
+    """Order in which queued callers receive tokens (lower first)."""
+
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+_priority: ContextVar[Priority] = ContextVar("finrobot_rate_priority", default=Priority.INTERACTIVE)
+
+
+@contextmanager
+def rate_priority(priority: Priority) -> T.Iterator[None]:
+    """Run the enclosed calls (and asyncio tasks created inside) at ``priority``."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+@dataclass
+class QuotaStats:
+    """Wait-time counters of one provider quota at one priority."""
+
+    requests: int = 0
+    delayed: int = 0  # requests that had to wait for a token
+    waited: float = 0.0  # total seconds spent waiting
+    max_wait: float = 0.0
+
+    def record(self, wait: float) -> None:
+        self.requests += 1
+        if wait > 0:
+            self.delayed += 1
+            self.waited += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def to_dict(self) -> T.Dict[str, T.Any]:
+        return asdict(self)
+
+
+class TokenBucket:
+    """Token bucket refilled at ``calls / period`` tokens per second, holding at most ``burst``.
+
+    Waiting callers form one queue ordered by (priority, arrival); only its head may
+    take a token, so a burst of background work cannot starve an interactive call.
+    """
+
+    def __init__(
+        self,
+        calls: int,
+        period: float,
+        burst: int = 1,
+        clock: T.Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.rate = calls / period
+        self.capacity = float(burst)
+        self.stats: T.Dict[Priority, QuotaStats] = {priority: QuotaStats() for priority in Priority}
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._queue: T.List[T.Tuple[int, int]] = []
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+
+    def acquire(self, priority: T.Optional[Priority] = None) -> float:
+        """Block until a token is granted; return the seconds spent waiting."""
+        priority = _priority.get() if priority is None else priority
+        start = self._clock()
+        waited = False
+        with self._cond:
+            ticket = self._enqueue(priority)
+            try:
+                while True:
+                    delay = self._try_take(ticket)
+                    if delay == 0:
+                        break
+                    waited = True
+                    self._cond.wait(delay)
+            except BaseException:
+                self._discard(ticket)
+                raise
+        return self._granted(priority, start if waited else None)
+
+    async def aacquire(self, priority: T.Optional[Priority] = None) -> float:
+        """Async ``acquire``: sleeps on the event loop instead of blocking the thread."""
+        priority = _priority.get() if priority is None else priority
+        start = self._clock()
+        waited = False
+        with self._cond:
+            ticket = self._enqueue(priority)
+        try:
+            while True:
+                with self._cond:
+                    delay = self._try_take(ticket)
+                if delay == 0:
+                    break
+                waited = True
+                await asyncio.sleep(delay)
+        except BaseException:
+            with self._cond:
+                self._discard(ticket)
+            raise
+        return self._granted(priority, start if waited else None)
+
+    def waiting(self) -> int:
+        with self._cond:
+            return len(self._queue)
+
+    def reset(self) -> None:
+        """Refill the bucket and zero the counters."""
+        with self._cond:
+            self._tokens = self.capacity
+            self._updated = self._clock()
+            self.stats = {priority: QuotaStats() for priority in Priority}
+            self._cond.notify_all()
+
+    def _enqueue(self, priority: Priority) -> T.Tuple[int, int]:
+        ticket = (int(priority), next(self._counter))
+        heapq.heappush(self._queue, ticket)
+        return ticket
+
+    def _discard(self, ticket: T.Tuple[int, int]) -> None:
+        if ticket in self._queue:
+            self._queue.remove(ticket)
+            heapq.heapify(self._queue)
+            self._cond.notify_all()
+
+    def _try_take(self, ticket: T.Tuple[int, int]) -> float:
+        """Take a token for ``ticket`` (returns 0) or return how long to wait before retrying."""
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens >= 1:
+            if self._queue[0] == ticket:
+                heapq.heappop(self._queue)
+                self._tokens -= 1
+                # the next caller in line may be able to take a token right away
+                self._cond.notify_all()
+                return 0.0
+            return 1 / self.rate
+        return (1 - self._tokens) / self.rate
+
+    def _granted(self, priority: Priority, start: T.Optional[float]) -> float:
+        wait = 0.0 if start is None else max(0.0, self._clock() - start)
+        with self._cond:
+            self.stats[priority].record(wait)
+        return wait
+
+
+class RateScheduler:
+    """Named quotas (one ``TokenBucket`` per provider) shared by the whole process."""
+
+    def __init__(
+        self,
+        quotas: T.Optional[T.Mapping[str, T.Tuple[int, float, int]]] = None,
+        clock: T.Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.buckets: T.Dict[str, TokenBucket] = {}
+        self._clock = clock
+        self._lock = threading.Lock()
+        for provider, (calls, period, burst) in (PROVIDER_RATE_LIMITS if quotas is None else quotas).items():
+            self.configure(provider, calls, period, burst)
+
+    def configure(self, provider: str, calls: int, period: float, burst: int = 1) -> None:
+        """Create or replace the quota of ``provider``."""
+        with self._lock:
+            self.buckets[provider] = TokenBucket(calls, period, burst=burst, clock=self._clock)
+
+    def bucket(self, provider: str) -> TokenBucket:
+        with self._lock:
+            if provider not in self.buckets:
+                raise ValueError(f"No rate quota configured for provider {provider!r}")
+            return self.buckets[provider]
+
+    def acquire(self, provider: str, priority: T.Optional[Priority] = None) -> float:
+        """Wait for a request slot of ``provider``; return the seconds spent waiting."""
+        return self.bucket(provider).acquire(priority)
+
+    async def aacquire(self, provider: str, priority: T.Optional[Priority] = None) -> float:
+        return await self.bucket(provider).aacquire(priority)
+
+    def stats(self) -> T.Dict[str, T.Dict[str, T.Dict[str, T.Any]]]:
+        """Wait-time counters per provider and priority."""
+        with self._lock:
+            buckets = dict(self.buckets)
+        return {
+            provider: {priority.name.lower(): stats.to_dict() for priority, stats in bucket.stats.items()}
+            for provider, bucket in buckets.items()
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            buckets = list(self.buckets.values())
+        for bucket in buckets:
+            bucket.reset()
+
+
+_scheduler = RateScheduler()
+
+
+def get_rate_scheduler() -> RateScheduler:
+    """Return the process-wide rate scheduler."""
+    return _scheduler
+
+
+def rate_limited(provider: str) -> T.Callable[[F], F]:
+    """Take a ``provider`` token from the process-wide scheduler before each call.
+
+    Parameters:
+        provider (str): quota name, a key of ``PROVIDER_RATE_LIMITS``.
+
+    Returns:
+        Callable: decorator usable on sync and async functions.
+    """
+
+    def decorator(func: F) -> F:
+        if asyncio.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args: T.Any, **kwargs: T.Any) -> T.Any:
+                await get_rate_scheduler().aacquire(provider)
+                return await func(*args, **kwargs)
+
+            return T.cast(F, async_wrapper)
+
+        @wraps(func)
+        def wrapper(*args: T.Any, **kwargs: T.Any) -> T.Any:
+            get_rate_scheduler().acquire(provider)
+            return func(*args, **kwargs)
+
+        return T.cast(F, wrapper)
+
+    return decorator
@@ -1,10 +1,12 @@
 import os
 import typing as T
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 from typing import Annotated, Any, Dict, List, Optional, Union
 
-import requests
 from finrobot.data_access.data_source import FMPUtils
+from finrobot.data_access.data_source.clients import ClientHandle, http_session
+from finrobot.infrastructure.cache import TTLCache, single_flight
 from finrobot.infrastructure.io.files import SavePathType
 from finrobot.infrastructure.utils import decorate_all_methods
 from sec_api import ExtractorApi, QueryApi, RenderApi
@@ -12,28 +14,114 @@ from sec_api import ExtractorApi, QueryApi, RenderApi
 CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
 PDF_GENERATOR_API = "https://api.sec-api.io/filing-reader"
 
-extractor_api: T.Any = None
-query_api: T.Any = None
-render_api: T.Any = None
+TEN_K_SECTIONS = ["1A", "1B", "7A", "9A", "9B"] + [str(i) for i in range(1, 16)]
+# Filed 10-Ks do not change, the TTL only bounds how long a process keeps them around.
+SECTION_CACHE_TTL = 24 * 60 * 60.0
+SECTION_CACHE_SIZE = 128
+SECTION_FETCH_WORKERS = 4
+
+# NOTE: sec-api clients are stateless wrappers around the library's own requests calls,
+# so they are shared process-wide; only their construction is saved here.
+extractor_api: T.Any = ClientHandle(
+    "sec_api.extractor", lambda: ExtractorApi(os.environ["SEC_API_KEY"]), credentials=("SEC_API_KEY",)
+)
+query_api: T.Any = ClientHandle(
+    "sec_api.query", lambda: QueryApi(os.environ["SEC_API_KEY"]), credentials=("SEC_API_KEY",)
+)
+render_api: T.Any = ClientHandle(
+    "sec_api.render", lambda: RenderApi(os.environ["SEC_API_KEY"]), credentials=("SEC_API_KEY",)
+)
 
 
 def init_sec_api(func: T.Callable[..., T.Any]) -> T.Callable[..., T.Any]:
     @wraps(func)
     def wrapper(*args: T.Any, **kwargs: T.Any) -> T.Any:
-        global extractor_api, query_api, render_api
         if os.environ.get("SEC_API_KEY") is None:
             print("Please set the environment variable SEC_API_KEY to use sec_api.")
             return None
-        else:
-            extractor_api = ExtractorApi(os.environ["SEC_API_KEY"])
-            query_api = QueryApi(os.environ["SEC_API_KEY"])
-            render_api = RenderApi(os.environ["SEC_API_KEY"])
-            print("Sec Api initialized")
-            return func(*args, **kwargs)
+        return func(*args, **kwargs)
 
     return wrapper
 
 
+class TenKSectionCache:
+    """In-process 10-K filing URLs per (ticker, fyear) and LRU of section texts.
+
+    An annual report run asks for the same few sections of one filing many times; the
+    URL index saves the FMP lookup and the section LRU the file cache read for each.
+    """
+
+    def __init__(self, ttl: float = SECTION_CACHE_TTL, maxsize: int = SECTION_CACHE_SIZE) -> None:
+        self.report_addresses: TTLCache[T.Tuple[str, str], str] = TTLCache(ttl=ttl)
+        self.sections: TTLCache[T.Tuple[str, str, str], str] = TTLCache(ttl=ttl, maxsize=maxsize)
+
+    def report_address(self, ticker_symbol: str, fyear: str) -> T.Tuple[Optional[str], str]:
+        """Return ``(url, "")`` for the 10-K of ``fyear``, or ``(None, debug info)`` when FMP has none.
+
+        Failed lookups are not remembered.
+        """
+        key = (ticker_symbol.upper(), str(fyear))
+        address = self.report_addresses.get(key)
+        if address is not None:
+            return address, ""
+        report = FMPUtils.get_sec_report(ticker_symbol, fyear)
+        if not report.startswith("Link: "):
+            return None, report
+        address = report.lstrip("Link: ").split()[0]
+        self.report_addresses.set(key, address)
+        return address, ""
+
+    def clear(self) -> None:
+        self.report_addresses.clear()
+        self.sections.clear()
+
+
+_section_cache = TenKSectionCache()
+
+
+def get_10k_section_cache() -> TenKSectionCache:
+    """Return the process-wide 10-K section cache."""
+    return _section_cache
+
+
+def _normalize_section(section: Union[str, int]) -> str:
+    section = str(section)
+    if section not in TEN_K_SECTIONS:
+        raise ValueError("Section must be in [1, 1A, 1B, 2, 3, 4, 5, 6, 7, 7A, 8, 9, 9A, 9B, 10, 11, 12, 13, 14, 15]")
+    return section
+
+
+def _section_key(ticker_symbol: str, fyear: str, section: str) -> T.Tuple[str, str, str]:
+    return ticker_symbol.upper(), str(fyear), section
+
+
+@single_flight("sec_api")
+def _load_section(ticker_symbol: str, fyear: str, section: str, report_address: str) -> str:
+    """Section text from the in-process LRU, then the file cache, then the extractor API."""
+    key = _section_key(ticker_symbol, fyear, section)
+    section_text = _section_cache.sections.get(key)
+    if section_text is not None:
+        return T.cast(str, section_text)
+    cache_path = os.path.join(CACHE_PATH, f"sec_utils/{ticker_symbol}_{fyear}_{section}.txt")
+    if os.path.exists(cache_path):
+        with open(cache_path, "r") as f:
+            section_text = f.read()
+    else:
+        section_text = extractor_api.get_section(report_address, section, "text")
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, "w") as f:
+            f.write(section_text)
+    _section_cache.sections.set(key, section_text)
+    return T.cast(str, section_text)
+
+
+def _save_section(section_text: str, save_path: str) -> None:
+    os.makedirs(os.path.dirname(save_path), exist_ok=True)
+    with open(save_path, "w") as f:
+        f.write(section_text)
+
+
+@decorate_all_methods(single_flight("sec_api", unless=("save_path", "save_folder")))
 @decorate_all_methods(init_sec_api)
 class SECUtils:
     def get_10k_metadata(
@@ -107,7 +195,7 @@ class SECUtils:
                     os.makedirs(save_folder)
 
                 api_url = f"{PDF_GENERATOR_API}?token={os.environ['SEC_API_KEY']}&type=pdf&url={filing_url}"
-                response = requests.get(api_url, stream=True)
+                response = http_session().get(api_url, stream=True)
                 response.raise_for_status()
 
                 file_path = os.path.join(save_folder, file_name)
@@ -130,47 +218,40 @@ class SECUtils:
         """
         Get a specific section of a 10-K report from the SEC API.
         """
-        if isinstance(section, int):
-            section = str(section)
-        if section not in [
-            "1A",
-            "1B",
-            "7A",
-            "9A",
-            "9B",
-        ] + [str(i) for i in range(1, 16)]:
-            raise ValueError(
-                "Section must be in [1, 1A, 1B, 2, 3, 4, 5, 6, 7, 7A, 8, 9, 9A, 9B, 10, 11, 12, 13, 14, 15]"
-            )
-
-        # os.makedirs(f"{self.project_dir}/10k", exist_ok=True)
-
-        # report_name = f"{self.project_dir}/10k/section_{section}.txt"
-
-        # if USE_CACHE and os.path.exists(report_name):
-        #     with open(report_name, "r") as f:
-        #         section_text = f.read()
-        # else:
+        section = _normalize_section(section)
         if report_address is None:
-            report_address = FMPUtils.get_sec_report(ticker_symbol, fyear)
-            if report_address.startswith("Link: "):
-                report_address = report_address.lstrip("Link: ").split()[0]
-            else:
-                return report_address  # debug info
-
-        cache_path = os.path.join(CACHE_PATH, f"sec_utils/{ticker_symbol}_{fyear}_{section}.txt")
-        if os.path.exists(cache_path):
-            with open(cache_path, "r") as f:
-                section_text = f.read()
-        else:
-            section_text = extractor_api.get_section(report_address, section, "text")
-            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
-            with open(cache_path, "w") as f:
-                f.write(section_text)
+            report_address, debug_info = _section_cache.report_address(ticker_symbol, fyear)
+            if report_address is None:
+                return debug_info
 
+        section_text = _load_section(ticker_symbol, fyear, section, report_address)
         if save_path:
-            os.makedirs(os.path.dirname(save_path), exist_ok=True)
-            with open(save_path, "w") as f:
-                f.write(section_text)
-
+            _save_section(section_text, save_path)
         return section_text
+
+    def get_10k_sections(
+        ticker_symbol: str,
+        fyear: str,
+        sections: List[Union[str, int]],
+        report_address: Optional[str] = None,
+        max_workers: int = SECTION_FETCH_WORKERS,
+    ) -> Dict[str, str]:
+        """
+        Get several sections of one 10-K report, keyed by section name ("1", "1A", "7", ...).
+        The filing URL is resolved once and sections missing from the caches are fetched concurrently.
+        """
+        names = list(dict.fromkeys(_normalize_section(section) for section in sections))
+        if report_address is None:
+            report_address, debug_info = _section_cache.report_address(ticker_symbol, fyear)
+            if report_address is None:
+                return {name: debug_info for name in names}
+
+        texts = {name: _section_cache.sections.get(_section_key(ticker_symbol, fyear, name)) for name in names}
+        missing = [name for name, text in texts.items() if text is None]
+        if missing:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(missing)))) as executor:
+                loaded = executor.map(
+                    lambda name: _load_section(ticker_symbol, fyear, name, T.cast(str, report_address)), missing
+                )
+                texts.update(zip(missing, loaded))
+        return T.cast(Dict[str, str], texts)
@@ -3,22 +3,26 @@ from functools import wraps
 from typing import Annotated, Any, Callable, Dict, List, Optional, Tuple, Union
 
 import yfinance as yf
+from finrobot.data_access.data_source.domains.market_data.price_cache import get_price_cache
+from finrobot.data_access.data_source.domains.market_data.ticker_registry import get_ticker_registry
+from finrobot.infrastructure.cache import single_flight
 from finrobot.infrastructure.io.files import SavePathType, save_output
 from finrobot.infrastructure.utils import decorate_all_methods
 from pandas import DataFrame
 
 
 def init_ticker(func: T.Callable[..., Any]) -> T.Callable[..., Any]:
-    """Decorator to initialize yf.Ticker and pass it to the function."""
+    """Decorator to look up the shared yf.Ticker for the symbol and pass it to the function."""
 
     @wraps(func)
     def wrapper(symbol: Annotated[str, "ticker symbol"], *args: Any, **kwargs: Any) -> Any:
-        ticker = yf.Ticker(symbol)
+        ticker = get_ticker_registry().cached_ticker(symbol)
         return func(ticker, *args, **kwargs)
 
     return wrapper
 
 
+@decorate_all_methods(single_flight("yfinance", unless=("save_path",)))
 @decorate_all_methods(init_ticker)
 class YFinanceUtils:
     def get_stock_data(
@@ -29,7 +33,11 @@ class YFinanceUtils:
     ) -> DataFrame:
         """retrieve stock price data for designated ticker symbol"""
         ticker = symbol
-        stock_data = ticker.history(start=start_date, end=end_date)
+        cache = get_price_cache()
+        if cache is not None:
+            stock_data = cache.get(ticker.ticker, start_date, end_date, lambda s, e: ticker.history(start=s, end=e))
+        else:
+            stock_data = ticker.history(start=start_date, end=end_date)
         save_output(stock_data, f"Stock data for {ticker.ticker}", save_path)
         return stock_data
 
@@ -293,8 +293,8 @@ class ReportAnalysisUtils:
         Retrieve the business summary and related section of its 10-K report for the given ticker symbol.
         Then return with an instruction on how to describe the performance highlights per business of the company.
         """
-        business_summary = SECUtils.get_10k_section(ticker_symbol, fyear, 1)
-        section_7 = SECUtils.get_10k_section(ticker_symbol, fyear, 7)
+        sections = SECUtils.get_10k_sections(ticker_symbol, fyear, [1, 7])
+        business_summary, section_7 = sections["1"], sections["7"]
         section_text = (
             "Business summary:\n"
             + business_summary
@@ -325,8 +325,8 @@ class ReportAnalysisUtils:
         Then return with an instruction on how to describe the company's industry, strengths, trends, and strategic initiatives.
         """
         company_name = T.cast(str, YFinanceUtils.get_stock_info(ticker_symbol).get("shortName", "N/A"))
-        business_summary = SECUtils.get_10k_section(ticker_symbol, fyear, 1)
-        section_7 = SECUtils.get_10k_section(ticker_symbol, fyear, 7)
+        sections = SECUtils.get_10k_sections(ticker_symbol, fyear, [1, 7])
+        business_summary, section_7 = sections["1"], sections["7"]
         section_text = (
             "Company Name: "
             + company_name
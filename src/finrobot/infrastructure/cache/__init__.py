@@ -0,0 +1,13 @@
+"""Infrastructure Cache - In-process caching primitives shared by the data sources."""
+
+from .singleflight import SingleFlight, SingleFlightStats, get_single_flight, single_flight
+from .ttl import CacheStats, TTLCache
+
+__all__ = [
+    "CacheStats",
+    "TTLCache",
+    "SingleFlight",
+    "SingleFlightStats",
+    "get_single_flight",
+    "single_flight",
+]
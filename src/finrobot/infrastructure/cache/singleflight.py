@@ -0,0 +1,208 @@
+"""Infrastructure Cache - Single-flight coalescing of concurrent identical calls.
+
+When several threads (or asyncio tasks) ask for the same key while a call for it is
+still running, only the first one executes; the others wait for and share its result.
+Nothing is kept once the call completes, so this complements, not replaces, caching.
+"""
+
+import asyncio
+import copy
+import inspect
+import threading
+import typing as T
+from concurrent.futures import Future
+from dataclasses import asdict, dataclass
+from functools import wraps
+
+F = T.TypeVar("F", bound=T.Callable[..., T.Any])
+
+
+@dataclass
+class SingleFlightStats:
+    """Counters describing how many calls were coalesced."""
+
+    calls: int = 0
+    executions: int = 0
+    suppressed: int = 0  # calls that shared another call's in-flight result
+
+    def to_dict(self) -> T.Dict[str, int]:
+        return asdict(self)
+
+
+class _Flight:
+    def __init__(self, owner: int) -> None:
+        self.future: "Future[T.Any]" = Future()
+        self.owner = owner  # leading thread (sync) or task (async)
+
+
+class SingleFlight:
+    """Registry of in-flight calls keyed by an arbitrary hashable key."""
+
+    def __init__(self) -> None:
+        self.stats = SingleFlightStats()
+        self._flights: T.Dict[T.Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: T.Hashable, fn: T.Callable[[], T.Any]) -> T.Any:
+        """Run ``fn`` unless a call for ``key`` is in flight, in which case share its result."""
+        flight, leader = self._join(("sync", key), threading.get_ident())
+        if not leader:
+            return _share(flight.future.result())
+        return self._lead(("sync", key), flight, fn)
+
+    async def ado(self, key: T.Hashable, factory: T.Callable[[], T.Awaitable[T.Any]]) -> T.Any:
+        """Async ``do``: ``factory`` returns the awaitable to run for ``key``."""
+        # NOTE: async calls use their own key space so a blocking sync caller can never
+        # wait on a coroutine scheduled on its own event loop.
+        flight, leader = self._join(("async", key), id(asyncio.current_task()))
+        if not leader:
+            return _share(await asyncio.wrap_future(flight.future))
+        try:
+            result = await factory()
+        except BaseException as error:
+            self._finish(("async", key), flight, error=error)
+            raise
+        self._finish(("async", key), flight, result=result)
+        return result
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._flights)
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.stats = SingleFlightStats()
+
+    def _join(self, key: T.Hashable, owner: int) -> T.Tuple[_Flight, bool]:
+        with self._lock:
+            self.stats.calls += 1
+            flight = self._flights.get(key)
+            if flight is not None and flight.owner != owner:
+                self.stats.suppressed += 1
+                return flight, False
+            # A re-entrant call from the leader itself runs on its own instead of deadlocking.
+            flight = _Flight(owner)
+            self._flights.setdefault(key, flight)
+            self.stats.executions += 1
+            return flight, True
+
+    def _lead(self, key: T.Hashable, flight: _Flight, fn: T.Callable[[], T.Any]) -> T.Any:
+        try:
+            result = fn()
+        except BaseException as error:
+            self._finish(key, flight, error=error)
+            raise
+        self._finish(key, flight, result=result)
+        return result
+
+    def _finish(
+        self,
+        key: T.Hashable,
+        flight: _Flight,
+        result: T.Any = None,
+        error: T.Optional[BaseException] = None,
+    ) -> None:
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+        if error is not None:
+            flight.future.set_exception(error)
+        else:
+            flight.future.set_result(result)
+
+
+_single_flight = SingleFlight()
+
+
+def get_single_flight() -> SingleFlight:
+    """Return the process-wide single-flight registry."""
+    return _single_flight
+
+
+def single_flight(namespace: str, unless: T.Sequence[str] = ()) -> T.Callable[[F], F]:
+    """Coalesce concurrent calls of the decorated function that have identical arguments.
+
+    Only use it on reads: a caller that shares another call's result skips the body, so
+    anything the body writes happens once. Calls whose arguments cannot be turned into a
+    key (e.g. a DataFrame) run normally, and so do calls that pass any of the ``unless``
+    parameters, such as an output path::
+
+        @single_flight("yfinance", unless=("save_path",))
+        def get_stock_data(symbol, start_date, end_date, save_path=None): ...
+
+    Parameters:
+        namespace (str): provider name, part of the key together with the function name.
+        unless (Sequence[str]): parameters that make a call run on its own when not None.
+
+    Returns:
+        Callable: decorator usable on sync and async functions.
+    """
+
+    def decorator(func: F) -> F:
+        name = f"{namespace}:{getattr(func, '__qualname__', repr(func))}"
+        signature = inspect.signature(func) if unless else None
+
+        def key_of(args: T.Tuple[T.Any, ...], kwargs: T.Dict[str, T.Any]) -> T.Optional[T.Hashable]:
+            if signature is not None and _passes_any(signature, unless, args, kwargs):
+                return None
+            return _make_key(name, args, kwargs)
+
+        if asyncio.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args: T.Any, **kwargs: T.Any) -> T.Any:
+                key = key_of(args, kwargs)
+                if key is None:
+                    return await func(*args, **kwargs)
+                return await get_single_flight().ado(key, lambda: func(*args, **kwargs))
+
+            return T.cast(F, async_wrapper)
+
+        @wraps(func)
+        def wrapper(*args: T.Any, **kwargs: T.Any) -> T.Any:
+            key = key_of(args, kwargs)
+            if key is None:
+                return func(*args, **kwargs)
+            return get_single_flight().do(key, lambda: func(*args, **kwargs))
+
+        return T.cast(F, wrapper)
+
+    return decorator
+
+
+def _passes_any(
+    signature: inspect.Signature, names: T.Sequence[str], args: T.Tuple[T.Any, ...], kwargs: T.Dict[str, T.Any]
+) -> bool:
+    try:
+        bound = signature.bind_partial(*args, **kwargs)
+    except TypeError:
+        return True  # let the call itself raise
+    return any(bound.arguments.get(name) is not None for name in names)
+
+
+def _make_key(name: str, args: T.Tuple[T.Any, ...], kwargs: T.Dict[str, T.Any]) -> T.Optional[T.Hashable]:
+    try:
+        return (name, _freeze(args), _freeze(kwargs))
+    except TypeError:
+        return None
+
+
+def _freeze(value: T.Any) -> T.Hashable:
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    hash(value)  # raises TypeError for unhashable values
+    return T.cast(T.Hashable, value)
+
+
+def _share(result: T.Any) -> T.Any:
+    # Waiters get their own copy so one caller's mutation cannot leak into another's result.
+    if type(result).__module__.startswith("pandas"):
+        return result.copy()
+    try:
+        return copy.deepcopy(result)
+    except (TypeError, copy.Error):
+        return result  # e.g. client objects holding locks or sockets
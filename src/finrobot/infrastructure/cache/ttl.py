@@ -0,0 +1,108 @@
+"""Infrastructure Cache - Thread-safe in-memory cache with per-entry expiry."""
+
+import threading
+import time
+import typing as T
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+
+K = T.TypeVar("K")
+V = T.TypeVar("V")
+
+_MISSING = object()
+
+
+@dataclass
+class CacheStats:
+    """Counters describing cache effectiveness."""
+
+    hits: int = 0
+    misses: int = 0
+    expirations: int = 0
+    evictions: int = 0
+
+    def to_dict(self) -> T.Dict[str, int]:
+        return asdict(self)
+
+
+class TTLCache(T.Generic[K, V]):
+    """Mapping whose entries expire ``ttl`` seconds after they are stored.
+
+    Parameters:
+        ttl (float): default time-to-live in seconds.
+        maxsize (int | None): evict least recently used entries above this size.
+        clock (Callable[[], float]): monotonic time source, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        maxsize: T.Optional[int] = None,
+        clock: T.Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.stats = CacheStats()
+        self._clock = clock
+        self._data: "OrderedDict[K, T.Tuple[float, V]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K, default: T.Any = None) -> T.Any:
+        """Return the live value for ``key`` or ``default``."""
+        with self._lock:
+            value = self._lookup(key)
+        return default if value is _MISSING else value
+
+    def set(self, key: K, value: V, ttl: T.Optional[float] = None) -> None:
+        """Store ``value`` for ``ttl`` seconds (defaults to the cache ttl)."""
+        expires_at = self._clock() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while self.maxsize is not None and len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.stats.evictions += 1
+
+    def get_or_set(self, key: K, factory: T.Callable[[], V], ttl: T.Optional[float] = None) -> V:
+        """Return the cached value, computing and storing it with ``factory`` on a miss."""
+        with self._lock:
+            value = self._lookup(key)
+        if value is not _MISSING:
+            return T.cast(V, value)
+        value = factory()
+        self.set(key, value, ttl)
+        return value
+
+    def invalidate(self, key: K) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            entry = self._data.get(T.cast(K, key))
+            return entry is not None and entry[0] > self._clock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            now = self._clock()
+            return sum(1 for expires_at, _ in self._data.values() if expires_at > now)
+
+    def _lookup(self, key: K) -> T.Any:
+        """Return the live value or ``_MISSING``; caller must hold the lock."""
+        entry = self._data.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return _MISSING
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._data[key]
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return _MISSING
+        self._data.move_to_end(key)
+        self.stats.hits += 1
+        return value
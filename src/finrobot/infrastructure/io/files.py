@@ -2,6 +2,7 @@
 
 import json
 import os
+import threading
 import typing as T
 
 SavePathType = T.Union[str, os.PathLike[str], None]
@@ -31,6 +32,30 @@ def save_output(
         print(f"{name} saved to {save_path}")
 
 
+def atomic_write(path: str, writer: T.Callable[[str], T.Any]) -> None:
+    """Write a file through ``writer(tmp_path)`` and move it into place in one step.
+
+    Readers see either the previous file or the complete new one, never a partial write.
+
+    Parameters:
+        path (str): destination file.
+        writer (Callable[[str], Any]): writes the content to the temporary path it is given.
+    """
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        writer(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def dump_json(payload: T.Any, path: str) -> None:
+    """Write ``payload`` as JSON to ``path``; a ``writer`` for ``atomic_write``."""
+    with open(path, "w") as f:
+        json.dump(payload, f)
+
+
 def register_keys_from_json(path: str) -> None:
     """Register API keys from a JSON file.
 
@@ -1,5 +1,7 @@
 """Infrastructure Layer - General utilities."""
 
+import asyncio
+import threading
 import typing as T
 from datetime import datetime, timedelta
 
@@ -55,4 +57,49 @@ def decorate_all_methods(decorator: T.Callable[..., T.Any]) -> T.Callable[[T.Typ
     return dectheclass
 
 
-__all__ = ["get_current_date", "get_next_weekday", "decorate_all_methods"]
+_background_loop: T.Optional[asyncio.AbstractEventLoop] = None
+_background_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Return the process-wide event loop that ``run_sync`` uses from async contexts."""
+    global _background_loop
+    with _background_lock:
+        if _background_loop is None or _background_loop.is_closed():
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="run-sync-loop", daemon=True).start()
+            _background_loop = loop
+        return _background_loop
+
+
+def run_sync(coro: T.Coroutine[T.Any, T.Any, T.Any]) -> T.Any:
+    """Run a coroutine to completion from synchronous code.
+
+    Uses ``asyncio.run`` when no event loop is running in this thread. Sync code called
+    from inside a running loop (e.g. a sync tool invoked by an async agent) hands the
+    coroutine to one long-lived background loop and waits for it, which blocks the
+    calling loop until the coroutine is done: async callers should await the async API
+    instead.
+
+    Parameters:
+        coro (Coroutine): coroutine to run.
+
+    Returns:
+        Any: the coroutine result.
+
+    Raises:
+        RuntimeError: when called from a coroutine on the background loop itself.
+    """
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    loop = _get_background_loop()
+    if running is loop:
+        coro.close()
+        raise RuntimeError("run_sync cannot wait on its own event loop; await the coroutine instead")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+__all__ = ["get_current_date", "get_next_weekday", "decorate_all_methods", "run_sync"]
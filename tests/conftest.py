@@ -1,4 +1,5 @@
 import importlib.machinery
+import os
 import sys
 import types
 import typing as T
@@ -203,3 +204,48 @@ mock_af = sys.modules.get("agent_framework", MockModule("agent_framework"))
 mock_af.ChatAgent = ChatAgent
 mock_af.ChatMessage = ChatMessage
 sys.modules["agent_framework"] = mock_af
+
+
+# Process-wide data-source caches would otherwise leak mocked payloads between tests.
+import pytest  # noqa: E402
+
+SEC_TICKERS_FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "company_tickers.json")
+
+
+@pytest.fixture(autouse=True)
+def reset_data_source_caches() -> T.Generator[None, None, None]:
+    from finrobot.data_access.data_source.clients import get_client_registry
+    from finrobot.data_access.data_source.domains.filings.cik_index import configure_cik_index
+    from finrobot.data_access.data_source.domains.filings.filing_store import configure_filing_store
+    from finrobot.data_access.data_source.domains.filings.submissions import get_submissions_cache
+    from finrobot.data_access.data_source.domains.market_data.basic_financials import get_basic_financials_cache
+    from finrobot.data_access.data_source.domains.market_data.ticker_registry import get_ticker_registry
+    from finrobot.data_access.data_source.filings_src.pipeline import shutdown_parser_pool
+    from finrobot.data_access.data_source.filings_src.prepline_sec_filings.element_cache import get_element_cache
+    from finrobot.data_access.data_source.fmp_data import get_fmp_data_client
+    from finrobot.data_access.data_source.rate_limits import get_rate_scheduler
+    from finrobot.data_access.data_source.sec_utils import get_10k_section_cache
+
+    get_ticker_registry().clear()
+    get_client_registry().clear()
+    get_fmp_data_client().clear()
+    get_basic_financials_cache().clear()
+    get_rate_scheduler().reset()
+    get_submissions_cache().clear()
+    get_element_cache().clear()
+    get_10k_section_cache().clear()
+    # tests patch the process pool with threads, so every test starts its own parser pool
+    shutdown_parser_pool()
+    # ticker -> CIK lookups never download the SEC bulk file during tests
+    configure_cik_index(SEC_TICKERS_FIXTURE)
+    configure_filing_store(None)
+    yield
+    get_ticker_registry().clear()
+    get_client_registry().clear()
+    get_fmp_data_client().clear()
+    get_basic_financials_cache().clear()
+    get_rate_scheduler().reset()
+    get_submissions_cache().clear()
+    get_element_cache().clear()
+    get_10k_section_cache().clear()
+    shutdown_parser_pool()
@@ -0,0 +1,101 @@
+import json
+import os
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from finrobot.data_access.data_source.domains.filings.cik_index import CikIndex, get_cik_index
+from finrobot.data_access.data_source.filings_src.prepline_sec_filings.fetch import get_cik_by_ticker
+from finrobot.data_access.data_source.rate_limits import get_rate_scheduler
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "fixtures", "company_tickers.json")
+MODULE = "finrobot.data_access.data_source.domains.filings.cik_index"
+GET = "requests.Session.get"
+
+
+def test_lookups_from_fixture() -> None:
+    index = CikIndex(FIXTURE)
+    assert index.cik("AAPL") == "0000320193"
+    assert index.cik("aapl") == "0000320193"
+    assert index.cik("BRK.B") == index.cik("BRK-B") == "0001067983"
+    assert index.cik("UNLISTED") is None
+    assert index.title("MSFT") == "MICROSOFT CORP"
+    assert "NVDA" in index and len(index) == 10
+
+
+def test_resolve_watchlist() -> None:
+    resolved = CikIndex(FIXTURE).resolve(["AAPL", "GOOG", "GOOGL", "UNLISTED"])
+    assert resolved == {"AAPL": "0000320193", "GOOG": "0001652044", "GOOGL": "0001652044", "UNLISTED": None}
+
+
+def test_columnar_exchange_layout(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    path = tmp_path / "company_tickers_exchange.json"
+    payload = {"fields": ["cik", "name", "ticker", "exchange"], "data": [[320193, "Apple Inc.", "AAPL", "Nasdaq"]]}
+    path.write_text(json.dumps(payload))
+    index = CikIndex(path)
+    assert index.cik("AAPL") == "0000320193"
+    assert index.title("AAPL") == "Apple Inc."
+
+
+def test_download_is_cached_and_refreshed(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    with open(FIXTURE) as f:
+        payload = json.load(f)
+    response = MagicMock()
+    response.json.return_value = payload
+    with patch(GET, return_value=response) as mock_get:
+        index = CikIndex("https://www.sec.gov/files/company_tickers.json", cache_dir=tmp_path, user_agent="Acme a@b.c")
+        assert index.resolve(["AAPL", "MSFT"]) == {"AAPL": "0000320193", "MSFT": "0000789019"}
+        index.cik("TSLA")
+        assert mock_get.call_count == 1
+        assert mock_get.call_args.kwargs["headers"] == {"User-Agent": "Acme a@b.c"}
+        assert (tmp_path / "company_tickers.json").exists()
+
+        # a new process reads the kept file instead of downloading it
+        again = CikIndex("https://www.sec.gov/files/company_tickers.json", cache_dir=tmp_path)
+        assert again.cik("TSLA") == "0001318605"
+        assert mock_get.call_count == 1
+
+        assert again.refresh() == 10
+        assert mock_get.call_count == 2
+    assert get_rate_scheduler().stats()["sec"]["interactive"]["requests"] == 2
+
+
+def test_failed_cache_write_leaves_no_temporary_file(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    def disk_full(payload: Any, path: str) -> None:
+        with open(path, "w") as f:
+            f.write("{")
+        raise OSError("No space left on device")
+
+    response = MagicMock()
+    response.json.return_value = {"0": {"cik_str": 320193, "ticker": "AAPL", "title": "Apple Inc."}}
+    with patch(GET, return_value=response), patch(f"{MODULE}.dump_json", side_effect=disk_full):
+        CikIndex("https://www.sec.gov/files/company_tickers.json", cache_dir=tmp_path).cik("AAPL")
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_failed_download_falls_back_to_search() -> None:
+    with patch(GET, side_effect=OSError("offline")):
+        index = CikIndex("https://www.sec.gov/files/company_tickers.json")
+        assert index.cik("AAPL") is None
+
+
+@patch("finrobot.data_access.data_source.filings_src.prepline_sec_filings.fetch.requests.get")
+def test_get_cik_by_ticker_uses_index_before_search(mock_get: MagicMock) -> None:
+    assert get_cik_index().cik("MSFT") == "0000789019"
+    assert get_cik_by_ticker("MSFT") == "0000789019"
+    mock_get.assert_not_called()
+
+    mock_get.return_value.text = "CIK=0001234567"
+    assert get_cik_by_ticker("UNLISTED") == "0001234567"
+    mock_get.assert_called_once()
+
+
+def test_user_agent_from_environment(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    monkeypatch.setenv("FINROBOT_SEC_TICKERS", "https://www.sec.gov/files/company_tickers.json")
+    monkeypatch.setenv("FINROBOT_SEC_USER_AGENT", "Acme a@b.c")
+    monkeypatch.setattr(f"{MODULE}._default_index", None)
+    assert get_cik_index().user_agent == "Acme a@b.c"
+
+
+def test_missing_fixture_file_is_not_fatal(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    index = CikIndex(tmp_path / "missing.json")
+    assert index.resolve(["AAPL"]) == {"AAPL": None}
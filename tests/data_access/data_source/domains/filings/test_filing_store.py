@@ -0,0 +1,117 @@
+import concurrent.futures
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+from finrobot.data_access.data_source.domains.filings.filing_store import (
+    GZIP,
+    FilingStore,
+    configure_filing_store,
+    parse_archive_url,
+)
+from finrobot.data_access.data_source.filings_src.prepline_sec_filings.fetch import get_filing
+from finrobot.data_access.data_source.filings_src.sec_filings import SECExtractor
+
+FILING = "<SEC-DOCUMENT>\r\n<TYPE>10-K\r\n" + "Item 1. Business\r\n" * 500 + "</SEC-DOCUMENT>\r\n"
+
+
+def test_round_trip_is_compressed_and_exact(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    store = FilingStore(tmp_path, codec=GZIP)
+    sha256 = store.put("0000320193", "0000320193-23-000106", FILING)
+
+    assert store.get(320193, "000032019323000106") == FILING
+    assert ("320193", "0000320193-23-000106") in store
+    entry = store.entry("320193", "000032019323000106")
+    assert entry is not None and entry["sha256"] == sha256
+    assert entry["compressed_size"] < entry["size"] / 10
+    assert os.path.exists(tmp_path / "objects" / sha256[:2] / f"{sha256}.gz")
+    assert store.get("320193", "0000320193-24-000001") is None
+    assert store.stats.hits == 1 and store.stats.misses == 1
+
+
+def test_open_streams_one_document(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    store = FilingStore(tmp_path, codec=GZIP)
+    store.put("320193", "000032019323000106", FILING)
+    stream = store.open("320193", "000032019323000106")
+    assert stream is not None
+    with stream:
+        assert stream.readline() == "<SEC-DOCUMENT>\r\n"
+        assert stream.read(7) == "<TYPE>1"
+
+
+def test_identical_content_is_stored_once(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    store = FilingStore(tmp_path, codec=GZIP)
+    first = store.put("320193", "000032019323000106", FILING)
+    assert store.put("320193", "000032019323000106", FILING) == first
+    store.put("320193", "000032019323000107", FILING)  # same bytes under another key
+
+    assert store.stats.stored == 2
+    assert len(os.listdir(tmp_path / "objects" / first[:2])) == 1
+    assert len(store) == 2
+
+
+def test_concurrent_writers_share_the_index(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    stores = [FilingStore(tmp_path, codec=GZIP) for _ in range(4)]
+
+    def write(i: int) -> None:
+        stores[i % 4].put("320193", f"0000320193230{i:05d}", f"{FILING}{i}")
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(write, range(40)))
+
+    reader = FilingStore(tmp_path, codec=GZIP)
+    assert len(reader) == 40
+    assert reader.get("320193", "000032019323000017") == f"{FILING}17"
+    assert not [name for _, _, names in os.walk(tmp_path) for name in names if name.endswith(".tmp")]
+
+
+def test_failed_object_write_leaves_no_temporary_file(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    store = FilingStore(tmp_path, codec=GZIP)
+    with patch("os.replace", side_effect=OSError("No space left on device")), pytest.raises(OSError):
+        store.put("320193", "000032019323000106", FILING)
+
+    assert not [name for _, _, names in os.walk(tmp_path) for name in names]
+    assert store.get("320193", "000032019323000106") is None
+
+
+def test_parse_archive_url() -> None:
+    url = "https://www.sec.gov/Archives/edgar/data/320193/000032019323000106/0000320193-23-000106.txt"
+    assert parse_archive_url(url) == ("320193", "000032019323000106")
+    assert parse_archive_url("http://test.url") is None
+    primary = "https://www.sec.gov/Archives/edgar/data/320193/000032019323000106/aapl-20230930.htm"
+    assert parse_archive_url(primary) is None
+
+
+def test_unknown_codec(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    with pytest.raises(ValueError):
+        FilingStore(tmp_path, codec="lz4")
+
+
+@patch("finrobot.data_access.data_source.filings_src.prepline_sec_filings.fetch.requests.Session")
+def test_get_filing_downloads_each_accession_once(  # type: ignore[no-untyped-def]
+    mock_session_cls: MagicMock, tmp_path
+) -> None:
+    mock_session_cls.return_value.get.return_value.text = FILING
+    configure_filing_store(tmp_path, codec=GZIP)
+
+    assert get_filing("0000320193-23-000106", 320193, "Comp", "mail@test.com") == FILING
+    assert get_filing("0000320193-23-000106", 320193, "Comp", "mail@test.com") == FILING
+    assert mock_session_cls.return_value.get.call_count == 1
+
+
+def test_documents_of_one_accession_do_not_collide(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    folder = "https://www.sec.gov/Archives/edgar/data/320193/000032019323000106"
+    documents = {f"{folder}/0000320193-23-000106.txt": FILING, f"{folder}/aapl-20230930.htm": "<html>10-K</html>"}
+    store = configure_filing_store(tmp_path, codec=GZIP)
+    assert store is not None
+
+    with patch.object(SECExtractor, "_download_filing", side_effect=lambda url, *_: documents[url]) as download:
+        extractor = SECExtractor(ticker="AAPL")
+        for _ in range(2):
+            for url, text in documents.items():
+                assert extractor.get_filing(url, "Comp", "mail@test.com") == text
+
+    # only the full submission is stored; the primary document is downloaded each time
+    assert store.get(320193, "0000320193-23-000106") == FILING
+    assert [call.args[0] for call in download.call_args_list].count(f"{folder}/aapl-20230930.htm") == 2
+    assert download.call_count == 3
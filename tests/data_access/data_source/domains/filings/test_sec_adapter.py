@@ -42,7 +42,7 @@ class TestSECAdapter:
         assert os.path.isdir(save_folder)
 
     @patch("finrobot.data_access.data_source.domains.filings.sec_adapter.SECAdapter.get_10k_metadata")
-    @patch("finrobot.data_access.data_source.domains.filings.sec_adapter.requests.get")
+    @patch("requests.Session.get")
     def test_download_10k_pdf(self, mock_get, mock_get_metadata, sec_api_key) -> None:  # type: ignore[no-untyped-def]
         mock_get_metadata.return_value = {
             "ticker": "AAPL",
@@ -66,12 +66,14 @@ class TestSECAdapter:
 
     @patch("finrobot.data_access.data_source.domains.filings.sec_adapter.FMPUtils.get_sec_report")
     @patch("finrobot.data_access.data_source.domains.filings.sec_adapter.ExtractorApi")
-    def test_get_10k_section(self, mock_extractor_cls, mock_get_report, sec_api_key) -> None:  # type: ignore[no-untyped-def]
+    def test_get_10k_section(self, mock_extractor_cls, mock_get_report, sec_api_key, tmp_path) -> None:  # type: ignore[no-untyped-def]
         mock_extractor = MagicMock()
         mock_extractor_cls.return_value = mock_extractor
         mock_extractor.get_section.return_value = "Section Content"
 
         mock_get_report.return_value = "Link: http://report"
 
-        result = SECAdapter.get_10k_section("AAPL", "2023", "1A")
+        with patch("finrobot.data_access.data_source.domains.filings.sec_adapter.CACHE_PATH", str(tmp_path)):
+            result = SECAdapter.get_10k_section("AAPL", "2023", "1A")
         assert result == "Section Content"
+        assert (tmp_path / "sec_utils" / "AAPL_2023_1A.txt").read_text() == "Section Content"
@@ -0,0 +1,137 @@
+from typing import Any, Dict, List, Optional, Tuple
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+from finrobot.data_access.data_source.domains.filings.submissions import SubmissionsCache
+
+GET = "requests.Session.get"
+
+
+def _response(status_code: int, payload: Optional[Dict[str, Any]] = None, **headers: str) -> MagicMock:
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers
+    response.json.return_value = payload
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(f"{status_code} Error")
+    return response
+
+
+def _columns(*rows: Tuple[str, ...]) -> Dict[str, List[str]]:
+    return {
+        "accessionNumber": [row[0] for row in rows],
+        "form": [row[1] for row in rows],
+        "filingDate": [row[2] for row in rows],
+        "reportDate": [row[3] for row in rows],
+    }
+
+
+DOCUMENT: Dict[str, Any] = {
+    "cik": "320193",
+    "filings": {
+        "recent": _columns(("0001-24-000001", "10-K", "2024-11-01", "2024-09-28")),
+        "files": [
+            {"name": "CIK0000320193-submissions-001.json", "filingFrom": "2015-01-01", "filingTo": "2019-12-31"},
+            {"name": "CIK0000320193-submissions-002.json", "filingFrom": "2005-01-01", "filingTo": "2014-12-31"},
+        ],
+    },
+}
+PAGE_001 = _columns(("0001-18-000001", "10-K", "2018-11-05", "2018-09-29"))
+
+
+def test_revalidates_with_validators_and_reuses_body_on_304() -> None:
+    cache = SubmissionsCache(max_age=0)
+    with patch(GET) as mock_get:
+        mock_get.return_value = _response(200, DOCUMENT, ETag='"v1"', **{"Last-Modified": "Mon, 01 Jan 2024"})
+        first = cache.fetch("320193", headers={"User-Agent": "test"}, since="2024-01-01")
+        mock_get.return_value = _response(304)
+        second = cache.fetch(320193, headers={"User-Agent": "test"}, since="2024-01-01")
+
+    assert first.ok and second.ok
+    assert second.data == first.data
+    url, kwargs = mock_get.call_args[0][0], mock_get.call_args[1]
+    assert url.endswith("/CIK0000320193.json")
+    assert kwargs["headers"]["If-None-Match"] == '"v1"'
+    assert kwargs["headers"]["If-Modified-Since"] == "Mon, 01 Jan 2024"
+    assert kwargs["headers"]["User-Agent"] == "test"
+    assert cache.stats.downloaded == 1 and cache.stats.not_modified == 1
+
+
+def test_fresh_document_is_served_without_request() -> None:
+    cache = SubmissionsCache(max_age=3600)
+    with patch(GET, return_value=_response(200, DOCUMENT)) as mock_get:
+        cache.fetch("320193", since="2024-01-01")
+        cache.fetch("320193", since="2024-01-01")
+    assert mock_get.call_count == 1
+    assert cache.stats.fresh == 1
+
+
+def test_merges_only_history_pages_reaching_since() -> None:
+    cache = SubmissionsCache(max_age=3600)
+    with patch(GET) as mock_get:
+        mock_get.side_effect = [_response(200, DOCUMENT), _response(200, PAGE_001)]
+        response = cache.fetch("320193", since="2018-01-01")
+        again = cache.fetch("320193", since="2018-01-01")
+
+    assert mock_get.call_count == 2  # page 002 ends in 2014 and is never requested
+    assert mock_get.call_args_list[1][0][0].endswith("/CIK0000320193-submissions-001.json")
+    assert response.data is not None
+    recent = response.data["filings"]["recent"]
+    assert recent["accessionNumber"] == ["0001-24-000001", "0001-18-000001"]
+    assert recent["reportDate"] == ["2024-09-28", "2018-09-29"]
+    assert again.data == response.data
+    # the cached document itself is not modified by the merge
+    assert len(DOCUMENT["filings"]["recent"]["accessionNumber"]) == 1
+
+
+def test_error_serves_stale_copy_or_nothing() -> None:
+    cache = SubmissionsCache(max_age=0)
+    with patch(GET, return_value=_response(503)):
+        missing = cache.fetch("320193", since="2024-01-01")
+    assert not missing.ok and missing.status_code == 503
+
+    with patch(GET) as mock_get:
+        mock_get.side_effect = [_response(200, DOCUMENT), _response(503)]
+        cache.fetch("320193", since="2024-01-01")
+        stale = cache.fetch("320193", since="2024-01-01")
+    assert stale.ok and stale.status_code == 503
+    assert stale.data == DOCUMENT
+    assert cache.stats.stale == 1
+
+
+def test_documents_and_pages_persist_under_root(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    with patch(GET) as mock_get:
+        mock_get.side_effect = [_response(200, DOCUMENT, ETag='"v1"'), _response(200, PAGE_001)]
+        SubmissionsCache(tmp_path, max_age=0).fetch("320193", since="2018-01-01")
+
+    assert (tmp_path / "CIK0000320193.json").exists()
+    assert (tmp_path / "CIK0000320193-submissions-001.json").exists()
+    with patch(GET, return_value=_response(304)) as mock_get:
+        response = SubmissionsCache(tmp_path, max_age=0).fetch("320193", since="2018-01-01")
+    # only the revalidation is sent; the immutable history page comes from disk
+    assert mock_get.call_count == 1
+    assert mock_get.call_args[1]["headers"]["If-None-Match"] == '"v1"'
+    assert response.data is not None
+    assert len(response.data["filings"]["recent"]["accessionNumber"]) == 2
+
+
+def test_failed_write_leaves_no_temporary_file(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    with pytest.raises(TypeError):
+        SubmissionsCache(tmp_path)._write("CIK0000320193.json", {"filings": object()})
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_failed_history_page_falls_back_to_recent_filings() -> None:
+    cache = SubmissionsCache(max_age=3600)
+    with patch(GET) as mock_get:
+        mock_get.side_effect = [_response(200, DOCUMENT), _response(503), _response(200, PAGE_001)]
+        degraded = cache.fetch("320193", since="2018-01-01")
+        retried = cache.fetch("320193", since="2018-01-01")
+
+    assert degraded.ok and degraded.data == DOCUMENT
+    assert cache.stats.history_failed == 1
+    # the failure is not remembered; the page is requested again
+    assert retried.data is not None
+    assert len(retried.data["filings"]["recent"]["accessionNumber"]) == 2
+    assert cache.stats.history_pages == 1
@@ -0,0 +1,96 @@
+import json
+import os
+from collections import defaultdict
+from typing import Any, Dict, Generator, List, Optional
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+from finrobot.data_access.data_source.domains.market_data.basic_financials import BasicFinancials
+from finrobot.data_access.data_source.domains.market_data.finnhub_adapter import FinnHubMarketAdapter
+from finrobot.data_access.data_source.finnhub_utils import FinnHubUtils
+
+PAYLOAD: Dict[str, Any] = {
+    "metric": {"peTTM": 25.0, "52WeekHigh": 199.6},
+    "series": {
+        "annual": {
+            "eps": [
+                {"period": "2023-09-30", "v": 6.13},
+                {"period": "2022-09-24", "v": 6.11},
+                {"period": "2021-09-25", "v": 5.61},
+            ],
+            "bookValue": [{"period": "2023-09-30", "v": 62146.0}, {"period": "2020-09-26", "v": 65339.0}],
+        },
+        "quarterly": {
+            "eps": [{"period": "2023-12-30", "v": 2.18}, {"period": "2023-09-30", "v": 1.46}],
+            "peTTM": [{"period": "2023-12-30", "v": 29.9}],
+        },
+    },
+}
+
+
+def legacy_history(
+    payload: Dict[str, Any], freq: str, start: str, end: str, selected: Optional[List[str]] = None
+) -> pd.DataFrame:
+    output: Dict[str, Dict[str, Any]] = defaultdict(dict)
+    for metric, values in payload["series"][freq].items():
+        if selected and metric not in selected:
+            continue
+        for value in values:
+            if start <= value["period"] <= end:
+                output[metric].update({value["period"]: value["v"]})
+    return pd.DataFrame(output).rename_axis(index="date")
+
+
+@pytest.fixture
+def finnhub_client() -> Generator[MagicMock, None, None]:
+    with patch.dict(os.environ, {"FINNHUB_API_KEY": "test_key"}):
+        with patch("finrobot.data_access.data_source.clients.finnhub.Client") as mock_cls:
+            mock_cls.return_value.company_basic_financials.return_value = PAYLOAD
+            yield mock_cls.return_value
+
+
+class TestBasicFinancials:
+    @pytest.mark.parametrize(
+        "freq, start, end, selected",
+        [
+            ("annual", "2000-01-01", "2030-01-01", None),
+            ("annual", "2021-01-01", "2022-12-31", None),
+            ("annual", "2020-01-01", "2023-09-30", ["bookValue"]),
+            ("quarterly", "2023-10-01", "2023-12-31", None),
+        ],
+    )
+    def test_history_matches_legacy_parsing(
+        self, freq: str, start: str, end: str, selected: Optional[List[str]]
+    ) -> None:
+        result = BasicFinancials(PAYLOAD).history(freq, start, end, selected)
+        pd.testing.assert_frame_equal(result, legacy_history(PAYLOAD, freq, start, end, selected))
+
+    def test_latest_overlays_quarterly_values(self) -> None:
+        financials = BasicFinancials(PAYLOAD)
+        assert financials.latest() == {"peTTM": 29.9, "52WeekHigh": 199.6, "eps": 2.18}
+        assert financials.latest(["eps"]) == {"eps": 2.18}
+        # the cached payload is never modified
+        assert PAYLOAD["metric"] == {"peTTM": 25.0, "52WeekHigh": 199.6}
+
+    def test_empty_series(self) -> None:
+        assert BasicFinancials({"metric": {}, "series": {}}).empty
+
+
+class TestBasicFinancialsCache:
+    def test_payload_fetched_once_per_symbol(self, finnhub_client: MagicMock) -> None:
+        FinnHubUtils.get_basic_financials_history("AAPL", "annual", "2021-01-01", "2023-12-31")
+        FinnHubUtils.get_basic_financials_history("aapl", "quarterly", "2023-01-01", "2023-12-31", ["eps"])
+        latest = json.loads(FinnHubUtils.get_basic_financials("AAPL", ["eps"]))
+
+        assert finnhub_client.company_basic_financials.call_count == 1
+        assert latest == {"eps": 2.18}
+
+    def test_cache_shared_with_domain_adapter(self, finnhub_client: MagicMock) -> None:
+        FinnHubUtils.get_basic_financials("AAPL")
+        with patch("finrobot.data_access.data_source.clients.finnhub.Client") as other:
+            df = FinnHubMarketAdapter.get_basic_financials_history("AAPL", "annual", "2022-01-01", "2023-12-31")
+
+        other.assert_not_called()
+        assert isinstance(df, pd.DataFrame)
+        assert list(df.index) == ["2023-09-30", "2022-09-24"]
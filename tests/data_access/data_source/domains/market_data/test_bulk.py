@@ -0,0 +1,70 @@
+from typing import Generator, List
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+from finrobot.data_access.data_source.domains.market_data.bulk import get_stock_data_bulk
+from finrobot.data_access.data_source.domains.market_data.price_cache import configure_price_cache
+
+
+def make_download(symbols: List[str], start: str, end: str) -> pd.DataFrame:
+    index = pd.bdate_range(start, end, inclusive="left", name="Date")
+    frames = {
+        symbol: pd.DataFrame({"Close": [float(n)] * len(index), "Volume": 100}, index=index)
+        for n, symbol in enumerate(symbols)
+    }
+    return pd.concat(frames, axis=1, names=["Ticker", "Price"])
+
+
+@pytest.fixture
+def mock_download() -> Generator[MagicMock, None, None]:
+    def download(tickers: List[str], start: str, end: str, **kwargs: object) -> pd.DataFrame:
+        return make_download([t for t in tickers if t != "DELISTED"], start, end)
+
+    with patch("finrobot.data_access.data_source.domains.market_data.bulk.yf.download", side_effect=download) as mock:
+        yield mock
+
+
+@pytest.fixture(autouse=True)
+def reset_default() -> Generator[None, None, None]:
+    configure_price_cache(None)
+    yield
+    configure_price_cache(None)
+
+
+class TestGetStockDataBulk:
+    def test_symbols_are_chunked(self, mock_download: MagicMock) -> None:
+        symbols = [f"S{i}" for i in range(5)]
+        result = get_stock_data_bulk(symbols, "2023-01-02", "2023-01-09", chunk_size=2)
+
+        assert mock_download.call_count == 3
+        assert sorted(len(call.args[0]) for call in mock_download.call_args_list) == [1, 2, 2]
+        assert isinstance(result, pd.DataFrame)
+        assert result.index.names == ["Symbol", "Date"]
+        assert list(result.index.get_level_values("Symbol").unique()) == symbols
+        assert len(result.loc["S0"]) == 5
+
+    def test_dict_output_skips_missing_symbols(self, mock_download: MagicMock) -> None:
+        result = get_stock_data_bulk(["aapl", "DELISTED", "AAPL", "MSFT"], "2023-01-02", "2023-01-09", output="dict")
+
+        assert isinstance(result, dict)
+        assert list(result) == ["AAPL", "MSFT"]
+        assert list(result["MSFT"].columns) == ["Close", "Volume"]
+        assert mock_download.call_args.args[0] == ["AAPL", "DELISTED", "MSFT"]
+
+    def test_invalid_output(self) -> None:
+        with pytest.raises(ValueError):
+            get_stock_data_bulk(["AAPL"], "2023-01-02", "2023-01-09", output="wide")
+
+    def test_feeds_price_cache(self, mock_download: MagicMock, tmp_path) -> None:  # type: ignore[no-untyped-def]
+        cache = configure_price_cache(tmp_path)
+        assert cache is not None
+
+        get_stock_data_bulk(["AAPL", "MSFT"], "2023-01-02", "2023-02-01")
+        assert cache.symbols() == ["AAPL", "MSFT"]
+
+        result = get_stock_data_bulk(["AAPL", "MSFT", "GOOG"], "2023-01-09", "2023-01-20", output="dict")
+        assert mock_download.call_count == 2
+        assert mock_download.call_args.args[0] == ["GOOG"]
+        assert len(result["AAPL"]) == 9
+        assert cache.stats.hits == 2
@@ -0,0 +1,172 @@
+import os
+import time
+from typing import List, Tuple
+
+import pandas as pd
+import pytest
+from finrobot.data_access.data_source.domains.market_data.cached_repository import (
+    DISK,
+    MEMORY,
+    NETWORK,
+    CachedMarketDataRepository,
+    MemoryLRU,
+    sizeof,
+)
+from finrobot.data_access.data_source.domains.market_data.entities import CompanyInfo, MarketData
+from finrobot.data_access.data_source.domains.market_data.repositories import MarketDataRepository
+
+
+class FakeProvider:
+    def __init__(self, name: str = "fake", fail: bool = False) -> None:
+        self.name = name
+        self.fail = fail
+        self.calls: List[Tuple[str, ...]] = []
+
+    def fetch_stock_data(self, symbol: str, start_date: str, end_date: str) -> pd.DataFrame:
+        self.calls.append(("prices", symbol, start_date, end_date))
+        if self.fail:
+            raise ConnectionError("offline")
+        index = pd.bdate_range(start_date, end_date, inclusive="left", name="Date")
+        return pd.DataFrame({"Close": range(len(index))}, index=index, dtype="float64")
+
+    def fetch_company_info(self, symbol: str) -> CompanyInfo:
+        self.calls.append(("company_info", symbol))
+        if self.fail:
+            raise ConnectionError("offline")
+        return CompanyInfo(symbol=symbol, name="Apple", industry="Tech", sector="IT", country="US", market_cap=3e12)
+
+    def fetch_statement(self, symbol: str, statement_type: str) -> pd.DataFrame:
+        self.calls.append((statement_type, symbol))
+        if self.fail:
+            raise ConnectionError("offline")
+        columns = pd.to_datetime(["2023-09-30", "2022-09-30"])
+        return pd.DataFrame([[6.13, 6.11], [383.0, 394.0]], index=["Diluted EPS", "Total Revenue"], columns=columns)
+
+
+class TestCachedMarketDataRepository:
+    def test_implements_repository(self) -> None:
+        assert isinstance(CachedMarketDataRepository(providers=[FakeProvider()]), MarketDataRepository)
+
+    def test_tiers_in_order(self, tmp_path) -> None:  # type: ignore[no-untyped-def]
+        provider = FakeProvider()
+        repo = CachedMarketDataRepository(providers=[provider], cache_dir=tmp_path)
+
+        first = repo.get_stock_data("aapl", "2023-01-02", "2023-02-01")
+        assert repo.last_lookup is not None
+        assert (repo.last_lookup.tier, repo.last_lookup.provider) == (NETWORK, "fake")
+        assert isinstance(first, MarketData)
+        assert len(first.data) == 22
+
+        repo.get_stock_data("AAPL", "2023-01-02", "2023-02-01")
+        assert repo.last_lookup.tier == MEMORY
+
+        repo.clear()
+        repo.get_stock_data("AAPL", "2023-01-09", "2023-01-20")
+        assert repo.last_lookup.tier == DISK
+        assert len(provider.calls) == 1
+        assert repo.stats.to_dict() == {"memory": 1, "disk": 1, "network": 1, "evictions": 0}
+
+    def test_statements_round_trip_through_disk(self, tmp_path) -> None:  # type: ignore[no-untyped-def]
+        provider = FakeProvider()
+        network = CachedMarketDataRepository(providers=[provider], cache_dir=tmp_path).get_income_statement("AAPL")
+
+        repo = CachedMarketDataRepository(providers=[provider], cache_dir=tmp_path)
+        statement = repo.get_income_statement("AAPL")
+        assert repo.last_lookup is not None and repo.last_lookup.tier == DISK
+        assert statement.statement_type == "income"
+        assert statement.data.loc["Diluted EPS"].tolist() == [6.13, 6.11]
+        assert list(statement.data.columns) == list(network.data.columns)
+        assert len(provider.calls) == 1
+
+    def test_stale_disk_entries_are_refetched(self, tmp_path) -> None:  # type: ignore[no-untyped-def]
+        provider = FakeProvider()
+        CachedMarketDataRepository(providers=[provider], cache_dir=tmp_path).get_company_info("AAPL")
+        path = tmp_path / "fundamentals" / "symbol=AAPL" / "company_info.json"
+        old = time.time() - 3600
+        os.utime(path, (old, old))
+
+        repo = CachedMarketDataRepository(providers=[provider], cache_dir=tmp_path, disk_ttl=60)
+        info = repo.get_company_info("AAPL")
+        assert repo.last_lookup is not None and repo.last_lookup.tier == NETWORK
+        assert info.market_cap == 3e12
+
+        fresh = CachedMarketDataRepository(providers=[provider], cache_dir=tmp_path, disk_ttl=60)
+        assert fresh.get_company_info("AAPL") == info
+        assert fresh.last_lookup is not None and fresh.last_lookup.tier == DISK
+
+    def test_falls_back_to_next_provider(self) -> None:
+        down, backup = FakeProvider("down", fail=True), FakeProvider("backup")
+        repo = CachedMarketDataRepository(providers=[down, backup])
+
+        repo.get_balance_sheet("AAPL")
+        assert repo.last_lookup is not None and repo.last_lookup.provider == "backup"
+
+    def test_all_providers_failing_raises(self) -> None:
+        repo = CachedMarketDataRepository(providers=[FakeProvider(fail=True)])
+        with pytest.raises(ConnectionError):
+            repo.get_cash_flow("AAPL")
+
+    def test_providers_returning_nothing_give_empty_frames(self) -> None:
+        class NoneProvider(FakeProvider):
+            def fetch_statement(self, symbol: str, statement_type: str) -> pd.DataFrame:
+                return None
+
+            def fetch_stock_data(self, symbol: str, start_date: str, end_date: str) -> pd.DataFrame:
+                return None
+
+        repo = CachedMarketDataRepository(providers=[NoneProvider()])
+        assert repo.get_income_statement("AAPL").data.empty
+        assert repo.get_stock_data("AAPL", "2023-01-02", "2023-02-01").data.empty
+
+    def test_providers_returning_no_company_info_raise(self) -> None:
+        class NoneProvider(FakeProvider):
+            def fetch_company_info(self, symbol: str) -> CompanyInfo:
+                return None  # type: ignore[return-value]
+
+        repo = CachedMarketDataRepository(providers=[NoneProvider()])
+        with pytest.raises(ValueError, match="No provider returned company info for AAPL"):
+            repo.get_company_info("AAPL")
+
+    def test_ranges_reaching_today_skip_the_memory_tier(self) -> None:
+        provider = FakeProvider()
+        repo = CachedMarketDataRepository(providers=[provider])
+        end = (pd.Timestamp.now().normalize() + pd.Timedelta(days=1)).strftime("%Y-%m-%d")
+
+        repo.get_stock_data("AAPL", "2023-01-02", end)
+        repo.get_stock_data("AAPL", "2023-01-02", end)
+        assert repo.last_lookup is not None and repo.last_lookup.tier == NETWORK
+        assert len(provider.calls) == 2
+
+    def test_memory_tier_hands_out_copies(self) -> None:
+        repo = CachedMarketDataRepository(providers=[FakeProvider()])
+
+        stock = repo.get_stock_data("AAPL", "2023-01-02", "2023-02-01")
+        stock.data["Close"] = -1.0
+        statement = repo.get_income_statement("AAPL")
+        statement.data.loc["Diluted EPS"] = 0.0
+        repo.get_company_info("AAPL").extra["note"] = "changed"
+
+        assert repo.get_stock_data("AAPL", "2023-01-02", "2023-02-01").data["Close"].iloc[1] == 1.0
+        assert repo.get_income_statement("AAPL").data.loc["Diluted EPS"].tolist() == [6.13, 6.11]
+        assert repo.get_company_info("AAPL").extra == {}
+        assert repo.stats.memory == 3
+
+
+class TestMemoryLRU:
+    def test_evicts_least_recently_used_by_size(self) -> None:
+        frame = pd.DataFrame({"a": range(100)})
+        lru = MemoryLRU(max_bytes=int(sizeof(frame) * 2.5))
+        lru.set("a", frame)
+        lru.set("b", frame.copy())
+        lru.get("a")
+        lru.set("c", frame.copy())
+
+        assert lru.get("b") is None
+        assert lru.get("a") is not None
+        assert lru.evictions == 1
+        assert lru.size <= lru.max_bytes
+
+    def test_oversized_values_are_skipped(self) -> None:
+        lru = MemoryLRU(max_bytes=10)
+        lru.set("big", pd.DataFrame({"a": range(100)}))
+        assert len(lru) == 0
@@ -13,7 +13,7 @@ def finnhub_api_key() -> None:
 
 
 class TestFinnHubMarketAdapter:
-    @patch("finrobot.data_access.data_source.domains.market_data.finnhub_adapter.finnhub.Client")
+    @patch("finrobot.data_access.data_source.clients.finnhub.Client")
     def test_get_company_profile(self, mock_client_cls, finnhub_api_key) -> None:  # type: ignore[no-untyped-def]
         mock_client = MagicMock()
         mock_client_cls.return_value = mock_client
@@ -33,7 +33,7 @@ class TestFinnHubMarketAdapter:
         assert "Apple Inc." in result
         assert "Technology" in result
 
-    @patch("finrobot.data_access.data_source.domains.market_data.finnhub_adapter.finnhub.Client")
+    @patch("finrobot.data_access.data_source.clients.finnhub.Client")
     def test_get_basic_financials_history(self, mock_client_cls, finnhub_api_key) -> None:  # type: ignore[no-untyped-def]
         mock_client = MagicMock()
         mock_client_cls.return_value = mock_client
@@ -45,7 +45,7 @@ class TestFinnHubMarketAdapter:
         assert "eps" in df.columns
         assert len(df) == 1
 
-    @patch("finrobot.data_access.data_source.domains.market_data.finnhub_adapter.finnhub.Client")
+    @patch("finrobot.data_access.data_source.clients.finnhub.Client")
     def test_get_basic_financials(self, mock_client_cls, finnhub_api_key) -> None:  # type: ignore[no-untyped-def]
         mock_client = MagicMock()
         mock_client_cls.return_value = mock_client
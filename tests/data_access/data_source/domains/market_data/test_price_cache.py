@@ -0,0 +1,128 @@
+from typing import Generator, List, Tuple
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+from finrobot.data_access.data_source.domains.market_data import price_cache
+from finrobot.data_access.data_source.domains.market_data.price_cache import (
+    PriceCache,
+    configure_price_cache,
+    get_price_cache,
+)
+from finrobot.data_access.data_source.domains.market_data.yfinance_adapter import YFinanceAdapter
+
+
+def make_prices(start: str, end: str) -> pd.DataFrame:
+    index = pd.bdate_range(start, end, inclusive="left", tz="America/New_York", name="Date")
+    return pd.DataFrame({"Close": [float(i) for i in range(len(index))], "Volume": 100}, index=index)
+
+
+class RecordingFetcher:
+    def __init__(self) -> None:
+        self.calls: List[Tuple[str, str]] = []
+
+    def __call__(self, start: str, end: str) -> pd.DataFrame:
+        self.calls.append((start, end))
+        return make_prices(start, end)
+
+
+@pytest.fixture
+def cache(tmp_path) -> PriceCache:  # type: ignore[no-untyped-def]
+    return PriceCache(tmp_path)
+
+
+class TestPriceCache:
+    def test_cold_then_warm(self, cache: PriceCache) -> None:
+        fetch = RecordingFetcher()
+        first = cache.get("AAPL", "2023-01-02", "2023-02-01", fetch)
+        second = cache.get("AAPL", "2023-01-09", "2023-01-20", fetch)
+
+        assert fetch.calls == [("2023-01-02", "2023-02-01")]
+        assert len(first) == 22
+        assert second.index.min().strftime("%Y-%m-%d") == "2023-01-09"
+        assert second.index.max().strftime("%Y-%m-%d") == "2023-01-19"
+        assert cache.stats.misses == 1
+        assert cache.stats.hits == 1
+        assert cache.stats.network_calls == 1
+
+    def test_only_gaps_are_downloaded(self, cache: PriceCache) -> None:
+        fetch = RecordingFetcher()
+        cache.get("AAPL", "2023-02-01", "2023-03-01", fetch)
+        result = cache.get("AAPL", "2023-01-02", "2023-04-03", fetch)
+
+        assert fetch.calls[1:] == [("2023-01-02", "2023-02-01"), ("2023-03-01", "2023-04-03")]
+        assert result.index.is_monotonic_increasing
+        assert not result.index.duplicated().any()
+        assert cache.stats.partial_hits == 1
+        assert cache.coverage("AAPL") == (pd.Timestamp("2023-01-02"), pd.Timestamp("2023-04-03"))
+
+    def test_symbols_are_partitioned(self, cache: PriceCache, tmp_path) -> None:  # type: ignore[no-untyped-def]
+        fetch = RecordingFetcher()
+        cache.get("AAPL", "2023-01-02", "2023-01-10", fetch)
+        cache.get("^GSPC", "2023-01-02", "2023-01-10", fetch)
+
+        assert cache.symbols() == ["AAPL", "^GSPC"]
+        assert (tmp_path / "symbol=AAPL" / PriceCache.DATA_FILE).exists()
+
+        cache.clear("AAPL")
+        assert cache.coverage("AAPL") is None
+        cache.get("AAPL", "2023-01-02", "2023-01-10", fetch)
+        assert len(fetch.calls) == 3
+
+    def test_coverage_stops_at_today(self, cache: PriceCache) -> None:
+        fetch = RecordingFetcher()
+        with patch.object(price_cache, "_today", return_value=pd.Timestamp("2023-01-10")):
+            cache.get("AAPL", "2023-01-02", "2023-01-20", fetch)
+            cache.get("AAPL", "2023-01-02", "2023-01-20", fetch)
+
+        assert fetch.calls[1] == ("2023-01-10", "2023-01-20")
+
+    def test_put_merges_external_download(self, cache: PriceCache) -> None:
+        cache.put("MSFT", make_prices("2023-01-02", "2023-01-31"), "2023-01-02", "2023-01-31")
+        fetch = RecordingFetcher()
+        result = cache.get("MSFT", "2023-01-05", "2023-01-20", fetch)
+
+        assert fetch.calls == []
+        assert len(result) == 11
+
+    def test_naive_and_aware_frames_merge(self, cache: PriceCache) -> None:
+        naive = make_prices("2023-01-02", "2023-01-09").tz_localize(None)
+        cache.put("MSFT", naive, "2023-01-02", "2023-01-09")
+        result = cache.get("MSFT", "2023-01-02", "2023-01-16", RecordingFetcher())
+
+        assert len(result) == 10
+        assert result.index.is_monotonic_increasing
+        assert cache.covers("MSFT", "2023-01-03", "2023-01-16")
+        assert not cache.covers("MSFT", "2023-01-03", "2023-01-17")
+
+
+class TestDefaultPriceCache:
+    @pytest.fixture(autouse=True)
+    def reset_default(self) -> Generator[None, None, None]:
+        configure_price_cache(None)
+        yield
+        configure_price_cache(None)
+
+    def test_disabled_without_configuration(self, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+        monkeypatch.delenv(price_cache.PRICE_CACHE_ENV, raising=False)
+        assert get_price_cache() is None
+
+    def test_created_from_environment(self, monkeypatch, tmp_path) -> None:  # type: ignore[no-untyped-def]
+        monkeypatch.setenv(price_cache.PRICE_CACHE_ENV, str(tmp_path))
+        cache = get_price_cache()
+        assert cache is not None
+        assert cache.root == str(tmp_path)
+
+    @patch("finrobot.data_access.data_source.domains.market_data.yfinance_adapter.yf.Ticker")
+    def test_adapter_warm_run_skips_network(self, mock_ticker_cls, tmp_path) -> None:  # type: ignore[no-untyped-def]
+        configure_price_cache(tmp_path)
+        mock_ticker = MagicMock()
+        mock_ticker.ticker = "AAPL"
+        mock_ticker.history.side_effect = lambda start, end: make_prices(start, end)
+        mock_ticker_cls.return_value = mock_ticker
+
+        cold = YFinanceAdapter.get_stock_data("AAPL", "2023-01-02", "2023-02-01")
+        warm = YFinanceAdapter.get_stock_data("AAPL", "2023-01-02", "2023-02-01")
+
+        assert mock_ticker.history.call_count == 1
+        pd.testing.assert_frame_equal(cold, warm, check_freq=False)
@@ -0,0 +1,122 @@
+from typing import List
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+from finrobot.data_access.data_source.domains.market_data.cached_repository import CachedMarketDataRepository
+from finrobot.data_access.data_source.domains.market_data.entities import FinancialStatement
+from finrobot.data_access.data_source.domains.market_data.statement_store import StatementStore
+
+QUARTERS = pd.to_datetime(["2023-12-31", "2023-09-30", "2023-06-30", "2023-03-31"])
+
+
+def income(symbol: str, scale: float = 1.0, period: str = "quarterly") -> FinancialStatement:
+    data = pd.DataFrame(
+        [[2.0 * scale, 1.5 * scale, 1.2 * scale, 1.0 * scale], [100.0, 90.0, None, 80.0]],
+        index=["Diluted EPS", "Net Income"],
+        columns=QUARTERS,
+    )
+    return FinancialStatement(symbol=symbol, statement_type="income", data=data, period=period)
+
+
+@pytest.fixture
+def store() -> StatementStore:
+    store = StatementStore()
+    store.ingest_many([income("AAPL"), income("msft", 2.0), income("GOOG", 3.0)])
+    cash_flow = pd.DataFrame([[7.0]], index=["Net Income"], columns=QUARTERS[:1])
+    store.ingest(FinancialStatement("AAPL", "cash_flow", cash_flow, period="quarterly"))
+    return store
+
+
+class TestStatementStore:
+    def test_long_dictionary_encoded_layout(self, store: StatementStore) -> None:
+        table = store.table
+        assert table.column_names == ["symbol", "statement_type", "period", "line_item", "period_end", "value"]
+        assert pa.types.is_dictionary(table.schema.field("line_item").type)
+        assert table["line_item"].num_chunks == 1
+        # NaN values are not stored
+        assert len(store) == 12 + 9 + 1
+        assert store.symbols() == ["AAPL", "GOOG", "MSFT"]
+        assert store.line_items() == ["Diluted EPS", "Net Income"]
+
+    def test_line_item_is_a_zero_copy_slice(self, store: StatementStore) -> None:
+        rows = store.line_item("Diluted EPS")
+        assert rows.num_rows == 12
+        buffer = rows["value"].chunk(0).buffers()[1]
+        assert buffer.address == store.table["value"].chunk(0).buffers()[1].address
+        assert rows["symbol"].to_pylist() == ["AAPL"] * 4 + ["GOOG"] * 4 + ["MSFT"] * 4
+
+    def test_cross_sectional_filters(self, store: StatementStore) -> None:
+        rows = store.line_item("Diluted EPS", symbols=["aapl", "MSFT"], last=2)
+        assert rows["symbol"].to_pylist() == ["AAPL", "AAPL", "MSFT", "MSFT"]
+        assert rows["value"].to_pylist() == [1.5, 2.0, 3.0, 4.0]
+
+        window = store.line_item("Diluted EPS", start="2023-06-01", end="2023-10-01")
+        assert window.num_rows == 6
+        assert store.line_item("Net Income", statement_type="cash_flow")["value"].to_pylist() == [7.0]
+        assert store.line_item("Diluted EPS", period="annual").num_rows == 0
+        assert store.line_item("Unknown").num_rows == 0
+
+    def test_pivot(self, store: StatementStore) -> None:
+        frame = store.pivot("Diluted EPS", last=1)
+        assert list(frame.columns) == ["AAPL", "GOOG", "MSFT"]
+        assert frame.loc[QUARTERS[0]].tolist() == [2.0, 6.0, 4.0]
+
+    def test_reingest_replaces_and_statement_round_trips(self, store: StatementStore) -> None:
+        store.ingest(income("AAPL", 10.0))
+        assert store.line_item("Diluted EPS", symbols=["AAPL"], last=1)["value"].to_pylist() == [20.0]
+
+        rebuilt = store.statement("MSFT", "income", period="quarterly").data
+        original = income("MSFT", 2.0).data
+        pd.testing.assert_frame_equal(rebuilt, original, check_freq=False, check_names=False)
+        with pytest.raises(KeyError):
+            store.statement("TSLA", "income")
+
+    def test_mixed_statements_and_periods(self, store: StatementStore) -> None:
+        annual = pd.DataFrame(
+            [[50.0, 40.0]], index=["Net Income"], columns=pd.to_datetime(["2023-12-31", "2022-12-31"])
+        )
+        store.ingest(FinancialStatement("AAPL", "income", annual, period="annual"))
+
+        rows = store.line_item("Net Income", symbols=["AAPL"], last=1)
+        assert list(zip(rows["statement_type"].to_pylist(), rows["period"].to_pylist())) == [
+            ("cash_flow", "quarterly"),
+            ("income", "annual"),
+            ("income", "quarterly"),
+        ]
+        # the latest period end of every statement, not the last rows in sort order
+        assert rows["period_end"].to_pylist() == [QUARTERS[0]] * 3
+        assert rows["value"].to_pylist() == [7.0, 50.0, 100.0]
+
+        with pytest.raises(ValueError, match="AAPL"):
+            store.pivot("Net Income")
+        frame = store.pivot("Net Income", statement_type="income", period="annual")
+        assert frame["AAPL"].tolist() == [40.0, 50.0]
+
+    def test_ingest_after_a_query_merges_into_the_table(self, store: StatementStore) -> None:
+        assert len(store) == 22
+        store.ingest(income("TSLA"))
+        store.ingest(income("MSFT", 5.0))
+
+        assert len(store) == 22 + 7
+        assert store.table["line_item"].num_chunks == 1
+        assert store.line_item("Diluted EPS", last=1)["value"].to_pylist() == [2.0, 6.0, 10.0, 2.0]
+        assert store.line_items() == ["Diluted EPS", "Net Income"]
+
+
+class TestRepositoryIngestion:
+    def test_loaded_statements_are_ingested(self) -> None:
+        class Provider:
+            name = "fake"
+
+            def fetch_statement(self, symbol: str, statement_type: str) -> pd.DataFrame:
+                return income(symbol).data
+
+        store = StatementStore()
+        repo = CachedMarketDataRepository(providers=[Provider()], statement_store=store)  # type: ignore[list-item]
+        symbols: List[str] = ["AAPL", "MSFT"]
+        for symbol in symbols:
+            repo.get_income_statement(symbol)
+
+        assert store.symbols() == symbols
+        assert store.line_item("Diluted EPS", period="annual").num_rows == 8
@@ -0,0 +1,105 @@
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pandas as pd
+from finrobot.data_access.data_source.domains.market_data.ticker_registry import (
+    QUOTE,
+    STATEMENT,
+    TickerRegistry,
+    get_ticker_registry,
+)
+from finrobot.data_access.data_source.domains.market_data.yfinance_adapter import YFinanceAdapter
+from finrobot.data_access.data_source.yfinance_utils import YFinanceUtils
+
+
+class TestTickerRegistry:
+    @patch("finrobot.data_access.data_source.domains.market_data.ticker_registry.yf.Ticker")
+    def test_ticker_objects_are_reused(self, mock_ticker_cls) -> None:  # type: ignore[no-untyped-def]
+        registry = TickerRegistry()
+        assert registry.ticker("aapl") is registry.ticker("AAPL")
+        mock_ticker_cls.assert_called_once_with("AAPL")
+
+    @patch("finrobot.data_access.data_source.domains.market_data.ticker_registry.yf.Ticker")
+    def test_fields_are_memoized(self, mock_ticker_cls) -> None:  # type: ignore[no-untyped-def]
+        mock_ticker = MagicMock()
+        info = PropertyMock(return_value={"shortName": "Apple"})
+        type(mock_ticker).info = info
+        mock_ticker_cls.return_value = mock_ticker
+
+        registry = TickerRegistry()
+        cached = registry.cached_ticker("AAPL")
+        assert cached.info["shortName"] == "Apple"
+        assert cached.info["shortName"] == "Apple"
+        assert info.call_count == 1
+
+    @patch("finrobot.data_access.data_source.domains.market_data.ticker_registry.yf.Ticker")
+    def test_expired_fields_are_refetched(self, mock_ticker_cls) -> None:  # type: ignore[no-untyped-def]
+        mock_ticker = MagicMock()
+        financials = PropertyMock(return_value=pd.DataFrame({"2023": [1]}))
+        type(mock_ticker).financials = financials
+        mock_ticker_cls.return_value = mock_ticker
+
+        registry = TickerRegistry(quote_ttl=60, statement_ttl=0)
+        registry.field("AAPL", "financials")
+        registry.field("AAPL", "financials")
+        assert financials.call_count == 2
+
+    @patch("finrobot.data_access.data_source.domains.market_data.ticker_registry.yf.Ticker")
+    def test_callers_get_copies_of_memoized_fields(self, mock_ticker_cls) -> None:  # type: ignore[no-untyped-def]
+        mock_ticker = MagicMock()
+        type(mock_ticker).info = PropertyMock(return_value={"shortName": "Apple", "officers": [{"name": "Tim"}]})
+        type(mock_ticker).financials = PropertyMock(return_value=pd.DataFrame({"2023": [1]}))
+        mock_ticker_cls.return_value = mock_ticker
+
+        registry = TickerRegistry()
+        info = registry.field("AAPL", "info")
+        info["shortName"] = "changed"
+        info["officers"][0]["name"] = "changed"
+        registry.field("AAPL", "financials").iloc[0, 0] = 99
+
+        assert registry.field("AAPL", "info") == {"shortName": "Apple", "officers": [{"name": "Tim"}]}
+        assert registry.field("AAPL", "financials").iloc[0, 0] == 1
+
+    @patch("finrobot.data_access.data_source.domains.market_data.ticker_registry.yf.Ticker")
+    def test_least_recently_used_tickers_are_evicted(self, mock_ticker_cls) -> None:  # type: ignore[no-untyped-def]
+        registry = TickerRegistry(max_tickers=2)
+        registry.field("AAPL", "info")
+        registry.ticker("MSFT")
+        registry.ticker("AAPL")
+        registry.ticker("NVDA")
+
+        assert ("AAPL", "info") in registry.fields
+        registry.ticker("AMZN")
+        assert ("AAPL", "info") not in registry.fields
+        assert mock_ticker_cls.call_count == 4
+        registry.ticker("AAPL")
+        assert mock_ticker_cls.call_count == 5
+
+    def test_ttls_per_field_class(self, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+        monkeypatch.setenv("FINROBOT_QUOTE_TTL", "30")
+        registry = TickerRegistry(statement_ttl=3600)
+        assert registry.ttls == {QUOTE: 30.0, STATEMENT: 3600}
+        registry.configure(quote_ttl=10)
+        assert registry.ttls[QUOTE] == 10
+
+    def test_other_attributes_pass_through(self) -> None:
+        registry = TickerRegistry()
+        with patch.object(registry, "ticker") as mock_ticker:
+            mock_ticker.return_value.history.return_value = "history"
+            assert registry.cached_ticker("AAPL").history(period="1d") == "history"
+
+
+class TestSharedRegistry:
+    @patch("finrobot.data_access.data_source.domains.market_data.ticker_registry.yf.Ticker")
+    def test_utils_and_adapter_share_info(self, mock_ticker_cls) -> None:  # type: ignore[no-untyped-def]
+        mock_ticker = MagicMock()
+        info = PropertyMock(return_value={"shortName": "Apple", "industry": "Tech"})
+        type(mock_ticker).info = info
+        mock_ticker_cls.return_value = mock_ticker
+
+        YFinanceUtils.get_stock_info("AAPL")
+        YFinanceUtils.get_company_info("AAPL")
+        YFinanceAdapter.get_stock_info("AAPL")
+
+        assert info.call_count == 1
+        assert mock_ticker_cls.call_count == 1
+        assert get_ticker_registry().fields.stats.hits == 2
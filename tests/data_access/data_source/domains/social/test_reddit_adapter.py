@@ -14,7 +14,7 @@ def reddit_creds() -> None:
 
 
 class TestRedditAdapter:
-    @patch("finrobot.data_access.data_source.domains.social.reddit_adapter.praw.Reddit")
+    @patch("finrobot.data_access.data_source.clients.praw.Reddit")
     def test_get_reddit_posts(self, mock_reddit_cls, reddit_creds) -> None:  # type: ignore[no-untyped-def]
         mock_reddit = MagicMock()
         mock_reddit_cls.return_value = mock_reddit
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+from finrobot.data_access.data_source.filings_src.prepline_sec_filings.clustering import (
+    benchmark_clusterers,
+    dbscan_clusters,
+    gap_clusters,
+    get_clusterer,
+)
+
+
+def _positions(*xs: float) -> np.ndarray:
+    return np.array(xs, dtype=np.float32).reshape(-1, 1)
+
+
+def test_dense_titles_form_clusters_and_sparse_ones_are_noise() -> None:
+    labels = gap_clusters(_positions(0, 2, 4, 6, 8, 30, 100, 101, 102, 103, 104, 110))
+    assert labels.tolist() == [0, 0, 0, 0, 0, -1, 1, 1, 1, 1, 1, 1]
+
+
+def test_border_title_between_two_clusters_joins_the_left_one() -> None:
+    # 20 is a border title within eps of the last core of both clusters
+    labels = gap_clusters(_positions(10, 11, 12, 13, 14, 20, 26, 27, 28, 29, 30))
+    assert labels[5] == 0
+    assert set(labels[6:].tolist()) == {1}
+
+
+def test_empty_and_unsorted_positions() -> None:
+    assert gap_clusters(_positions()).tolist() == []
+    assert gap_clusters(_positions(4, 0, 3, 1, 2)).tolist() == [0, 0, 0, 0, 0]
+
+
+def test_matches_dbscan_on_random_title_layouts() -> None:
+    pytest.importorskip("sklearn")
+    rng = np.random.default_rng(7)
+    for _ in range(200):
+        n = int(rng.integers(1, 120))
+        span = int(rng.integers(n + 1, 6 * n + 10))
+        positions = np.sort(rng.choice(span, size=n, replace=False)).astype(np.float32).reshape(-1, 1)
+        assert np.array_equal(gap_clusters(positions), dbscan_clusters(positions))
+
+
+def test_unknown_clusterer() -> None:
+    assert get_clusterer("gap") is gap_clusters
+    with pytest.raises(ValueError, match="Unknown title clusterer"):
+        get_clusterer("kmeans")
+
+
+def test_benchmark_reports_timings_and_agreement() -> None:
+    pytest.importorskip("sklearn")
+    corpus = [_positions(*range(0, 40, 2)), _positions(1, 50, 51, 52, 53, 54, 200)]
+    report = benchmark_clusterers(corpus, repeat=1)
+    assert report.documents == 2 and report.titles == 27
+    assert set(report.seconds) == {"gap", "dbscan"}
+    assert report.mismatches == []
@@ -0,0 +1,79 @@
+import os
+import typing as T
+from unittest.mock import MagicMock, patch
+
+import pytest
+from finrobot.data_access.data_source.filings_src.prepline_sec_filings.element_cache import (
+    ElementCache,
+    content_key,
+)
+from finrobot.data_access.data_source.filings_src.prepline_sec_filings.sec_document import SECDocument
+from unstructured.documents.elements import ListItem, NarrativeText, Title
+
+FILING = "<SEC-DOCUMENT><TYPE>10-K ... </SEC-DOCUMENT>"
+
+
+class CountingDocument(SECDocument):
+    parses = 0
+
+    @classmethod
+    def from_string(cls, text: str) -> "CountingDocument":
+        CountingDocument.parses += 1
+        document = T.cast(CountingDocument, cls.from_elements([Title("ITEM 1. BUSINESS"), NarrativeText("We make")]))
+        document.elements.append(ListItem("phones"))
+        document.filing_type = "10-K"
+        return document
+
+
+def setup_function() -> None:
+    CountingDocument.parses = 0
+
+
+def test_second_parse_is_rebuilt_from_cached_elements() -> None:
+    cache = ElementCache()
+    first = cache.document(FILING, CountingDocument)
+    second = cache.document(FILING, CountingDocument)
+
+    assert CountingDocument.parses == 1
+    assert isinstance(second, CountingDocument)
+    assert second.filing_type == "10-K"
+    assert [type(el) for el in second.elements] == [Title, NarrativeText, ListItem]
+    assert [el.text for el in second.elements] == [el.text for el in first.elements]
+    assert cache.hits == 1 and cache.misses == 1
+
+
+def test_other_text_is_parsed_again() -> None:
+    cache = ElementCache()
+    cache.document(FILING, CountingDocument)
+    cache.document(FILING + " ", CountingDocument)
+    assert CountingDocument.parses == 2
+    assert content_key(FILING) != content_key(FILING + " ")
+
+
+def test_entries_persist_under_root(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    ElementCache(tmp_path).document(FILING, CountingDocument)
+    rebuilt = ElementCache(tmp_path).document(FILING, CountingDocument)
+    assert CountingDocument.parses == 1
+    assert [el.text for el in rebuilt.elements] == ["ITEM 1. BUSINESS", "We make", "phones"]
+
+
+def test_failed_write_leaves_no_temporary_file(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    with patch("os.replace", side_effect=OSError("No space left on device")), pytest.raises(OSError):
+        ElementCache(tmp_path).document(FILING, CountingDocument)
+    assert not [name for _, _, names in os.walk(tmp_path) for name in names]
+
+
+def test_lru_bound() -> None:
+    cache = ElementCache(max_entries=1)
+    cache.document("a", CountingDocument)
+    cache.document("b", CountingDocument)
+    cache.document("a", CountingDocument)
+    assert CountingDocument.parses == 3
+
+
+def test_unserializable_documents_are_not_cached() -> None:
+    document_cls = MagicMock()
+    cache = ElementCache()
+    cache.document(FILING, document_cls)
+    cache.document(FILING, document_cls)
+    assert document_cls.from_string.call_count == 2
@@ -145,13 +145,14 @@ def test_sec_document_final_gaps() -> None:
     # Line 118: get_table_of_contents fallback to elements
     doc = SECDocument.from_elements([Title(text="T")])
     doc.filing_type = "10-K"
+    doc.toc_clusterer = "dbscan"
     with (
         patch(
             "finrobot.data_access.data_source.filings_src.prepline_sec_filings.sec_document.to_sklearn_format",
             return_value=np.array([[0.0]]),
         ),
         patch(
-            "finrobot.data_access.data_source.filings_src.prepline_sec_filings.sec_document.DBSCAN.fit_predict",
+            "sklearn.cluster.DBSCAN.fit_predict",
             return_value=np.array([0]),
         ),
     ):
@@ -152,9 +152,7 @@ class TestSECDocument:
 
             mock_sklearn.return_value = np.array([[1.0], [2.0], [3.0]], dtype=np.float32)
 
-            with patch(
-                "finrobot.data_access.data_source.filings_src.prepline_sec_filings.sec_document.DBSCAN"
-            ) as mock_dbscan:
+            with patch("sklearn.cluster.DBSCAN") as mock_dbscan:
                 mock_clustering = MagicMock()
                 # All in cluster 0
                 mock_clustering.fit_predict.return_value = np.array([0, 0, 0])
@@ -168,6 +166,7 @@ class TestSECDocument:
                     SECDocument = sec_doc_module.SECDocument
                     doc = SECDocument()
                     doc.filing_type = "10-K"
+                    doc.toc_clusterer = "dbscan"
                     # Create elements: Title(Risk), Title(Table of Contents), Title(Risk)
                     # To satisfy is_risk_title AND is_toc_title in the cluster
                     e1 = Title("Item 1A. Risk Factors")  # Risk
@@ -0,0 +1,273 @@
+import typing as T
+from typing import Any, Callable, Generator, List
+from unittest.mock import MagicMock, patch
+
+import pytest
+from finrobot.data_access.data_source.filings_src.prepline_sec_filings.sec_document import (
+    SECDocument,
+    SECSection,
+    is_item_title,
+    is_risk_title,
+    is_section_elem,
+)
+from unstructured.documents.elements import ListItem, NarrativeText, Text, Title
+
+MODULE = "finrobot.data_access.data_source.filings_src.prepline_sec_filings.sec_document"
+STREAMING = "finrobot.data_access.data_source.filings_src.prepline_sec_filings.streaming"
+
+SECTIONS = [
+    SECSection.BUSINESS,
+    SECSection.RISK_FACTORS,
+    SECSection.UNRESOLVED_STAFF_COMMENTS,
+    SECSection.PROPERTIES,
+    SECSection.LEGAL_PROCEEDINGS,
+    SECSection.MANAGEMENT_DISCUSSION,
+    SECSection.EXHIBITS,
+    SECSection.FORM_SUMMARY,
+    SECSection.DILUTION,  # not in the TOC
+]
+
+
+class _Equal:
+    """unstructured's ``Text.__eq__``: same text and category (the conftest elements compare by identity)."""
+
+    text: str
+
+    def __eq__(self, other: object) -> bool:
+        return type(self) is type(other) and self.text == T.cast(_Equal, other).text
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+class EqualText(_Equal, Text):
+    pass
+
+
+class EqualTitle(_Equal, Title):
+    pass
+
+
+class EqualNarrativeText(_Equal, NarrativeText):
+    pass
+
+
+class EqualListItem(_Equal, ListItem):
+    pass
+
+
+class SlicingSECDocument(SECDocument):
+    """SECDocument whose after/before_element slice like unstructured's Document, from the
+    first element equal to the given one."""
+
+    def after_element(self, element: Any) -> "SlicingSECDocument":
+        return self._slice(self.elements[self.elements.index(element) + 1 :])
+
+    def before_element(self, element: Any) -> "SlicingSECDocument":
+        return self._slice(self.elements[: self.elements.index(element)])
+
+    def _slice(self, elements: List[Any]) -> "SlicingSECDocument":
+        doc: SlicingSECDocument = SlicingSECDocument.from_elements(elements)
+        doc.filing_type = self.filing_type
+        return doc
+
+
+def _clean_sec_text(text: Any, lowercase: bool = False) -> str:
+    t = " ".join(str(text).split()).strip(" .:")
+    return t.lower() if lowercase else t
+
+
+@pytest.fixture(autouse=True)
+def clean_sec_text() -> Generator[None, None, None]:
+    with patch(f"{MODULE}.clean_sec_text", side_effect=_clean_sec_text):
+        yield
+
+
+TOC_TITLES = [
+    "Item 1. Business",
+    "Item 1A. Risk Factors",
+    "Item 1B. Unresolved Staff Comments",
+    "Item 2. Properties",
+    "Item 3. Legal Proceedings",
+    "Item 7. Management's Discussion and Analysis",
+    "Item 15. Exhibits",
+    "Item 16. Form 10-K Summary",
+]
+
+
+def _10k_document(heading: Callable[[str], str] = str.upper) -> SlicingSECDocument:
+    elements: List[Any] = [EqualTitle("Table of Contents")] + [EqualTitle(title) for title in TOC_TITLES]
+    for n, title in enumerate(TOC_TITLES):
+        elements.append(EqualTitle(heading(title)))
+        if n == 2:
+            continue  # a section with no body
+        elements.append(EqualNarrativeText(f"About {title}."))
+        elements.append(EqualListItem(f"A bullet on {title}."))
+        if n == 4:
+            elements.append(EqualTitle("A sub heading"))
+        elements.append(EqualNarrativeText(f"Closing remarks on {title}."))
+    elements.append(EqualText("Signatures"))
+    doc: SlicingSECDocument = SlicingSECDocument.from_elements(elements)
+    doc.filing_type = "10-K"
+    return doc
+
+
+def _toc(doc: SlicingSECDocument) -> SlicingSECDocument:
+    toc = doc._slice(doc.elements[:9])
+    toc.pages = [1]
+    return toc
+
+
+def test_matches_per_section_extraction() -> None:
+    doc = _10k_document()
+    with patch.object(SlicingSECDocument, "get_table_of_contents", return_value=_toc(doc)):
+        expected = {section: doc.get_section_narrative(section) for section in SECTIONS}
+        narratives = doc.get_section_narratives(SECTIONS)
+
+    assert narratives == expected
+    assert [el.text for el in narratives[SECSection.BUSINESS]] == [
+        "About Item 1. Business.",
+        "A bullet on Item 1. Business.",
+        "Closing remarks on Item 1. Business.",
+    ]
+    assert narratives[SECSection.UNRESOLVED_STAFF_COMMENTS] == []
+    assert narratives[SECSection.DILUTION] == []
+
+
+def test_body_headings_equal_to_toc_entries() -> None:
+    # after_element slices after the first element *equal* to the body heading, i.e. the TOC
+    # entry, and the section ends at the next TOC entry: both paths return empty sections.
+    doc = _10k_document(heading=str)
+    with patch.object(SlicingSECDocument, "get_table_of_contents", return_value=_toc(doc)):
+        expected = {section: doc.get_section_narrative(section) for section in SECTIONS}
+        narratives = doc.get_section_narratives(SECTIONS)
+
+    assert narratives == expected
+    assert not any(narratives.values())
+
+
+def test_exact_headings_extract_sections_whose_heading_repeats_the_toc_entry() -> None:
+    doc = _10k_document(heading=str)
+    with patch.object(SlicingSECDocument, "get_table_of_contents", return_value=_toc(doc)):
+        narratives = doc.get_section_narratives(SECTIONS, exact_headings=True)
+
+    assert [el.text for el in narratives[SECSection.BUSINESS]] == [
+        "About Item 1. Business.",
+        "A bullet on Item 1. Business.",
+        "Closing remarks on Item 1. Business.",
+    ]
+    assert narratives[SECSection.UNRESOLVED_STAFF_COMMENTS] == []
+    assert narratives[SECSection.DILUTION] == []
+
+
+def test_exact_headings_agree_when_headings_differ_from_the_toc() -> None:
+    doc = _10k_document()
+    with patch.object(SlicingSECDocument, "get_table_of_contents", return_value=_toc(doc)):
+        assert doc.get_section_narratives(SECTIONS, exact_headings=True) == doc.get_section_narratives(SECTIONS)
+
+
+def _10k_html(heading: Callable[[str], str]) -> str:
+    rows = "".join(f"<tr><td>{title}</td><td>{page}</td></tr>" for page, title in enumerate(TOC_TITLES, 3))
+    body = "".join(
+        f"<div><span>{heading(title)}</span></div>"
+        f"<p>About {title}.</p><ul><li>&#8226; A bullet on {title}.</li></ul><p>Closing remarks on {title}.</p>"
+        for title in TOC_TITLES
+    )
+    return (
+        "<SEC-DOCUMENT>\n<DOCUMENT>\n<TYPE>10-K\n<FILENAME>10k.htm\n<TEXT>\n<html><body>"
+        f"<p>Table of Contents</p><table>{rows}</table>{body}<p>Signatures</p>"
+        "</body></html>\n</TEXT>\n</DOCUMENT>\n</SEC-DOCUMENT>\n"
+    )
+
+
+@pytest.mark.parametrize("heading", [str, str.upper])
+def test_matches_per_section_extraction_on_partitioned_html(heading: Callable[[str], str]) -> None:
+    with (
+        patch(f"{STREAMING}.Text", EqualText),
+        patch(f"{STREAMING}.Title", EqualTitle),
+        patch(f"{STREAMING}.NarrativeText", EqualNarrativeText),
+        patch(f"{STREAMING}.ListItem", EqualListItem),
+        patch(f"{STREAMING}.is_bulleted_text", side_effect=lambda text: text.startswith("•")),
+        patch(f"{STREAMING}.clean_bullets", side_effect=lambda text: text.lstrip("• ")),
+        patch(f"{STREAMING}.is_possible_narrative_text", side_effect=lambda text: text.endswith(".")),
+        patch(f"{STREAMING}.is_possible_title", side_effect=lambda text: not text.isdigit()),
+    ):
+        doc = T.cast(SlicingSECDocument, SlicingSECDocument.from_stream(_10k_html(heading)))
+    toc = doc._slice(doc.elements[: 1 + 2 * len(TOC_TITLES)])  # the title, then entries and page numbers
+    toc.pages = [1]
+
+    with patch.object(SlicingSECDocument, "get_table_of_contents", return_value=toc):
+        expected = {section: doc.get_section_narrative(section) for section in SECTIONS}
+        narratives = doc.get_section_narratives(SECTIONS)
+
+    assert doc.filing_type == "10-K"
+    assert narratives == expected
+    assert bool(narratives[SECSection.BUSINESS]) is (heading is str.upper)
+
+
+def test_table_of_contents_is_computed_once() -> None:
+    doc = _10k_document()
+    with patch.object(SlicingSECDocument, "get_table_of_contents", return_value=_toc(doc)) as get_toc:
+        doc.get_section_narratives(SECTIONS)
+        doc.get_section_narratives([SECSection.RISK_FACTORS])
+
+    assert get_toc.call_count == 1
+
+
+def test_without_table_of_contents_falls_back_to_titles() -> None:
+    doc = _10k_document()
+    toc = MagicMock()
+    toc.pages = []
+    with (
+        patch.object(SlicingSECDocument, "get_table_of_contents", return_value=toc),
+        patch(f"{MODULE}.is_possible_title", side_effect=lambda text: text.isupper()),
+    ):
+        expected = {section: doc.get_section_narrative_no_toc(section) for section in SECTIONS}
+        assert doc.get_section_narratives(SECTIONS) == expected
+    assert expected[SECSection.RISK_FACTORS]
+
+
+def test_invalid_filing_type() -> None:
+    doc = _10k_document()
+    doc.filing_type = "8-K"
+    with pytest.raises(ValueError):
+        doc.get_section_narratives([SECSection.BUSINESS])
+
+
+def test_feature_table_matches_text_classifiers() -> None:
+    doc = _10k_document()
+    features = doc.element_features()
+
+    assert doc.element_features() is features
+    for i, element in enumerate(doc.elements):
+        assert features.row(element) == i
+        assert features.cleaned[i] == _clean_sec_text(element.text, lowercase=True)
+        assert features.is_item_title[i] == is_item_title(element.text, "10-K")
+        assert features.is_risk_title[i] == is_risk_title(element.text, "10-K")
+        for section in SECTIONS:
+            assert is_section_elem(section, element, "10-K", features) == is_section_elem(section, element, "10-K")
+
+    other = Title("Item 1A. Risk Factors")
+    assert features.row(other) is None
+    assert features.risk_title(other) and features.item_title(other)
+
+
+def test_titles_are_classified_once_per_element() -> None:
+    doc = _10k_document()
+    toc = MagicMock()
+    toc.pages = []
+    with (
+        patch.object(SlicingSECDocument, "get_table_of_contents", return_value=toc),
+        patch(f"{MODULE}.is_possible_title", return_value=False) as is_title,
+    ):
+        doc.get_section_narratives(SECTIONS)
+        doc.get_section_narrative(SECSection.RISK_FACTORS)
+
+    assert is_title.call_count == len(doc.elements)
+
+
+def test_feature_table_follows_new_element_lists() -> None:
+    doc = _10k_document()
+    features = doc.element_features()
+    doc.elements = doc.elements[:5]
+    assert doc.element_features() is not features
+    assert len(doc.element_features().cleaned) == 5
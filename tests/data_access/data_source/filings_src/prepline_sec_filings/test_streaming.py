@@ -0,0 +1,125 @@
+import io
+from typing import Generator, List, Tuple
+from unittest.mock import patch
+
+import pytest
+from finrobot.data_access.data_source.filings_src.prepline_sec_filings.element_cache import ElementCache, content_key
+from finrobot.data_access.data_source.filings_src.prepline_sec_filings.sec_document import SECDocument
+from finrobot.data_access.data_source.filings_src.prepline_sec_filings.streaming import (
+    PartitionStats,
+    iter_filing_elements,
+)
+
+MODULE = "finrobot.data_access.data_source.filings_src.prepline_sec_filings.streaming"
+
+FILING = """<SEC-DOCUMENT>0000320193-23-000106.txt
+<DOCUMENT>
+<TYPE>10-K
+<SEQUENCE>1
+<FILENAME>aapl-20230930.htm
+<TEXT>
+<html><head><title>aapl-20230930</title><style>p { margin: 0 }</style></head>
+<body>
+<div style="display: none"><ix:header><ix:hidden><ix:nonNumeric>hidden fact</ix:nonNumeric></ix:hidden>
+<ix:resources>context</ix:resources></ix:header></div>
+<div><span style="font-weight:700">PART I</span></div>
+<div><span>Item 1.&#160;&#160;&#160;&#160;Business</span></div>
+<div><p>The Company designs, <b>manufactures</b> and markets smartphones.</p>tail text</div>
+<ul><li>&#8226; iPhone</li><li>&#8226; Mac</li></ul>
+<p>Line one<br>line two.</p>
+<script>var x = "not text";</script>
+<table><tr><td>Total net sales</td><td>$<ix:nonFraction>383,285</ix:nonFraction></td></tr></table>
+</body></html>
+</TEXT>
+</DOCUMENT>
+<DOCUMENT>
+<TYPE>EX-21.1
+<TEXT>Subsidiaries of the Registrant.</TEXT>
+</DOCUMENT>
+</SEC-DOCUMENT>
+"""
+
+EXPECTED = [
+    ("Title", "PART I"),
+    ("Text", "Item 1. Business"),
+    ("NarrativeText", "The Company designs, manufactures and markets smartphones."),
+    ("Text", "tail text"),
+    ("ListItem", "iPhone"),
+    ("ListItem", "Mac"),
+    ("NarrativeText", "Line one line two."),
+    ("Text", "Total net sales"),
+    ("Text", "$383,285"),
+    ("NarrativeText", "Subsidiaries of the Registrant."),
+]
+
+
+@pytest.fixture(autouse=True)
+def classifiers() -> Generator[None, None, None]:
+    with (
+        patch(f"{MODULE}.is_bulleted_text", side_effect=lambda text: text.startswith("•")),
+        patch(f"{MODULE}.clean_bullets", side_effect=lambda text: text.lstrip("• ")),
+        patch(f"{MODULE}.is_possible_narrative_text", side_effect=lambda text: text.endswith(".")),
+        patch(f"{MODULE}.is_possible_title", side_effect=lambda text: text.isupper()),
+    ):
+        yield
+
+
+def _records(source: str, chunk_size: int = 64) -> Tuple[List[Tuple[str, str]], PartitionStats]:
+    stats = PartitionStats()
+    elements = iter_filing_elements(source, chunk_size=chunk_size, stats=stats)
+    return [(type(el).__name__, el.text) for el in elements], stats
+
+
+def test_partitions_blocks_and_skips_hidden_content() -> None:
+    records, stats = _records(FILING)
+
+    assert records == EXPECTED
+    assert stats.filing_type == "10-K"
+    assert stats.elements == len(EXPECTED)
+    assert stats.chars == len(FILING)
+    assert stats.hidden_blocks == 4  # title, style, the display:none div and script
+    assert stats.max_block_chars < 100
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_chunk_boundaries_do_not_change_the_output(chunk_size: int) -> None:
+    assert _records(FILING, chunk_size)[0] == EXPECTED
+
+
+def test_elements_are_yielded_before_the_stream_is_consumed() -> None:
+    stream = io.StringIO(FILING + "<div>filler</div>" * 10_000)
+    elements = iter_filing_elements(stream, chunk_size=1024)
+
+    assert next(elements).text == "PART I"
+    assert stream.tell() < 4096
+
+
+def test_skips_documents_that_are_not_html_or_text() -> None:
+    graphic = (
+        "<DOCUMENT>\n<TYPE>GRAPHIC\n<SEQUENCE>3\n<FILENAME>logo.jpg\n<TEXT>\nbegin 644 logo.jpg\n"
+        "M_]C_X``02D9)1@`!`0$`8`!@``#_VP!#``@&!@<&!0@'!P<)\"<Q]<T&@Z\n`\nend\n</TEXT>\n</DOCUMENT>\n"
+        '<DOCUMENT>\n<TYPE>EX-101.CAL\n<FILENAME>aapl-20230930_cal.json\n<TEXT>\n{"a": 1}\n</TEXT>\n</DOCUMENT>\n'
+    )
+    records, stats = _records(FILING.replace("</SEC-DOCUMENT>", graphic + "</SEC-DOCUMENT>"))
+
+    assert records == EXPECTED
+    assert stats.skipped_documents == 2
+
+
+def test_sec_document_from_stream() -> None:
+    document = SECDocument.from_stream(io.StringIO(FILING))
+
+    assert document.filing_type == "10-K"
+    assert [el.text for el in document.elements] == [text for _, text in EXPECTED]
+
+
+def test_element_cache_streams_when_asked() -> None:
+    cache = ElementCache()
+    with patch.object(SECDocument, "from_string", create=True) as from_string:
+        document = cache.document(FILING, SECDocument, streaming=True)
+        again = cache.document(FILING, SECDocument, streaming=True)
+
+    from_string.assert_not_called()
+    assert document.filing_type == again.filing_type == "10-K"
+    assert cache.hits == 1
+    assert content_key(FILING, variant="stream") != content_key(FILING)
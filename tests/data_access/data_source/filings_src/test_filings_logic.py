@@ -1,3 +1,4 @@
+import concurrent.futures
 import typing as T
 from unittest.mock import MagicMock, patch
 
@@ -44,13 +45,40 @@ def test_pipeline_api(mock_convert: MagicMock, mock_validate: MagicMock, mock_se
     assert "BUSINESS" in res
 
 
+@patch("finrobot.data_access.data_source.filings_src.sec_filings.SECDocument")
+@patch("finrobot.data_access.data_source.filings_src.sec_filings.convert_to_isd")
+def test_pipeline_api_streaming_is_opt_in(mock_convert: MagicMock, mock_sec_doc_cls: MagicMock) -> None:
+    for document in (mock_sec_doc_cls.from_string.return_value, mock_sec_doc_cls.from_stream.return_value):
+        document.filing_type = "10-K"
+        document.get_section_narrative.return_value = []
+
+    SECExtractor(ticker="AAPL").pipeline_api("raw text " * 1_000_000, m_section=["BUSINESS"])
+    mock_sec_doc_cls.from_stream.assert_not_called()
+
+    SECExtractor(ticker="AAPL", streaming=True).pipeline_api("streamed text", m_section=["BUSINESS"])
+    mock_sec_doc_cls.from_stream.assert_called_once()
+
+
+@patch("finrobot.data_access.data_source.filings_src.sec_filings.SECDocument")
+@patch("finrobot.data_access.data_source.filings_src.sec_filings.convert_to_isd")
+def test_pipeline_api_exact_headings_is_opt_in(mock_convert: MagicMock, mock_sec_doc_cls: MagicMock) -> None:
+    document = mock_sec_doc_cls.from_string.return_value
+    document.filing_type = "10-K"
+
+    SECExtractor(ticker="AAPL").pipeline_api("default headings", m_section=["BUSINESS"])
+    assert document.get_section_narratives.call_args.kwargs == {"exact_headings": False}
+
+    SECExtractor(ticker="AAPL", exact_headings=True).pipeline_api("exact headings", m_section=["BUSINESS"])
+    assert document.get_section_narratives.call_args.kwargs == {"exact_headings": True}
+
+
 def test_timeout() -> None:
     with timeout(seconds=1):
         pass  # Should not raise
 
 
 @patch("finrobot.data_access.data_source.filings_src.secData.get_cik_by_ticker")
-@patch("requests.get")
+@patch("requests.Session.get")
 @patch("finrobot.data_access.data_source.filings_src.secData.get_filing")
 @patch("finrobot.data_access.data_source.filings_src.secData.SECExtractor")
 @patch("finrobot.data_access.data_source.filings_src.secData.Document")
@@ -81,15 +109,8 @@ def test_sec_main(
     mock_extractor_cls.return_value = mock_extractor
     mock_extractor.get_section_texts_from_text.return_value = {"BUSINESS": "Section text"}
 
-    # Need to mock the pools or avoid them
-    with patch("concurrent.futures.ThreadPoolExecutor") as mock_thread_pool:
-        with patch("concurrent.futures.ProcessPoolExecutor") as mock_process_pool:
-            mock_thread_instance = mock_thread_pool.return_value.__enter__.return_value
-            mock_thread_instance.map.return_value = ["raw filing text"]
-
-            mock_process_instance = mock_process_pool.return_value.__enter__.return_value
-            mock_process_instance.map.return_value = [{"BUSINESS": "Section text"}]
-
-            docs, form_names = sec_main("AAPL", "2023")
-            assert len(docs) == 1
-            assert "10-K" in form_names
+    # Parse on threads instead of processes so the mocked extractor does not need to be pickled
+    with patch("concurrent.futures.ProcessPoolExecutor", concurrent.futures.ThreadPoolExecutor):
+        docs, form_names = sec_main("AAPL", "2023")
+        assert len(docs) == 1
+        assert "10-K" in form_names
@@ -0,0 +1,144 @@
+import concurrent.futures
+import json
+import threading
+import time
+import typing as T
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from finrobot.data_access.data_source.domains.filings.filing_store import FilingStore
+from finrobot.data_access.data_source.filings_src.pipeline import (
+    SHARED_MEMORY_MIN_BYTES,
+    FilingRef,
+    PipelineStats,
+    get_parser_pool,
+    shutdown_parser_pool,
+    stream_filings,
+)
+
+FILINGS = {f"acc-{i}": json.dumps({"Item 1": f"business {i}", "Item 7": f"mdna {i}"}) for i in range(6)}
+
+
+def test_streams_all_filings_through_parser_processes() -> None:
+    stats = PipelineStats()
+    results = list(stream_filings(list(FILINGS), download=FILINGS.__getitem__, parse=json.loads, stats=stats))
+
+    assert sorted(result.index for result in results) == list(range(6))
+    for result in results:
+        assert result.ok
+        assert result.sections == json.loads(FILINGS[result.accession_number])
+    assert stats.parsed == 6 and stats.failed == 0
+    assert stats.wall_seconds > 0
+
+
+def test_failed_filings_are_reported_and_others_complete() -> None:
+    def download(accession_number: str) -> str:
+        if accession_number == "acc-1":
+            raise ConnectionError("reset by peer")
+        if accession_number == "acc-2":
+            return "not json"
+        return FILINGS[accession_number]
+
+    stats = PipelineStats()
+    results = {r.accession_number: r for r in stream_filings(list(FILINGS), download, json.loads, stats=stats)}
+
+    assert results["acc-1"].error is not None and "download failed" in results["acc-1"].error
+    assert results["acc-2"].error is not None and "parse failed" in results["acc-2"].error
+    assert all(results[f"acc-{i}"].ok for i in (0, 3, 4, 5))
+    assert stats.parsed == 4 and stats.failed == 2
+    assert set(stats.errors) == {"acc-1", "acc-2"}
+
+
+def test_queue_size_bounds_raw_filings_in_memory() -> None:
+    held = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def download(accession_number: str) -> str:
+        nonlocal held, peak
+        with lock:
+            held += 1
+            peak = max(peak, held)
+        return FILINGS[accession_number]
+
+    def parse(text: str) -> T.Dict[str, str]:
+        nonlocal held
+        time.sleep(0.01)
+        with lock:
+            held -= 1
+        return T.cast(T.Dict[str, str], json.loads(text))
+
+    with patch("concurrent.futures.ProcessPoolExecutor", concurrent.futures.ThreadPoolExecutor):
+        results = list(stream_filings(list(FILINGS), download, parse, download_workers=4, queue_size=2))
+
+    assert len(results) == 6 and all(result.ok for result in results)
+    assert peak <= 2
+
+
+def test_empty_input() -> None:
+    assert list(stream_filings([], download=FILINGS.__getitem__, parse=json.loads)) == []
+
+
+def _large_sections(text: str) -> T.Dict[str, str]:
+    return {"Item 1": text * 50_000}
+
+
+def test_parsers_read_spooled_files_and_return_large_results_through_shared_memory(tmp_path: Path) -> None:
+    spool = tmp_path / "spool"
+    spool.mkdir()
+    results = list(stream_filings(list(FILINGS)[:2], FILINGS.__getitem__, _large_sections, spool_dir=str(spool)))
+
+    assert all(result.ok for result in results)
+    for result in results:
+        assert result.sections == _large_sections(FILINGS[result.accession_number])
+        assert len(json.dumps(result.sections)) > SHARED_MEMORY_MIN_BYTES
+    assert list(spool.iterdir()) == []  # spooled filings are removed once read
+
+
+def test_parsers_read_filings_from_the_store(tmp_path: Path) -> None:
+    store = FilingStore(tmp_path)
+    for accession_number, text in FILINGS.items():
+        store.put(320193, accession_number.replace("acc-", "00003201932300000"), text)
+
+    def download(accession_number: str) -> FilingRef:
+        return FilingRef.stored(str(tmp_path), 320193, accession_number.replace("acc-", "00003201932300000"))
+
+    results = list(stream_filings(list(FILINGS), download, json.loads))
+    assert sorted(r.accession_number for r in results if r.ok) == sorted(FILINGS)
+
+
+def test_spooled_file_is_removed_when_parsing_fails(tmp_path: Path) -> None:
+    results = list(stream_filings(["acc-0"], lambda _: "not json", json.loads, spool_dir=str(tmp_path)))
+
+    assert results[0].error is not None and "parse failed" in results[0].error
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_text_is_sent_to_the_parsers_unless_a_spool_dir_is_given() -> None:
+    with patch("tempfile.mkstemp") as mkstemp:
+        results = list(stream_filings(list(FILINGS)[:2], FILINGS.__getitem__, json.loads))
+
+    assert all(result.ok for result in results)
+    mkstemp.assert_not_called()
+
+
+def test_parser_pool_persists_across_calls() -> None:
+    pool = get_parser_pool()
+    list(stream_filings(list(FILINGS)[:1], FILINGS.__getitem__, json.loads))
+
+    assert get_parser_pool() is pool
+    shutdown_parser_pool()
+    assert get_parser_pool() is not pool
+
+
+def test_replacing_the_pool_does_not_fail_a_running_call() -> None:
+    pool = get_parser_pool(2)
+    results = stream_filings(list(FILINGS), FILINGS.__getitem__, json.loads, parse_workers=2, queue_size=1)
+    first = next(results)
+
+    assert get_parser_pool(3) is not pool
+    assert all(result.ok for result in [first, *results])
+    with pytest.raises(RuntimeError):  # shut down once the call is done
+        pool.submit(json.loads, "{}")
+    shutdown_parser_pool()
@@ -1,35 +1,26 @@
+import concurrent.futures
 from datetime import datetime
+from pathlib import Path
 from typing import Any, Dict, Generator, Tuple
 from unittest.mock import MagicMock, call, patch
 
 import pandas as pd
 import pytest
-from finrobot.data_access.data_source.filings_src.secData import sec_main
+from finrobot.data_access.data_source.domains.filings.filing_store import configure_filing_store
+from finrobot.data_access.data_source.filings_src.pipeline import FilingRef
+from finrobot.data_access.data_source.filings_src.secData import _get_filing_for_parser, sec_main
 from langchain.schema import Document
 
 
-# Mock the ThreadPoolExecutor and ProcessPoolExecutor to run synchronously or mock results
+# Parse on threads instead of processes so the mocked extractor does not need to be pickled
 @pytest.fixture
-def mock_executors() -> Generator[Tuple[MagicMock, MagicMock], None, None]:
-    with (
-        patch("concurrent.futures.ThreadPoolExecutor") as mock_thread_pool,
-        patch("concurrent.futures.ProcessPoolExecutor") as mock_process_pool,
-    ):
-        # Configure ThreadPool
-        mock_thread_instance = mock_thread_pool.return_value
-        mock_thread_instance.__enter__.return_value = mock_thread_instance
-        mock_thread_instance.map.side_effect = lambda f, iterable: map(f, iterable)
-
-        # Configure ProcessPool
-        mock_process_instance = mock_process_pool.return_value
-        mock_process_instance.__enter__.return_value = mock_process_instance
-        mock_process_instance.map.side_effect = lambda f, iterable: map(f, iterable)
-
-        yield mock_thread_instance, mock_process_instance
+def mock_executors() -> Generator[None, None, None]:
+    with patch("concurrent.futures.ProcessPoolExecutor", concurrent.futures.ThreadPoolExecutor):
+        yield
 
 
 @patch("finrobot.data_access.data_source.filings_src.secData.Document")
-@patch("finrobot.data_access.data_source.filings_src.secData.requests.get")
+@patch("requests.Session.get")
 @patch("finrobot.data_access.data_source.filings_src.secData.get_cik_by_ticker")
 @patch("finrobot.data_access.data_source.filings_src.secData.get_filing")
 @patch("finrobot.data_access.data_source.filings_src.secData.SECExtractor")
@@ -39,7 +30,7 @@ def test_sec_main(
     mock_get_cik: MagicMock,
     mock_requests_get: MagicMock,
     mock_document: MagicMock,
-    mock_executors: Tuple[MagicMock, MagicMock],
+    mock_executors: None,
 ) -> None:
     # Setup Mocks
     mock_get_cik.return_value = "0000320193"
@@ -92,7 +83,7 @@ def test_sec_main(
     assert mock_extractor_instance.get_section_texts_from_text.called
 
 
-@patch("finrobot.data_access.data_source.filings_src.secData.requests.get")
+@patch("requests.Session.get")
 @patch("finrobot.data_access.data_source.filings_src.secData.get_cik_by_ticker")
 def test_sec_main_api_error(mock_get_cik: MagicMock, mock_requests_get: MagicMock) -> None:
     mock_get_cik.return_value = "0000320193"
@@ -100,15 +91,19 @@ def test_sec_main_api_error(mock_get_cik: MagicMock, mock_requests_get: MagicMoc
     mock_response.status_code = 404
     mock_requests_get.return_value = mock_response
 
-    # Should handle error gracefully, likely raising Key error if json_data not set or just logging
-    # Looking at code: it prints error but then tries to access json_data reference which might be unbound if not handled?
-    # Wait, the code says:
-    # if status == 200: json_data = ...
-    # else: print...
-    # then access json_data['filings'] -> This will raise UnboundLocalError in actual code!
-    # We should expect failure here unless fixed. For now let's test that logic flow
-    # but we can't fix the code now, just test.
-    # Let's Skip this test if it crashes or expect exception.
-
-    with pytest.raises(UnboundLocalError):
-        sec_main("AAPL", "2023")
+    # the error is reported and nothing is extracted
+    assert sec_main("AAPL", "2023") == ([], [])
+
+
+@patch("finrobot.data_access.data_source.filings_src.secData.get_filing")
+def test_parsers_get_filing_store_references(mock_get_filing: MagicMock, tmp_path: Path) -> None:
+    mock_get_filing.return_value = "raw filing text"
+    assert _get_filing_for_parser("000032019323000106", cik=320193, company="c", email="e") == "raw filing text"
+
+    store = configure_filing_store(tmp_path)
+    assert store is not None
+    store.put(320193, "000032019323000106", "stored filing text")
+    ref = _get_filing_for_parser("000032019323000106", cik=320193, company="c", email="e")
+
+    assert isinstance(ref, FilingRef) and ref.read() == "stored filing text"
+    assert mock_get_filing.call_count == 1
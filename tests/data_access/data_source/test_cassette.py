@@ -0,0 +1,131 @@
+import gzip
+import json
+import time
+from typing import Any, Callable, Generator
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+from finrobot.data_access.data_source import cassette as cassette_module
+from finrobot.data_access.data_source.cassette import (
+    CassetteMiss,
+    get_cassette,
+    install_cassette_from_env,
+    uninstall_cassette,
+    use_cassette,
+)
+
+
+def fake_network(payload: Any) -> Callable[..., requests.Response]:
+    def send(adapter: Any, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response.url = request.url or ""
+        response.headers["Content-Type"] = "application/json"
+        response._content = json.dumps(payload).encode()
+        return response
+
+    return send
+
+
+@pytest.fixture(autouse=True)
+def no_cassette_left_installed() -> Generator[None, None, None]:
+    yield
+    if get_cassette() is not None:
+        uninstall_cassette()
+
+
+class TestCassette:
+    def test_record_then_replay_without_network(self, tmp_path) -> None:  # type: ignore[no-untyped-def]
+        path = tmp_path / "fmp.json.gz"
+        url = "https://financialmodelingprep.com/api/v3/quote/AAPL?apikey=SECRET&limit=1"
+        with patch("requests.adapters.HTTPAdapter.send", fake_network([{"symbol": "AAPL"}])):
+            with use_cassette(path, mode="record") as cassette:
+                assert requests.get(url).json() == [{"symbol": "AAPL"}]
+            assert cassette.stats.recorded == 1
+
+        raw = gzip.open(path, "rt").read()
+        assert "SECRET" not in raw
+
+        offline = MagicMock(side_effect=AssertionError("network used during replay"))
+        with patch("requests.adapters.HTTPAdapter.send", offline):
+            with use_cassette(path) as cassette:
+                # query order and a different key do not matter
+                other_key_url = "https://FinancialModelingPrep.com/api/v3/quote/AAPL?limit=1&apikey=OTHER"
+                response = requests.Session().get(other_key_url, stream=True)
+                assert b"".join(response.iter_content(4)) == b'[{"symbol": "AAPL"}]'
+                with pytest.raises(CassetteMiss):
+                    requests.get("https://financialmodelingprep.com/api/v3/quote/MSFT")
+        assert cassette.stats.to_dict() == {"hits": 1, "misses": 1, "recorded": 0}
+        offline.assert_not_called()
+        # the original transport is restored afterwards
+        assert requests.Session.send is cassette_module._original_send
+
+    def test_failed_save_leaves_no_temporary_file(self, tmp_path) -> None:  # type: ignore[no-untyped-def]
+        cassette = cassette_module.Cassette(tmp_path / "broken.json.gz", mode="record")
+        cassette.interactions = {"GET https://example.com": [object()]}  # type: ignore[list-item]
+        with pytest.raises(TypeError):
+            cassette.save()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_repeated_requests_replay_in_order(self, tmp_path) -> None:  # type: ignore[no-untyped-def]
+        path = tmp_path / "sec.json.gz"
+        responses = iter([["first"], ["second"]])
+
+        def send(adapter: Any, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+            return fake_network(next(responses))(adapter, request)
+
+        with patch("requests.adapters.HTTPAdapter.send", send), use_cassette(path, mode="record"):
+            requests.get("https://data.sec.gov/submissions/CIK0000320193.json")
+            requests.get("https://data.sec.gov/submissions/CIK0000320193.json")
+
+        with use_cassette(path):
+            bodies = [requests.get("https://data.sec.gov/submissions/CIK0000320193.json").json() for _ in range(3)]
+        assert bodies == [["first"], ["second"], ["second"]]
+
+    def test_injected_latency(self, tmp_path) -> None:  # type: ignore[no-untyped-def]
+        path = tmp_path / "slow.json.gz"
+        with patch("requests.adapters.HTTPAdapter.send", fake_network({})), use_cassette(path, mode="record"):
+            requests.post("https://finnhub.io/api/v1/quote", json={"symbol": "AAPL"})
+
+        with use_cassette(path, latency=0.05):
+            start = time.perf_counter()
+            requests.post("https://finnhub.io/api/v1/quote", json={"symbol": "AAPL"})
+            assert time.perf_counter() - start >= 0.05
+            with pytest.raises(CassetteMiss):  # the body is part of the key
+                requests.post("https://finnhub.io/api/v1/quote", json={"symbol": "MSFT"})
+
+    def test_curl_cffi_sessions_are_intercepted(self, tmp_path) -> None:  # type: ignore[no-untyped-def]
+        curl_requests = pytest.importorskip("curl_cffi.requests")
+        path = tmp_path / "yahoo.json.gz"
+        live = curl_requests.Response()
+        live.status_code = 200
+        live.content = b'{"chart": {}}'
+        live.url = "https://query2.finance.yahoo.com/v8/finance/chart/AAPL?crumb=abc&range=1d"
+        live.headers = curl_requests.Headers({"Content-Type": "application/json", "Set-Cookie": "A3=SECRET"})
+        live.cookies.set("A3", "SECRET", domain=".yahoo.com")
+
+        with patch.object(curl_requests.Session, "request", return_value=live):
+            with use_cassette(path, mode="record"):
+                curl_requests.Session().get(live.url.split("?")[0], params={"range": "1d", "crumb": "abc"})
+
+        with use_cassette(path):
+            url = "https://query2.finance.yahoo.com/v8/finance/chart/AAPL"
+            replayed = curl_requests.Session().get(url, params={"crumb": "other", "range": "1d"})
+        assert replayed.json() == {"chart": {}}
+        assert replayed.headers.get("Content-Type") == "application/json"
+        raw = gzip.open(path, "rt").read()
+        assert "SECRET" not in raw and '"A3"' in raw
+
+    def test_install_from_env(self, tmp_path, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+        monkeypatch.delenv("FINROBOT_CASSETTE", raising=False)
+        assert install_cassette_from_env() is None
+
+        monkeypatch.setenv("FINROBOT_CASSETTE", str(tmp_path / "env.json.gz"))
+        monkeypatch.setenv("FINROBOT_CASSETTE_MODE", "record")
+        monkeypatch.setenv("FINROBOT_CASSETTE_LATENCY", "recorded")
+        cassette = install_cassette_from_env()
+        assert cassette is get_cassette()
+        assert cassette is not None and (cassette.mode, cassette.latency) == ("record", "recorded")
+        uninstall_cassette()
+        assert (tmp_path / "env.json.gz").exists()
@@ -0,0 +1,129 @@
+import os
+import threading
+from typing import Any, List
+from unittest.mock import MagicMock, patch
+
+import requests
+from finrobot.data_access.data_source.clients import ClientHandle, ClientRegistry, get_client_registry
+from finrobot.data_access.data_source.finnhub_utils import FinnHubUtils
+
+
+class TestClientRegistry:
+    def test_client_built_once_per_key(self) -> None:
+        registry = ClientRegistry()
+        factory = MagicMock(side_effect=lambda: object())
+
+        first = registry.get("svc", factory, key=("a",))
+        second = registry.get("svc", factory, key=("a",))
+        other = registry.get("svc", factory, key=("b",))
+
+        assert first is second
+        assert other is not first
+        assert factory.call_count == 2
+        assert registry.stats()["clients"]["svc"] == {"builds": 2, "reuses": 1}
+
+    def test_thread_local_clients(self) -> None:
+        registry = ClientRegistry()
+        seen: List[Any] = []
+
+        def worker() -> None:
+            first = registry.get("svc", object, thread_local=True)
+            seen.append((first, registry.get("svc", object, thread_local=True)))
+
+        threads = [threading.Thread(target=worker) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        (a1, a2), (b1, b2) = seen
+        assert a1 is a2
+        assert b1 is b2
+        assert a1 is not b1
+
+    def test_clients_are_built_outside_the_registry_lock(self) -> None:
+        registry = ClientRegistry()
+        slow_started = threading.Event()
+        release = threading.Event()
+        built: List[Any] = []
+
+        def slow_factory() -> object:
+            slow_started.set()
+            assert release.wait(timeout=5)
+            return object()
+
+        slow = threading.Thread(target=lambda: built.append(registry.get("slow", slow_factory)))
+        slow.start()
+        assert slow_started.wait(timeout=5)
+        try:
+            # another client builds while the slow one is still being constructed
+            fast = registry.get("fast", object)
+            assert registry.get("fast", object) is fast
+        finally:
+            release.set()
+            slow.join(timeout=5)
+
+        assert built and registry.get("slow", slow_factory) is built[0]
+        assert registry.stats()["clients"]["slow"] == {"builds": 1, "reuses": 1}
+
+    def test_concurrent_callers_share_one_build(self) -> None:
+        registry = ClientRegistry()
+        barrier = threading.Barrier(4, timeout=5)
+        factory = MagicMock(side_effect=lambda: object())
+        seen: List[Any] = []
+
+        def worker() -> None:
+            barrier.wait()
+            seen.append(registry.get("svc", factory))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert len(seen) == 4 and all(client is seen[0] for client in seen)
+        assert factory.call_count == 1
+
+    def test_sessions_share_the_pool(self) -> None:
+        registry = ClientRegistry()
+        session = registry.session()
+
+        assert registry.session() is session
+        assert registry.new_session() is not session
+        assert isinstance(session, requests.Session)
+        assert session.get_adapter("https://example.com") is registry.adapter
+        assert registry.new_session().get_adapter("http://example.com") is registry.adapter
+
+    def test_clear_drops_clients(self) -> None:
+        registry = ClientRegistry()
+        first = registry.get("svc", object)
+        registry.clear()
+
+        assert registry.get("svc", object) is not first
+        assert registry.stats()["clients"]["svc"]["builds"] == 1
+
+
+class TestClientHandle:
+    def test_credentials_change_rebuilds_client(self) -> None:
+        factory = MagicMock(side_effect=lambda: MagicMock(ping=MagicMock(return_value=os.environ["SVC_KEY"])))
+        handle = ClientHandle("svc", factory, credentials=("SVC_KEY",))
+
+        with patch.dict(os.environ, {"SVC_KEY": "one"}):
+            assert handle.ping() == "one"
+            assert handle.ping() == "one"
+        with patch.dict(os.environ, {"SVC_KEY": "two"}):
+            assert handle.ping() == "two"
+
+        assert factory.call_count == 2
+
+    @patch("finrobot.data_access.data_source.clients.finnhub.Client")
+    def test_finnhub_client_reused_across_calls(self, mock_client_cls: MagicMock) -> None:
+        mock_client_cls.return_value.company_profile2.return_value = {}
+
+        with patch.dict(os.environ, {"FINNHUB_API_KEY": "test_key"}):
+            FinnHubUtils.get_company_profile("AAPL")
+            FinnHubUtils.get_company_profile("MSFT")
+
+        mock_client_cls.assert_called_once_with(api_key="test_key")
+        assert get_client_registry().stats()["clients"]["finnhub"]["reuses"] >= 1
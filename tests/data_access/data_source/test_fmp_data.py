@@ -0,0 +1,144 @@
+import asyncio
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Generator, List
+from unittest.mock import MagicMock, patch
+
+import pytest
+from finrobot.data_access.data_source.fmp_data import FMPDataClient, get_fmp_data_client
+from finrobot.data_access.data_source.fmp_utils import FMPUtils, aget_competitor_financial_metrics
+from finrobot.data_access.data_source.rate_limits import PROVIDER_RATE_LIMITS, get_rate_scheduler
+
+
+def statement_rows(years: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "date": f"{2023 - offset}-12-31",
+            "symbol": "AAPL",
+            "revenue": 100000000 - offset * 1000000,
+            "grossProfit": 40000000,
+            "ebitda": 30000000,
+            "ebitdaratio": 0.3,
+            "netIncome": 20000000,
+            "enterpriseValue": 500000000,
+            "evToOperatingCashFlow": 10.0,
+            "roic": 0.15,
+            "enterpriseValueOverEBITDA": 15.0,
+            "pbRatio": 3.0,
+            "priceEarningsRatio": 25.0,
+        }
+        for offset in range(years)
+    ]
+
+
+@pytest.fixture
+def mock_get() -> Generator[MagicMock, None, None]:
+    def respond(url: str, *args: Any, **kwargs: Any) -> MagicMock:
+        response = MagicMock()
+        if "/profile/" in url:
+            symbols = url.split("/profile/")[1].split("?")[0].split(",")
+            response.json.return_value = [{"symbol": symbol, "mktCap": 1} for symbol in symbols]
+        else:
+            limit = int(url.split("limit=")[1].split("&")[0]) if "limit=" in url else 10
+            response.json.return_value = statement_rows(limit)
+        return response
+
+    with patch.dict(os.environ, {"FMP_API_KEY": "test"}):
+        with patch("requests.Session.get", side_effect=respond) as mock:
+            yield mock
+
+
+class TestFMPDataClient:
+    def test_financial_metrics_fetch_each_endpoint_once(self, mock_get: MagicMock) -> None:
+        df = FMPUtils.get_financial_metrics("AAPL", years=4)
+
+        assert list(df.columns) == ["2020", "2021", "2022", "2023"]
+        assert mock_get.call_count == 3
+
+    def test_competitor_metrics_reuse_cached_statements(self, mock_get: MagicMock) -> None:
+        first = FMPUtils.get_competitor_financial_metrics("AAPL", ["MSFT", "GOOG"], years=4)
+        assert mock_get.call_count == 9
+
+        second = FMPUtils.get_competitor_financial_metrics("AAPL", ["MSFT"], years=2)
+        FMPUtils.get_financial_metrics("MSFT", years=3)
+        assert mock_get.call_count == 9
+        assert len(first["GOOG"]) == 4
+        assert len(second["MSFT"]) == 2
+
+    def test_larger_limit_is_refetched(self, mock_get: MagicMock) -> None:
+        client = get_fmp_data_client()
+        client.fetch("ratios", "AAPL", limit=2)
+        assert len(client.fetch("ratios", "AAPL", limit=5)) == 5
+        assert client.network_calls == 2
+
+    def test_batch_endpoints_share_one_request(self, mock_get: MagicMock) -> None:
+        client = FMPDataClient(ttl=60)
+        result = client.fetch_many("profile", ["AAPL", "MSFT", "GOOG"])
+
+        assert mock_get.call_count == 1
+        assert "/profile/AAPL,MSFT,GOOG?" in mock_get.call_args[0][0]
+        assert result["MSFT"] == [{"symbol": "MSFT", "mktCap": 1}]
+
+        client.fetch_many("profile", ["MSFT", "NVDA"])
+        assert "/profile/NVDA?" in mock_get.call_args[0][0]
+
+    def test_errors_are_not_cached(self) -> None:
+        client = FMPDataClient(ttl=60)
+        with patch("requests.Session.get") as mock_get:
+            mock_get.return_value.json.return_value = {"Error Message": "Invalid API KEY."}
+            client.fetch("ratios", "AAPL")
+            client.fetch("ratios", "AAPL")
+
+        assert mock_get.call_count == 2
+
+    def test_non_json_error_pages_become_error_objects(self) -> None:
+        client = FMPDataClient(ttl=60)
+        with patch("requests.Session.get") as mock_get:
+            mock_get.return_value.ok = True
+            mock_get.return_value.status_code = 200
+            mock_get.return_value.json.side_effect = ValueError("Expecting value")
+            assert client.fetch("ratios", "AAPL") == {"Error Message": "HTTP 200: response is not JSON"}
+
+    def test_expired_payload_is_refetched(self, mock_get: MagicMock) -> None:
+        client = FMPDataClient(ttl=0)
+        client.fetch("ratios", "AAPL", limit=1)
+        client.fetch("ratios", "AAPL", limit=1)
+        assert mock_get.call_count == 2
+
+
+class TestAsyncFanOut:
+    def test_async_matches_sync_shape(self, mock_get: MagicMock) -> None:
+        result = asyncio.run(aget_competitor_financial_metrics("AAPL", ["MSFT", "GOOG"], years=3))
+        expected = FMPUtils.get_competitor_financial_metrics("AAPL", ["MSFT", "GOOG"], years=3)
+
+        assert list(result) == ["AAPL", "MSFT", "GOOG"]
+        assert mock_get.call_count == 9
+        for symbol in expected:
+            assert result[symbol].equals(expected[symbol])
+
+    def test_concurrency_is_bounded(self, mock_get: MagicMock) -> None:
+        lock = threading.Lock()
+        in_flight = {"now": 0, "max": 0}
+        respond: Callable[[str], MagicMock] = mock_get.side_effect
+
+        def slow_respond(url: str, *args: Any, **kwargs: Any) -> MagicMock:
+            with lock:
+                in_flight["now"] += 1
+                in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            time.sleep(0.02)
+            with lock:
+                in_flight["now"] -= 1
+            return respond(url)
+
+        mock_get.side_effect = slow_respond
+        symbols = ["AAPL", "MSFT", "GOOG", "AMZN"]
+        get_rate_scheduler().configure("fmp", calls=1000, period=1.0, burst=1000)
+        try:
+            data = asyncio.run(get_fmp_data_client().astatements(symbols, ["ratios", "key-metrics"], 2, concurrency=3))
+        finally:
+            get_rate_scheduler().configure("fmp", *PROVIDER_RATE_LIMITS["fmp"])
+
+        assert mock_get.call_count == 8
+        assert 1 < in_flight["max"] <= 3
+        assert set(data) == set(symbols)
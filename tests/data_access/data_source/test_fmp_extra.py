@@ -14,14 +14,14 @@ def setup_fmp_env() -> Generator[None, None, None]:
 
 
 def test_fmp_utils_bvps_empty() -> None:
-    with patch("requests.get") as mock_get:
+    with patch("requests.Session.get") as mock_get:
         mock_get.return_value.json.return_value = []
         res = FMPUtils.get_historical_bvps("AAPL", "2023-01-01")
         assert res == "No data available"
 
 
 def test_fmp_utils_bvps_no_match() -> None:
-    with patch("requests.get") as mock_get:
+    with patch("requests.Session.get") as mock_get:
         mock_get.return_value.json.return_value = [{"date": "1990-01-01", "bookValuePerShare": 10}]
         # It should still find the closest one unless min_date_diff is not updated
         # Line 144: if closest_data:
@@ -30,7 +30,7 @@ def test_fmp_utils_bvps_no_match() -> None:
 
 
 def test_fmp_utils_financial_metrics_logic() -> None:
-    with patch("requests.get") as mock_get:
+    with patch("requests.Session.get") as mock_get:
         # Mocking 3 calls per year: income, ratios, key_metrics
         mock_income = [
             {
@@ -71,7 +71,7 @@ def test_fmp_utils_financial_metrics_logic() -> None:
 
 
 def test_fmp_utils_competitors() -> None:
-    with patch("requests.get") as mock_get:
+    with patch("requests.Session.get") as mock_get:
 
         def side_effect(*args: Any, **kwargs: Any) -> MagicMock:
             m = MagicMock()
@@ -0,0 +1,149 @@
+import os
+from datetime import datetime, timedelta
+from typing import Any, Dict, Generator, List
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+from finrobot.data_access.data_source.fmp_data import get_fmp_data_client
+from finrobot.data_access.data_source.fmp_utils import (
+    FMPUtils,
+    get_historical_bvps_series,
+    get_historical_market_cap_series,
+)
+from finrobot.data_access.data_source.point_in_time import PointInTimeIndex
+
+KEY_METRICS = [
+    {"date": "2023-09-30", "bookValuePerShare": 3.9},
+    {"date": "2022-09-24", "bookValuePerShare": 3.2},
+    {"date": "2021-09-25", "bookValuePerShare": 3.8},
+]
+
+
+def legacy_nearest(records: List[Dict[str, Any]], target: str) -> Dict[str, Any]:
+    closest, best = None, float("inf")
+    target_date = datetime.strptime(target, "%Y-%m-%d")
+    for entry in records:
+        diff = abs((target_date - datetime.strptime(entry["date"], "%Y-%m-%d")).days)
+        if diff < best:
+            best, closest = diff, entry
+    assert closest is not None
+    return closest
+
+
+@pytest.fixture
+def mock_get() -> Generator[MagicMock, None, None]:
+    def respond(url: str, *args: Any, **kwargs: Any) -> MagicMock:
+        response = MagicMock(status_code=200)
+        if "price-target" in url:
+            response.json.return_value = [
+                {"publishedDate": "2023-01-10T12:00:00.000Z", "priceTarget": 160.0},
+                {"publishedDate": "2023-01-01T09:00:00.000Z", "priceTarget": 150.0},
+                {"publishedDate": "2019-01-01T09:00:00.000Z", "priceTarget": 50.0},
+            ]
+        else:
+            response.json.return_value = KEY_METRICS
+        return response
+
+    with patch.dict(os.environ, {"FMP_API_KEY": "test"}), patch("requests.Session.get", side_effect=respond) as mock:
+        yield mock
+
+
+class TestPointInTimeIndex:
+    def test_asof_and_nearest(self) -> None:
+        index = PointInTimeIndex(KEY_METRICS)
+        assert list(index.dates.astype(str)) == ["2021-09-25", "2022-09-24", "2023-09-30"]
+        assert index.asof("2022-12-31") == 1
+        assert index.asof("2020-01-01") == -1
+        assert index.nearest("2023-06-01") == 2
+        assert index.nearest(["2000-01-01", "2022-09-24", "2030-01-01"]).tolist() == [0, 1, 2]
+        assert PointInTimeIndex([]).nearest("2023-01-01") == -1
+
+    def test_nearest_matches_linear_scan(self) -> None:
+        rng = np.random.default_rng(0)
+        start = datetime(2010, 1, 1)
+        records = [
+            {"date": (start + timedelta(days=int(day))).strftime("%Y-%m-%d"), "v": float(i)}
+            for i, day in enumerate(sorted(rng.choice(5000, size=40, replace=False), reverse=True))
+        ]
+        targets = [(start + timedelta(days=int(day))).strftime("%Y-%m-%d") for day in rng.integers(-100, 5100, 200)]
+        index = PointInTimeIndex(records)
+        positions = index.nearest(targets)
+        assert [index.records[p] for p in positions] == [legacy_nearest(records, t) for t in targets]
+
+    def test_window_and_column(self) -> None:
+        index = PointInTimeIndex(
+            [{"publishedDate": "2023-01-01T00:00:00", "priceTarget": 150.0}, {"publishedDate": "2023-03-01"}],
+            date_key="publishedDate",
+        )
+        assert index.window("2023-01-05", days=4) == slice(0, 1)
+        assert index.windows(["2023-01-05", "2023-02-01"], days=30) == [slice(0, 1), slice(1, 2)]
+        assert np.isnan(index.column("priceTarget")[1])
+
+
+class TestFMPPointInTimeLookups:
+    def test_bvps_index_built_once(self, mock_get: MagicMock) -> None:
+        assert FMPUtils.get_historical_bvps("AAPL", "2022-10-01") == 3.2
+        assert FMPUtils.get_historical_bvps("AAPL", "2023-08-01") == 3.9
+        series = get_historical_bvps_series("AAPL", ["2021-01-01", "2023-12-31"])
+
+        assert series.tolist() == [3.8, 3.9]
+        assert mock_get.call_count == 1
+        client = get_fmp_data_client()
+        assert client.index("key-metrics", "AAPL", limit=40) is client.index("key-metrics", "aapl", limit=40)
+
+    def test_target_price_window(self, mock_get: MagicMock) -> None:
+        assert FMPUtils.get_target_price("AAPL", "2023-01-05") == "150.0 - 160.0 (md. 155.0)"
+        assert FMPUtils.get_target_price("AAPL", "2017-01-01") == "50.0 - 50.0 (md. 50.0)"
+        assert FMPUtils.get_target_price("AAPL", "2010-01-01") == "N/A"
+        assert mock_get.call_count == 1
+        assert "api/v4/price-target?symbol=AAPL" in mock_get.call_args[0][0]
+
+
+class TestMarketCapHistory:
+    @pytest.fixture
+    def history_get(self) -> Generator[MagicMock, None, None]:
+        history = [
+            {"symbol": "AAPL", "date": day.strftime("%Y-%m-%d"), "marketCap": 1000.0 + i}
+            for i, day in enumerate(pd.bdate_range("2023-01-02", "2023-03-31")[::-1])
+            if day != pd.Timestamp("2023-01-16")  # holiday
+        ]
+
+        def respond(url: str, *args: Any, **kwargs: Any) -> MagicMock:
+            response = MagicMock(status_code=200)
+            if "from=" in url:
+                response.json.return_value = [{"symbol": "AAPL", "date": "2022-06-01", "marketCap": 900.0}]
+            else:
+                response.json.return_value = history
+            return response
+
+        with patch.dict(os.environ, {"FMP_API_KEY": "test"}):
+            with patch("requests.Session.get", side_effect=respond) as mock:
+                yield mock
+
+    def test_single_dates_served_from_one_history_request(self, history_get: MagicMock) -> None:
+        friday = FMPUtils.get_historical_market_cap("AAPL", "2023-03-31")
+        # Saturday rolls forward to Monday 2023-03-06
+        saturday = FMPUtils.get_historical_market_cap("AAPL", "2023-03-04")
+        monday = FMPUtils.get_historical_market_cap("AAPL", "2023-03-06")
+
+        assert friday == 1000.0
+        assert saturday == monday
+        assert FMPUtils.get_historical_market_cap("AAPL", "2023-01-16") == "No market cap data found"
+        assert history_get.call_count == 1
+
+    def test_dates_before_history_fall_back_to_a_range_request(self, history_get: MagicMock) -> None:
+        assert FMPUtils.get_historical_market_cap("AAPL", "2022-06-01") == 900.0
+        assert "from=2022-06-01&to=2022-06-01" in history_get.call_args[0][0]
+
+    def test_series(self, history_get: MagicMock) -> None:
+        series = get_historical_market_cap_series("AAPL", ["2022-06-01", "2022-06-02", "2023-03-04", "2023-03-31"])
+
+        assert series.index[2] == pd.Timestamp("2023-03-04")
+        monday = FMPUtils.get_historical_market_cap("AAPL", "2023-03-06")
+        assert series.iloc[[0, 2, 3]].tolist() == [900.0, monday, 1000.0]
+        assert np.isnan(series.iloc[1])
+        # one history request plus one range request for both 2022 dates
+        assert history_get.call_count == 2
+        assert "from=2022-06-01&to=2022-06-02" in history_get.call_args_list[1][0][0]
@@ -0,0 +1,125 @@
+import asyncio
+import threading
+import time
+from typing import List
+from unittest.mock import MagicMock, patch
+
+import pytest
+from finrobot.data_access.data_source.clients import ClientHandle
+from finrobot.data_access.data_source.rate_limits import (
+    Priority,
+    RateScheduler,
+    TokenBucket,
+    get_rate_scheduler,
+    rate_limited,
+    rate_priority,
+)
+
+
+class TestTokenBucket:
+    def test_burst_then_steady_rate(self) -> None:
+        bucket = TokenBucket(calls=20, period=1.0, burst=2)
+
+        assert bucket.acquire() == 0.0
+        assert bucket.acquire() == 0.0
+        assert bucket.acquire() == pytest.approx(0.05, abs=0.03)
+        assert bucket.stats[Priority.INTERACTIVE].delayed == 1
+
+    def test_interactive_calls_jump_the_queue(self) -> None:
+        bucket = TokenBucket(calls=20, period=1.0)
+        bucket.acquire()
+        order: List[str] = []
+
+        def call(name: str, priority: Priority) -> None:
+            bucket.acquire(priority)
+            order.append(name)
+
+        threads = [threading.Thread(target=call, args=(f"background-{i}", Priority.BACKGROUND)) for i in range(2)]
+        for thread in threads:
+            thread.start()
+        while bucket.waiting() < 2:
+            time.sleep(0.001)
+        interactive = threading.Thread(target=call, args=("interactive", Priority.INTERACTIVE))
+        interactive.start()
+        for thread in [*threads, interactive]:
+            thread.join(timeout=5)
+
+        assert order[0] == "interactive"
+        assert bucket.stats[Priority.BACKGROUND].delayed == 2
+        assert bucket.stats[Priority.INTERACTIVE].requests == 2
+
+    def test_threads_and_tasks_share_one_quota(self) -> None:
+        bucket = TokenBucket(calls=50, period=1.0)
+
+        async def tasks() -> None:
+            await asyncio.gather(*(bucket.aacquire() for _ in range(5)))
+
+        start = time.monotonic()
+        worker = threading.Thread(target=lambda: [bucket.acquire() for _ in range(5)])
+        worker.start()
+        asyncio.run(tasks())
+        worker.join(timeout=5)
+
+        # 10 tokens at 50/s with a burst of 1: the last one is granted after ~0.18s
+        assert time.monotonic() - start >= 0.17
+        assert bucket.stats[Priority.INTERACTIVE].requests == 10
+        assert bucket.waiting() == 0
+
+    def test_cancelled_waiter_leaves_the_queue(self) -> None:
+        bucket = TokenBucket(calls=1, period=10.0)
+        bucket.acquire()
+
+        async def main() -> None:
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(bucket.aacquire(), timeout=0.01)
+
+        asyncio.run(main())
+        assert bucket.waiting() == 0
+
+
+class TestRateScheduler:
+    def test_stats_by_provider_and_priority(self) -> None:
+        scheduler = RateScheduler({"sec": (100, 1.0, 1)})
+        scheduler.acquire("sec")
+        with rate_priority(Priority.BACKGROUND):
+            scheduler.acquire("sec")
+
+        stats = scheduler.stats()["sec"]
+        assert stats["interactive"]["requests"] == 1
+        assert stats["background"]["requests"] == 1
+        assert stats["background"]["waited"] > 0
+
+    def test_unknown_provider(self) -> None:
+        with pytest.raises(ValueError):
+            RateScheduler({}).acquire("nope")
+
+    def test_decorator_charges_the_shared_quota(self) -> None:
+        @rate_limited("earnings_calls")
+        def fetch() -> int:
+            return 1
+
+        @rate_limited("earnings_calls")
+        async def afetch() -> int:
+            return 2
+
+        assert fetch() == 1
+        assert asyncio.run(afetch()) == 2
+        assert get_rate_scheduler().stats()["earnings_calls"]["interactive"]["requests"] == 2
+
+    def test_client_handle_methods_are_rate_limited(self) -> None:
+        client = MagicMock()
+        client.company_profile2.return_value = {"name": "Apple"}
+        handle = ClientHandle("test", lambda: client, rate_limit="finnhub")
+
+        assert handle.company_profile2(symbol="AAPL") == {"name": "Apple"}
+        assert get_rate_scheduler().stats()["finnhub"]["interactive"]["requests"] == 1
+
+    @patch("finrobot.data_access.data_source.filings_src.prepline_sec_filings.fetch.requests.get")
+    def test_sec_fetchers_share_the_sec_quota(self, mock_get: MagicMock) -> None:
+        from finrobot.data_access.data_source.filings_src.prepline_sec_filings.fetch import get_cik_by_ticker
+
+        mock_get.return_value.text = "CIK=0000320193"
+        # tickers missing from the bulk ticker file fall back to the rate-limited search page
+        get_cik_by_ticker("UNLISTED")
+        get_cik_by_ticker("UNLISTED")
+        assert get_rate_scheduler().stats()["sec"]["interactive"]["requests"] == 2
@@ -14,7 +14,7 @@ def finnhub_api_key() -> Generator[str, None, None]:
 
 
 class TestFinnHubUtils:
-    @patch("finrobot.data_access.data_source.finnhub_utils.finnhub.Client")
+    @patch("finrobot.data_access.data_source.clients.finnhub.Client")
     def test_get_company_profile(self, mock_client_cls: MagicMock, finnhub_api_key: str) -> None:
         mock_client = MagicMock()
         mock_client_cls.return_value = mock_client
@@ -34,7 +34,7 @@ class TestFinnHubUtils:
         assert "Apple Inc." in result
         assert "Technology" in result
 
-    @patch("finrobot.data_access.data_source.finnhub_utils.finnhub.Client")
+    @patch("finrobot.data_access.data_source.clients.finnhub.Client")
     def test_get_company_news(self, mock_client_cls: MagicMock, finnhub_api_key: str) -> None:
         mock_client = MagicMock()
         mock_client_cls.return_value = mock_client
@@ -47,7 +47,7 @@ class TestFinnHubUtils:
         assert len(df) == 2
         assert "Headline 1" in df["headline"].values
 
-    @patch("finrobot.data_access.data_source.finnhub_utils.finnhub.Client")
+    @patch("finrobot.data_access.data_source.clients.finnhub.Client")
     def test_get_basic_financials_history(self, mock_client_cls: MagicMock, finnhub_api_key: str) -> None:
         mock_client = MagicMock()
         mock_client_cls.return_value = mock_client
@@ -59,7 +59,7 @@ class TestFinnHubUtils:
         assert "eps" in df.columns
         assert len(df) == 2
 
-    @patch("finrobot.data_access.data_source.finnhub_utils.finnhub.Client")
+    @patch("finrobot.data_access.data_source.clients.finnhub.Client")
     def test_get_basic_financials(self, mock_client_cls: MagicMock, finnhub_api_key: str) -> None:
         mock_client = MagicMock()
         mock_client_cls.return_value = mock_client
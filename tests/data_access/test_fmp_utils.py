@@ -14,7 +14,7 @@ def fmp_api_key() -> None:
 
 
 class TestFMPUtils:
-    @patch("finrobot.data_access.data_source.fmp_utils.requests.get")
+    @patch("requests.Session.get")
     def test_get_target_price(self, mock_get, fmp_api_key) -> None:  # type: ignore[no-untyped-def]
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -27,7 +27,19 @@ class TestFMPUtils:
         result = FMPUtils.get_target_price("AAPL", "2023-01-05")
         assert "150.0 - 160.0" in result
 
-    @patch("finrobot.data_access.data_source.fmp_utils.requests.get")
+    @patch("requests.Session.get")
+    def test_get_target_price_error_page(self, mock_get, fmp_api_key) -> None:  # type: ignore[no-untyped-def]
+        mock_response = MagicMock()
+        mock_response.ok = False
+        mock_response.status_code = 502
+        mock_response.json.side_effect = ValueError("Expecting value")
+        mock_get.return_value = mock_response
+
+        result = FMPUtils.get_target_price("AAPL", "2023-01-05")
+        assert result.startswith("Failed to retrieve data")
+        assert "502" in result
+
+    @patch("requests.Session.get")
     def test_get_sec_report(self, mock_get, fmp_api_key) -> None:  # type: ignore[no-untyped-def]
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -44,7 +56,7 @@ class TestFMPUtils:
         assert "http://link1" in result_latest
 
     @patch("finrobot.data_access.data_source.fmp_utils.get_next_weekday")
-    @patch("finrobot.data_access.data_source.fmp_utils.requests.get")
+    @patch("requests.Session.get")
     def test_get_historical_market_cap(self, mock_get, mock_get_next, fmp_api_key) -> None:  # type: ignore[no-untyped-def]
         mock_get_next.return_value = MagicMock(strftime=lambda x: "2023-01-03")
         mock_response = MagicMock()
@@ -55,7 +67,7 @@ class TestFMPUtils:
         result = FMPUtils.get_historical_market_cap("AAPL", "2023-01-01")
         assert result == 2000000000000
 
-    @patch("finrobot.data_access.data_source.fmp_utils.requests.get")
+    @patch("requests.Session.get")
     def test_get_historical_bvps(self, mock_get, fmp_api_key) -> None:  # type: ignore[no-untyped-def]
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -68,7 +80,7 @@ class TestFMPUtils:
         result = FMPUtils.get_historical_bvps("AAPL", "2023-01-05")
         assert result == 25.0
 
-    @patch("finrobot.data_access.data_source.fmp_utils.requests.get")
+    @patch("requests.Session.get")
     def test_get_financial_metrics(self, mock_get, fmp_api_key) -> None:  # type: ignore[no-untyped-def]
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -126,7 +138,7 @@ class TestFMPUtils:
         assert "2023" in df.columns
         assert df.loc["Revenue", "2023"] == 100
 
-    @patch("finrobot.data_access.data_source.fmp_utils.requests.get")
+    @patch("requests.Session.get")
     def test_get_competitor_financial_metrics(self, mock_get, fmp_api_key) -> None:  # type: ignore[no-untyped-def]
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -155,14 +167,18 @@ class TestFMPUtils:
             }
         ]
 
-        mock_get.return_value.json.side_effect = [
-            valid_response_income,
-            valid_response_ratios,
-            valid_response_metrics,  # AAPL
-            valid_response_income,
-            valid_response_ratios,
-            valid_response_metrics,  # MSFT
-        ]
+        # Symbols are fetched concurrently, so responses are routed by endpoint rather than call order
+        responses = {
+            "income-statement": valid_response_income,
+            "ratios": valid_response_ratios,
+            "key-metrics": valid_response_metrics,
+        }
+
+        def respond(url, *args, **kwargs):  # type: ignore[no-untyped-def]
+            endpoint = url.split("/api/v3/")[1].split("/")[0]
+            return MagicMock(json=MagicMock(return_value=responses[endpoint]))
+
+        mock_get.side_effect = respond
 
         result = FMPUtils.get_competitor_financial_metrics("AAPL", ["MSFT"], years=1)
         assert "AAPL" in result
@@ -181,6 +197,6 @@ class TestFMPUtils:
             pass  # The decorator logic returns None if key is missing.
 
             # Re-patching get_target_price to avoid actual network call if decorator fails (it shouldn't)
-            with patch("finrobot.data_access.data_source.fmp_utils.requests.get"):
+            with patch("requests.Session.get"):
                 res = FMPUtils.get_target_price("AAPL", "2023-01-01")
                 assert res is None
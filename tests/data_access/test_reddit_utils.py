@@ -15,7 +15,7 @@ def reddit_creds() -> Generator[None, None, None]:
 
 
 class TestRedditUtils:
-    @patch("finrobot.data_access.data_source.reddit_utils.praw.Reddit")
+    @patch("finrobot.data_access.data_source.clients.praw.Reddit")
     def test_get_reddit_posts(self, mock_reddit_cls: MagicMock, reddit_creds: None) -> None:
         mock_reddit = MagicMock()
         mock_reddit_cls.return_value = mock_reddit
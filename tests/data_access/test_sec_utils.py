@@ -1,9 +1,10 @@
 import os
+from pathlib import Path
 from typing import Generator
 from unittest.mock import MagicMock, patch
 
 import pytest
-from finrobot.data_access.data_source.sec_utils import SECUtils
+from finrobot.data_access.data_source.sec_utils import SECUtils, TenKSectionCache
 
 
 @pytest.fixture
@@ -146,7 +147,7 @@ class TestSECUtils:
         assert "No 2023 10-K filing found" in res
 
     @patch("finrobot.data_access.data_source.sec_utils.SECUtils.get_10k_metadata")
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_download_10k_pdf_success(self, mock_get: MagicMock, mock_get_meta: MagicMock, sec_api_key: str) -> None:
         mock_get_meta.return_value = {
             "ticker": "AAPL",
@@ -172,7 +173,7 @@ class TestSECUtils:
             "formType": "10-K",
         }
 
-        with patch("requests.get", side_effect=Exception("Net fail")):
+        with patch("requests.Session.get", side_effect=Exception("Net fail")):
             res = SECUtils.download_10k_pdf("AAPL", "2023-01-01", "2023-12-31", "save")
             assert "downloaded failed" in res
 
@@ -217,3 +218,74 @@ class TestSECUtils:
         assert res == "text"
         # Should call open 2 times (cache + save_path)
         assert mock_open.call_count >= 2
+
+
+class TestTenKSectionCache:
+    @pytest.fixture
+    def extractor(self, tmp_path: Path) -> Generator[MagicMock, None, None]:
+        extractor = MagicMock()
+        extractor.get_section.side_effect = lambda url, section, kind: f"{url}#{section}"
+        with (
+            patch("finrobot.data_access.data_source.sec_utils.extractor_api", extractor),
+            patch("finrobot.data_access.data_source.sec_utils.CACHE_PATH", str(tmp_path)),
+        ):
+            yield extractor
+
+    @patch("finrobot.data_access.data_source.sec_utils.FMPUtils.get_sec_report")
+    def test_repeated_sections_resolve_the_filing_once(
+        self, mock_fmp: MagicMock, extractor: MagicMock, tmp_path: Path, sec_api_key: str
+    ) -> None:
+        mock_fmp.return_value = "Link: http://link\nFiling Date: 2024-11-01"
+
+        for _ in range(5):
+            assert SECUtils.get_10k_section("AAPL", "2024", 7) == "http://link#7"
+        assert SECUtils.get_10k_section("AAPL", "2024", "1A") == "http://link#1A"
+
+        mock_fmp.assert_called_once_with("AAPL", "2024")
+        assert extractor.get_section.call_count == 2
+        # later processes still start from the file cache
+        assert (tmp_path / "sec_utils" / "AAPL_2024_7.txt").read_text() == "http://link#7"
+
+    @patch("finrobot.data_access.data_source.sec_utils.FMPUtils.get_sec_report")
+    def test_failed_lookups_are_not_remembered(
+        self, mock_fmp: MagicMock, extractor: MagicMock, sec_api_key: str
+    ) -> None:
+        mock_fmp.side_effect = ["Error from FMP", "Link: http://link"]
+
+        assert SECUtils.get_10k_section("AAPL", "2024", 1) == "Error from FMP"
+        assert SECUtils.get_10k_section("AAPL", "2024", 1) == "http://link#1"
+        assert mock_fmp.call_count == 2
+
+    @patch("finrobot.data_access.data_source.sec_utils.FMPUtils.get_sec_report")
+    def test_batch_fetches_only_missing_sections(
+        self, mock_fmp: MagicMock, extractor: MagicMock, sec_api_key: str
+    ) -> None:
+        mock_fmp.return_value = "Link: http://link"
+        SECUtils.get_10k_section("AAPL", "2024", 7)
+
+        sections = SECUtils.get_10k_sections("AAPL", "2024", [1, "1A", 7, "1"])
+
+        assert sections == {"1": "http://link#1", "1A": "http://link#1A", "7": "http://link#7"}
+        mock_fmp.assert_called_once()
+        assert sorted(call.args[1] for call in extractor.get_section.call_args_list) == ["1", "1A", "7"]
+
+    @patch("finrobot.data_access.data_source.sec_utils.FMPUtils.get_sec_report")
+    def test_batch_reports_lookup_failure_per_section(
+        self, mock_fmp: MagicMock, extractor: MagicMock, sec_api_key: str
+    ) -> None:
+        mock_fmp.return_value = "Error from FMP"
+
+        assert SECUtils.get_10k_sections("AAPL", "2024", [1, 7]) == {"1": "Error from FMP", "7": "Error from FMP"}
+        extractor.get_section.assert_not_called()
+
+    def test_batch_rejects_invalid_sections(self, sec_api_key: str) -> None:
+        with pytest.raises(ValueError):
+            SECUtils.get_10k_sections("AAPL", "2024", [1, "Invalid"])
+
+    def test_section_texts_are_evicted_least_recently_used(self) -> None:
+        cache = TenKSectionCache(maxsize=2)
+        for section in ("1", "1A", "7"):
+            cache.sections.set(("AAPL", "2024", section), section)
+
+        assert cache.sections.get(("AAPL", "2024", "1")) is None
+        assert cache.sections.get(("AAPL", "2024", "7")) == "7"
@@ -89,9 +89,11 @@ def test_get_competitors_analysis(mock_save, mock_fmp) -> None:  # type: ignore[
 @patch("finrobot.functional.analyzer.SECUtils")
 @patch("finrobot.functional.analyzer.save_to_file")
 def test_analyze_business_highlights(mock_save, mock_sec) -> None:  # type: ignore[no-untyped-def]
-    mock_sec.get_10k_section.side_effect = ["Business Summary", "Management Discussion"]
+    mock_sec.get_10k_sections.return_value = {"1": "Business Summary", "7": "Management Discussion"}
     ReportAnalysisUtils.analyze_business_highlights("AAPL", "2023", "save_highlights.txt")
-    mock_save.assert_called()
+    mock_sec.get_10k_sections.assert_called_once_with("AAPL", "2023", [1, 7])
+    assert "Business Summary" in mock_save.call_args[0][0]
+    assert "Management Discussion" in mock_save.call_args[0][0]
 
 
 @patch("finrobot.functional.analyzer.YFinanceUtils")
@@ -99,10 +101,11 @@ def test_analyze_business_highlights(mock_save, mock_sec) -> None:  # type: igno
 @patch("finrobot.functional.analyzer.save_to_file")
 def test_analyze_company_description(mock_save, mock_sec, mock_yf) -> None:  # type: ignore[no-untyped-def]
     mock_yf.get_stock_info.return_value = {"shortName": "Apple Inc."}
-    mock_sec.get_10k_section.side_effect = ["Business Summary", "Management Discussion"]
+    mock_sec.get_10k_sections.return_value = {"1": "Business Summary", "7": "Management Discussion"}
 
     ReportAnalysisUtils.analyze_company_description("AAPL", "2023", "save_desc.txt")
-    mock_save.assert_called()
+    mock_sec.get_10k_sections.assert_called_once_with("AAPL", "2023", [1, 7])
+    assert "Management Discussion" in mock_save.call_args[0][0]
 
 
 @patch("finrobot.functional.analyzer.YFinanceUtils")
@@ -0,0 +1,240 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Tuple
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+from finrobot.data_access.data_source.domains.market_data.yfinance_adapter import YFinanceAdapter
+from finrobot.infrastructure.cache import SingleFlight, get_single_flight, single_flight
+
+
+@contextmanager
+def all_joined(flight: SingleFlight, calls: int) -> Iterator[threading.Event]:
+    """Event set once ``calls`` calls have joined ``flight`` (led or waiting)."""
+    joined = threading.Event()
+    join = flight._join
+
+    def counting_join(key: Any, owner: int) -> Tuple[Any, bool]:
+        result = join(key, owner)
+        if flight.stats.calls >= calls:
+            joined.set()
+        return result
+
+    with patch.object(flight, "_join", side_effect=counting_join):
+        yield joined
+
+
+class TestSingleFlight:
+    def test_concurrent_calls_share_one_execution(self) -> None:
+        flight = SingleFlight()
+        release = threading.Event()
+        calls: List[int] = []
+
+        def fetch() -> str:
+            calls.append(1)
+            release.wait(timeout=5)
+            return "payload"
+
+        with all_joined(flight, 4) as joined, ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(flight.do, "key", fetch) for _ in range(4)]
+            assert joined.wait(timeout=5)
+            release.set()
+            results = [future.result(timeout=5) for future in futures]
+
+        assert results == ["payload"] * 4
+        assert len(calls) == 1
+        assert flight.stats.to_dict() == {"calls": 4, "executions": 1, "suppressed": 3}
+        assert flight.in_flight() == 0
+
+    def test_waiters_get_their_own_copy_of_mutable_results(self) -> None:
+        flight = SingleFlight()
+        release = threading.Event()
+
+        def fetch() -> Any:
+            release.wait(timeout=5)
+            return {"symbol": "AAPL", "peers": ["MSFT"]}
+
+        with all_joined(flight, 3) as joined, ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(flight.do, "key", fetch) for _ in range(3)]
+            assert joined.wait(timeout=5)
+            release.set()
+            results = [future.result(timeout=5) for future in futures]
+
+        results[0]["peers"].append("GOOG")
+        results[1]["symbol"] = "changed"
+        assert results[2] == {"symbol": "AAPL", "peers": ["MSFT"]}
+        assert len({id(result["peers"]) for result in results}) == 3
+
+    def test_uncopyable_results_are_shared(self) -> None:
+        flight = SingleFlight()
+        release = threading.Event()
+        lock = threading.Lock()
+
+        def fetch() -> Any:
+            release.wait(timeout=5)
+            return lock
+
+        with all_joined(flight, 2) as joined, ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(flight.do, "key", fetch) for _ in range(2)]
+            assert joined.wait(timeout=5)
+            release.set()
+            results = [future.result(timeout=5) for future in futures]
+
+        assert results == [lock, lock]
+
+    def test_sequential_calls_are_not_coalesced(self) -> None:
+        flight = SingleFlight()
+        fetch = MagicMock(return_value=1)
+        flight.do("key", fetch)
+        flight.do("key", fetch)
+        assert fetch.call_count == 2
+        assert flight.stats.suppressed == 0
+
+    def test_errors_propagate_to_waiters(self) -> None:
+        flight = SingleFlight()
+        release = threading.Event()
+
+        def fail() -> None:
+            release.wait(timeout=5)
+            raise ValueError("boom")
+
+        with all_joined(flight, 2) as joined, ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(flight.do, "key", fail) for _ in range(2)]
+            assert joined.wait(timeout=5)
+            release.set()
+            for future in futures:
+                with pytest.raises(ValueError):
+                    future.result(timeout=5)
+
+    def test_reentrant_call_does_not_deadlock(self) -> None:
+        flight = SingleFlight()
+        assert flight.do("key", lambda: flight.do("key", lambda: 1) + 1) == 2
+
+    def test_async_tasks_share_one_execution(self) -> None:
+        flight = SingleFlight()
+        calls: List[int] = []
+
+        async def fetch() -> pd.DataFrame:
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return pd.DataFrame({"a": [1]})
+
+        async def main() -> List[Any]:
+            return list(await asyncio.gather(*(flight.ado("key", fetch) for _ in range(3))))
+
+        results = asyncio.run(main())
+        assert len(calls) == 1
+        assert flight.stats.suppressed == 2
+        # waiters get their own copy
+        assert results[0] is not results[1]
+        assert results[1].equals(results[0])
+
+
+class TestSingleFlightDecorator:
+    def test_identical_arguments_coalesce(self) -> None:
+        release = threading.Event()
+        calls: List[str] = []
+
+        @single_flight("test")
+        def history(symbol: str, periods: List[int]) -> str:
+            calls.append(symbol)
+            release.wait(timeout=5)
+            return symbol
+
+        get_single_flight().reset_stats()
+        with all_joined(get_single_flight(), 3) as joined, ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(history, "^GSPC", [1, 2]),
+                executor.submit(history, "^GSPC", [1, 2]),
+                executor.submit(history, "AAPL", [1, 2]),
+            ]
+            assert joined.wait(timeout=5)
+            release.set()
+            assert [future.result(timeout=5) for future in futures] == ["^GSPC", "^GSPC", "AAPL"]
+
+        assert sorted(calls) == ["AAPL", "^GSPC"]
+        assert get_single_flight().stats.suppressed == 1
+
+    def test_unhashable_arguments_run_directly(self) -> None:
+        @single_flight("test")
+        def describe(frame: pd.DataFrame) -> int:
+            return len(frame)
+
+        get_single_flight().reset_stats()
+        assert describe(pd.DataFrame({"a": [1, 2]})) == 2
+        assert get_single_flight().stats.calls == 0
+
+    @patch("finrobot.data_access.data_source.domains.market_data.yfinance_adapter.yf.Ticker")
+    def test_data_source_methods_are_coalesced(self, mock_ticker_cls: MagicMock) -> None:
+        release = threading.Event()
+
+        def history(start: str, end: str) -> pd.DataFrame:
+            release.wait(timeout=5)
+            return pd.DataFrame({"Close": [1.0]})
+
+        mock_ticker_cls.return_value.history.side_effect = history
+        mock_ticker_cls.return_value.ticker = "^GSPC"
+        get_single_flight().reset_stats()
+        with all_joined(get_single_flight(), 2) as joined, ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(YFinanceAdapter.get_stock_data, "^GSPC", "2023-01-01", "2023-02-01") for _ in range(2)
+            ]
+            assert joined.wait(timeout=5)
+            release.set()
+            frames = [future.result(timeout=5) for future in futures]
+
+        assert mock_ticker_cls.return_value.history.call_count == 1
+        assert frames[0].equals(frames[1])
+
+    def test_calls_passing_an_unless_argument_run_on_their_own(self) -> None:
+        release = threading.Event()
+        calls: List[Any] = []
+
+        @single_flight("test", unless=("save_path",))
+        def export(symbol: str, save_path: Any = None) -> str:
+            calls.append(save_path)
+            release.wait(timeout=5)
+            return symbol
+
+        get_single_flight().reset_stats()
+        with all_joined(get_single_flight(), 2) as joined, ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(export, "AAPL") for _ in range(2)]
+            futures += [executor.submit(export, "AAPL", "a.csv"), executor.submit(export, "AAPL", save_path="a.csv")]
+            assert joined.wait(timeout=5)
+            release.set()
+            assert [future.result(timeout=5) for future in futures] == ["AAPL"] * 4
+
+        assert sorted(calls, key=str) == [None, "a.csv", "a.csv"]
+        assert get_single_flight().stats.to_dict() == {"calls": 2, "executions": 1, "suppressed": 1}
+
+    @patch.dict("os.environ", {"SEC_API_KEY": "key"})
+    @patch("finrobot.data_access.data_source.sec_utils.RenderApi")
+    @patch("finrobot.data_access.data_source.sec_utils.SECUtils.get_10k_metadata")
+    def test_downloads_are_never_coalesced(
+        self, mock_metadata: MagicMock, mock_render_cls: MagicMock, tmp_path: Any
+    ) -> None:
+        from finrobot.data_access.data_source.sec_utils import SECUtils
+
+        barrier = threading.Barrier(2, timeout=5)
+        mock_metadata.return_value = {
+            "ticker": "AAPL",
+            "linkToFilingDetails": "http://link/file.htm",
+            "filedAt": "2023-01-01",
+            "formType": "10-K",
+        }
+
+        def get_filing(url: str) -> str:
+            barrier.wait()  # both downloads are in flight at once
+            return "<html></html>"
+
+        mock_render_cls.return_value.get_filing.side_effect = get_filing
+        args = ("AAPL", "2023-01-01", "2023-12-31", str(tmp_path))
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(SECUtils.download_10k_filing, *args) for _ in range(2)]
+            results = [future.result(timeout=5) for future in futures]
+
+        assert all("download succeeded" in result for result in results)
+        assert mock_render_cls.return_value.get_filing.call_count == 2
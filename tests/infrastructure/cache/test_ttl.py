@@ -0,0 +1,65 @@
+from typing import List
+
+from finrobot.infrastructure.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    def test_entries_expire(self) -> None:
+        clock = FakeClock()
+        cache: TTLCache[str, int] = TTLCache(ttl=10, clock=clock)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        clock.now = 10.0
+        assert cache.get("a") is None
+        assert cache.stats.expirations == 1
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    def test_per_entry_ttl(self) -> None:
+        clock = FakeClock()
+        cache: TTLCache[str, int] = TTLCache(ttl=10, clock=clock)
+        cache.set("short", 1, ttl=1)
+        cache.set("long", 2)
+        clock.now = 5.0
+        assert "short" not in cache
+        assert "long" in cache
+        assert len(cache) == 1
+
+    def test_get_or_set_calls_factory_once(self) -> None:
+        cache: TTLCache[str, int] = TTLCache(ttl=60)
+        calls: List[int] = []
+
+        def factory() -> int:
+            calls.append(1)
+            return 42
+
+        assert cache.get_or_set("k", factory) == 42
+        assert cache.get_or_set("k", factory) == 42
+        assert len(calls) == 1
+
+    def test_maxsize_evicts_least_recently_used(self) -> None:
+        cache: TTLCache[str, int] = TTLCache(ttl=60, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert "a" in cache
+        assert "b" not in cache
+        assert cache.stats.evictions == 1
+
+    def test_invalidate_and_clear(self) -> None:
+        cache: TTLCache[str, int] = TTLCache(ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.invalidate("a")
+        assert cache.get("a", "missing") == "missing"
+        cache.clear()
+        assert len(cache) == 0
@@ -1,12 +1,14 @@
 """Tests for general utilities."""
 
+import asyncio
 import json
 import os
 from datetime import datetime
 
 import pandas as pd
+import pytest
 from finrobot.infrastructure.io.files import register_keys_from_json, save_output
-from finrobot.infrastructure.utils import get_current_date, get_next_weekday
+from finrobot.infrastructure.utils import get_current_date, get_next_weekday, run_sync
 
 
 def test_save_output(tmp_path) -> None:  # type: ignore[no-untyped-def]
@@ -50,3 +52,44 @@ def test_get_next_weekday() -> None:
     next_day = get_next_weekday(d2)
     assert next_day.weekday() == 0
     assert next_day == datetime(2025, 1, 20)
+
+
+async def _double(value: int) -> int:
+    await asyncio.sleep(0)
+    return value * 2
+
+
+def test_run_sync() -> None:
+    """Test running a coroutine from sync code, with and without a running loop."""
+    assert run_sync(_double(2)) == 4
+
+    async def caller() -> int:
+        return int(run_sync(_double(3)))
+
+    assert asyncio.run(caller()) == 6
+
+
+def test_run_sync_reuses_one_background_loop() -> None:
+    """Sync calls made from async code share one background loop instead of one thread each."""
+
+    async def loop_id() -> int:
+        return id(asyncio.get_running_loop())
+
+    async def caller() -> tuple[int, int, int]:
+        return id(asyncio.get_running_loop()), int(run_sync(loop_id())), int(run_sync(loop_id()))
+
+    own, first, second = asyncio.run(caller())
+    assert first == second != own
+
+
+def test_run_sync_refuses_to_wait_on_its_own_loop() -> None:
+    """A coroutine already on the background loop cannot block on it."""
+
+    async def nested() -> int:
+        return int(run_sync(_double(1)))
+
+    async def caller() -> int:
+        return int(run_sync(nested()))
+
+    with pytest.raises(RuntimeError, match="await the coroutine"):
+        asyncio.run(caller())
@@ -4,7 +4,7 @@ from unittest.mock import mock_open, patch
 
 import pandas as pd
 import pytest
-from finrobot.infrastructure.io.files import register_keys_from_json, save_output
+from finrobot.infrastructure.io.files import atomic_write, dump_json, register_keys_from_json, save_output
 
 
 class TestFiles:
@@ -42,3 +42,29 @@ class TestFiles:
 
         register_keys_from_json(str(config_path))
         assert os.environ["API_KEY"] == "12345"
+
+
+class TestAtomicWrite:
+    def test_replaces_the_file_in_one_step(self, tmp_path) -> None:  # type: ignore[no-untyped-def]
+        path = str(tmp_path / "data.json")
+        atomic_write(path, lambda tmp: dump_json({"a": 1}, tmp))
+        atomic_write(path, lambda tmp: dump_json({"a": 2}, tmp))
+
+        with open(path) as f:
+            assert json.load(f) == {"a": 2}
+        assert os.listdir(tmp_path) == ["data.json"]
+
+    def test_failed_write_keeps_the_previous_file(self, tmp_path) -> None:  # type: ignore[no-untyped-def]
+        path = str(tmp_path / "data.json")
+        atomic_write(path, lambda tmp: dump_json({"a": 1}, tmp))
+
+        def broken(tmp: str) -> None:
+            with open(tmp, "w") as f:
+                f.write("{")
+            raise OSError("disk full")
+
+        with pytest.raises(OSError):
+            atomic_write(path, broken)
+        with open(path) as f:
+            assert json.load(f) == {"a": 1}
+        assert os.listdir(tmp_path) == ["data.json"]